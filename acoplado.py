@@ -0,0 +1,140 @@
+# acoplado.py
+# Solução autoconsistente — PT-BR
+# Fecha o laço potência ↔ temperatura ↔ RPM ↔ R_total:
+# - a ventoinha segue uma curva temperatura → RPM (configurável), como no BIOS;
+# - o leakage cresce com a temperatura do die;
+# - a temperatura é a raiz de T = amb + P(T)·R(RPM(T)) + hotspot.
+# Newton com derivada analítica, em lote, com máscara de convergência por cenário.
+
+import numpy as np
+
+from desempenho import counted
+from motor import THROTTLE_TEMP, cpu_power_model_batch, cooling_batch
+
+# ---------------------------
+# PARÂMETROS
+# ---------------------------
+# curva padrão da ventoinha: (temperatura °C, RPM); fora da faixa o RPM fica no extremo
+FAN_CURVE = ((30.0, 600.0), (50.0, 900.0), (70.0, 1600.0), (85.0, 2200.0))
+LEAK_TEMP_COEF = 0.02       # leakage ∝ exp(coef·(T - T_ref)) — dobra a cada ~35 °C
+LEAK_T_REF = 60.0           # temperatura em que o leakage vale o do modelo original (°C)
+RPM_REF = 1500.0            # mesma referência de r_total
+T_DIVERGENCIA = 200.0       # acima disso, sem limite de potência e com g' >= 1, é fuga térmica
+PASSO_MAX = 20.0            # limita o passo de Newton (°C)
+# motivo de cada cenário ao sair do laço
+CONVERGIU, FUGA_TERMICA, LIMITE_ITERACOES = "convergiu", "fuga_termica", "limite_iteracoes"
+
+# ---------------------------
+# FUNÇÕES
+# ---------------------------
+def parse_fan_curve(texto):
+    """Converte "30:600, 50:900, ..." em ((30.0, 600.0), (50.0, 900.0), ...), ordenado por temperatura."""
+    pontos = []
+    for item in texto.split(","):
+        if item.strip():
+            t, rpm = item.split(":")
+            pontos.append((float(t), float(rpm)))
+    if len(pontos) < 2:
+        raise ValueError("A curva da ventoinha precisa de pelo menos 2 pontos (temperatura:RPM).")
+    return tuple(sorted(pontos))
+
+def fan_curve_batch(temp, curva=FAN_CURVE):
+    """RPM e dRPM/dT para cada temperatura (interpolação linear por partes)."""
+    ts = np.array([p[0] for p in curva], dtype=float)
+    rs = np.array([p[1] for p in curva], dtype=float)
+    rpm = np.interp(temp, ts, rs)
+    inclin = np.diff(rs) / np.maximum(np.diff(ts), 1e-9)
+    seg = np.searchsorted(ts, temp, side="right") - 1
+    dentro = (seg >= 0) & (seg < len(inclin))
+    return rpm, np.where(dentro, inclin[np.clip(seg, 0, len(inclin) - 1)], 0.0)
+
+def _residuo(T, e, curva):
+    """g(T) = amb + P(T)·R(T) + hotspot e sua derivada g'(T), para os cenários e (dicionário de arrays 1-D)."""
+    fator_leak = np.exp(LEAK_TEMP_COEF * (T - LEAK_T_REF))
+    leak = e["leak_ref"] * fator_leak
+    bruta = e["sem_leak"] + leak
+    limitada = bruta >= e["limite"]
+    P = np.where(limitada, e["limite"], np.maximum(0.0, bruta))
+    dP = np.where(limitada | (bruta <= 0), 0.0, LEAK_TEMP_COEF * leak)
+
+    rpm, drpm = fan_curve_batch(T, curva)
+    rpm = np.maximum(rpm, 1.0)
+    r_hs = e["r_hs_eff"] * (RPM_REF / rpm) ** 0.8
+    R = e["r_cs"] + r_hs
+    dR = -0.8 * r_hs / rpm * drpm
+
+    g = e["amb"] + P * R + e["hotspot"]
+    return g, dP * R + P * dR, P, rpm, R
+
+@counted
+def solve_coupled(cpu_cols, cooler_cols, carga_pct, profile, freq_scale, amb, vent_factor,
+                  permitir_pl2=True, curva=FAN_CURVE, tol=0.01, max_iter=50):
+    """
+    Resolve potência, RPM, R_total e temperatura juntos, para todos os cenários de uma vez.
+    - argumentos como em motor.steady_state_batch (fazem broadcast entre si);
+    - ventilação ruim aumenta R_hs efetivo (R_hs / vent_factor), em vez de reduzir a capacidade;
+    - cada cenário sai do lote ativo assim que |ΔT| < tol; o laço termina quando não sobra nenhum.
+    - retorna arrays com o shape do broadcast: temp_steady, potencia_aplicada, rpm, r_total,
+      util_pct, throttle, iteracoes, convergiu e motivo (CONVERGIU; FUGA_TERMICA = acima de
+      T_DIVERGENCIA com a potência livre e g' >= 1, sem raiz limitada; LIMITE_ITERACOES = max_iter
+      atingido sem convergir nem divergir).
+    """
+    leak_ref = 0.02 * cpu_cols["tdp"] * (1 + 0.15 * (freq_scale - 1.0))
+    entradas = np.broadcast_arrays(
+        cpu_power_model_batch(cpu_cols["tdp"], carga_pct, profile, freq_scale) - leak_ref,
+        leak_ref,
+        cpu_cols["pl2"] if permitir_pl2 else cpu_cols["pl1"],
+        cpu_cols["r_cs"],
+        cooler_cols["r_hs"] / vent_factor,
+        amb,
+        cpu_cols["hotspot"],
+    )
+    shape = entradas[0].shape
+    nomes = ("sem_leak", "leak_ref", "limite", "r_cs", "r_hs_eff", "amb", "hotspot")
+    e = {k: np.array(v, dtype=float).ravel() for k, v in zip(nomes, entradas)}
+    n = e["amb"].size
+
+    # chute inicial: uma passada com a ventoinha no RPM de referência
+    T = e["amb"] + (e["sem_leak"] + e["leak_ref"]).clip(0, e["limite"]) * (e["r_cs"] + e["r_hs_eff"]) + e["hotspot"]
+    iteracoes = np.zeros(n, dtype=np.int32)
+    convergiu = np.zeros(n, dtype=bool)
+    motivo = np.full(n, LIMITE_ITERACOES, dtype=object)
+    ativos = np.arange(n)
+    for _ in range(max_iter):
+        if ativos.size == 0:
+            break
+        sub = {k: v[ativos] for k, v in e.items()}
+        Ta = T[ativos]
+        g, dg, P, _, _ = _residuo(Ta, sub, curva)
+        f, df = g - Ta, dg - 1.0
+        # Newton enquanto o ponto é estável (g' < 1); senão, iteração de ponto fixo
+        passo = np.where(df < -1e-6, -f / np.where(df < -1e-6, df, -1.0), f)
+        passo = np.clip(passo, -PASSO_MAX, PASSO_MAX)
+        T[ativos] = Ta + passo
+        iteracoes[ativos] += 1
+
+        ok = np.abs(passo) < tol
+        # fuga só quando não há raiz limitada adiante: potência livre (sem PL1/PL2 segurando) e
+        # g(T) > T crescendo pelo menos tão rápido quanto T; com a potência presa no limite,
+        # g é limitado e a raiz existe, mesmo acima de T_DIVERGENCIA — a iteração continua
+        fuga = ~np.isfinite(T[ativos]) | ((Ta > T_DIVERGENCIA) & (P < sub["limite"]) & (dg >= 1.0) & (f > 0))
+        convergiu[ativos[ok & ~fuga]] = True
+        motivo[ativos[ok & ~fuga]] = CONVERGIU
+        motivo[ativos[fuga]] = FUGA_TERMICA
+        ativos = ativos[~(ok | fuga)]
+
+    _, _, P, rpm, R = _residuo(T, e, curva)
+    # utilização da capacidade (apenas informativa; o RPM aqui vem da curva de temperatura)
+    _, util_pct, _ = cooling_batch(P.reshape(shape), cooler_cols, vent_factor)
+    temp = T.reshape(shape)
+    return {
+        "temp_steady": temp,
+        "potencia_aplicada": P.reshape(shape),
+        "rpm": rpm.reshape(shape),
+        "r_total": R.reshape(shape),
+        "util_pct": np.broadcast_to(util_pct, shape),
+        "throttle": temp >= THROTTLE_TEMP,
+        "iteracoes": iteracoes.reshape(shape),
+        "convergiu": convergiu.reshape(shape),
+        "motivo": motivo.reshape(shape),
+    }
@@ -0,0 +1,307 @@
+# benchmark.py
+# Benchmarks do modelo térmico e da camada de interface — PT-BR
+# Uso:
+#   python benchmark.py                      # roda tudo e compara com a baseline salva
+#   python benchmark.py --salvar-baseline    # grava os resultados atuais como baseline
+#   python benchmark.py -k lote --rapido     # só os casos cujo nome contém "lote", menos repetições
+#
+# Cada caso executa uma unidade de trabalho (uma chamada escalar em laço, uma
+# passada vetorizada, um gráfico...) várias vezes e reporta cenários/s, latência
+# por execução (p50/p95/p99) e pico de memória (tracemalloc, numa execução extra
+# para não distorcer os tempos). A baseline guarda também uma impressão digital
+# do modelo e do catálogo: numa regressão dá para saber se o código/dados mudaram.
+# Saída com código 1 se algum caso ficar mais lento (ou usar mais memória) que a
+# tolerância permite.
+
+import argparse
+import glob
+import hashlib
+import json
+import os
+import platform
+import sys
+import time
+import tracemalloc
+
+import numpy as np
+
+import motor
+import catalogo
+from motor import (
+    WORKLOAD_PROFILES, VENT_FACTORS,
+    cpu_power_model, fan_rpm, r_total, derive_rth_heatsink, simulate, summary_record,
+    cpu_arrays, steady_state_batch, compatibility_matrix,
+)
+from catalogo import CPUS, COOLERS
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+BASELINE_PADRAO = os.path.join(RAIZ, "benchmark_baseline.json")
+TOLERANCIA = 0.25           # +25% no p50 (ou no pico de memória) = regressão
+ESCALAS_SINTETICAS = (10, 100, 1000)
+SEMENTE = 1234
+
+# nome → função de preparo; o preparo devolve (executar, cenarios_por_execucao)
+CASOS = {}
+
+def caso(nome):
+    def registrar(preparo):
+        CASOS[nome] = preparo
+        return preparo
+    return registrar
+
+# ---------------------------
+# CASOS: caminho escalar
+# ---------------------------
+def _cenarios(n, rng):
+    cpus = [CPUS[i] for i in rng.integers(0, len(CPUS), n)]
+    coolers = [COOLERS[i] for i in rng.integers(0, len(COOLERS), n)]
+    params = [{
+        "carga_pct": int(rng.integers(10, 151)),
+        "perfil": list(WORKLOAD_PROFILES)[rng.integers(0, len(WORKLOAD_PROFILES))],
+        "freq_ghz": float(rng.uniform(2.0, 6.0)),
+        "amb": float(rng.uniform(15.0, 40.0)),
+        "vent": list(VENT_FACTORS)[rng.integers(0, len(VENT_FACTORS))],
+        "permitir_pl2": bool(rng.integers(0, 2)),
+    } for _ in range(n)]
+    return cpus, coolers, params
+
+@caso("escalar.cpu_power_model")
+def _escalar_potencia(rng):
+    args = [(float(t), float(c), float(p), float(f)) for t, c, p, f in zip(
+        rng.choice([65, 95, 125, 250], 1000), rng.uniform(10, 150, 1000), rng.uniform(0.3, 1.1, 1000), rng.uniform(0.8, 1.6, 1000))]
+    return (lambda: [cpu_power_model(*a) for a in args]), len(args)
+
+@caso("escalar.fan_rpm")
+def _escalar_rpm(rng):
+    utils = rng.uniform(0, 120, 1000).tolist()
+    return (lambda: [fan_rpm(u) for u in utils]), len(utils)
+
+@caso("escalar.r_total")
+def _escalar_r_total(rng):
+    cpus, coolers, _ = _cenarios(1000, rng)
+    rpms = rng.integers(600, 2201, 1000).tolist()
+    return (lambda: [r_total(c, k, r) for c, k, r in zip(cpus, coolers, rpms)]), len(rpms)
+
+@caso("escalar.derive_rth_heatsink")
+def _escalar_rth(rng):
+    # sem o R_hs pré-calculado do catálogo, para medir a classificação pelo nome
+    coolers = [{k: v for k, v in c.items() if k != "r_hs"} for c in _cenarios(1000, rng)[1]]
+    return (lambda: [derive_rth_heatsink(c) for c in coolers]), len(coolers)
+
+@caso("escalar.simular")
+def _escalar_simular(rng):
+    cpus, coolers, params = _cenarios(200, rng)
+    return (lambda: [summary_record(c, simulate(c, k, p)) for c, k, p in zip(cpus, coolers, params)]), len(params)
+
+# ---------------------------
+# CASOS: caminho vetorizado
+# ---------------------------
+@caso("lote.catalogo_completo")
+def _lote_catalogo(rng):
+    ambientes = (20.0, 25.0, 30.0)
+    n = len(CPUS) * len(COOLERS) * len(WORKLOAD_PROFILES) * len(ambientes) * len(VENT_FACTORS)
+    return (lambda: compatibility_matrix(CPUS, COOLERS, ambientes=ambientes)), n
+
+def _sintetico(escala):
+    # catálogo de CPUs `escala` vezes maior (cópias com variação de TDP) contra todos os coolers
+    def preparo(rng):
+        base = CPUS.arrays()
+        reps = np.repeat(np.arange(len(CPUS)), escala)
+        cpu_cols = {k: v[reps][:, None] for k, v in base.items()}
+        cpu_cols["tdp"] = cpu_cols["tdp"] * rng.uniform(0.8, 1.2, cpu_cols["tdp"].shape)
+        cooler_cols = {k: v[None, :] for k, v in COOLERS.arrays().items()}
+        n = len(reps) * len(COOLERS)
+        return (lambda: steady_state_batch(cpu_cols, cooler_cols, 100.0, 1.0, 1.1, 25.0, 1.0)), n
+    return preparo
+
+for _escala in ESCALAS_SINTETICAS:
+    caso(f"lote.sintetico_{_escala}x")(_sintetico(_escala))
+
+@caso("lote.carga_catalogo_100x")
+def _lote_carga(rng):
+    registros = [dict(c, modelo=f"{c['modelo']} #{i}") for i in range(100) for c in CPUS.registros]
+    return (lambda: catalogo.Catalog(registros, cpu_arrays(registros), catalogo.CPU_INDICES)), len(registros)
+
+@caso("lote.cli_bloco")
+def _lote_cli(rng):
+    import pandas as pd
+    from lote import evaluate_chunk
+    cpus, coolers, params = _cenarios(20_000, rng)
+    df = pd.DataFrame([dict(p, cpu=c["modelo"], cooler=k["modelo"]) for c, k, p in zip(cpus, coolers, params)])
+    return (lambda: evaluate_chunk(df)), len(df)
+
+# ---------------------------
+# CASOS: gráficos e tabelas da interface
+# ---------------------------
+@caso("ui.tabela_resumo")
+def _ui_tabela(rng):
+    import pandas as pd
+    cpus, coolers, params = _cenarios(1, rng)
+    res = simulate(cpus[0], coolers[0], params[0])
+    return (lambda: pd.DataFrame([summary_record(cpus[0], res)])), 1
+
+@caso("ui.grafico_curva")
+def _ui_curva(rng):
+    from graficos import temp_power_png, temp_power_curve
+    def executar():
+        temp_power_curve.cache_clear()
+        return temp_power_png(125, 150.0, 80.0, 0.3, 25.0, 0.0)
+    return executar, 1
+
+@caso("ui.grafico_barras")
+def _ui_barras(rng):
+    from graficos import power_capacity_png
+    return (lambda: power_capacity_png(150.0, 170.0)), 1
+
+@caso("ui.mapa_calor_catalogo")
+def _ui_mapa(rng):
+    from graficos import heatmap_png
+    m = compatibility_matrix(CPUS, COOLERS, perfis={"Bench sustentado (Cinebench)": WORKLOAD_PROFILES["Bench sustentado (Cinebench)"]},
+                             ventilacoes={"Bem ventilado": VENT_FACTORS["Bem ventilado"]})
+    valores = m["temp_steady"][:, :, 0, 0, 0]
+    return (lambda: heatmap_png(valores, m["eixos"]["cpu"], m["eixos"]["cooler"])), valores.size
+
+@caso("ui.simular_apptest")
+def _ui_apptest(rng):
+    # rerun completo do app + clique em "Simular" (sem cache), via streamlit.testing:
+    # a cada repetição o st.cache_data e as superfícies do processo são esvaziados e o
+    # cache em disco é trocado por um desligado (o .cache/ do usuário fica intocado)
+    import logging
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+    import cache_disco
+    from superficies import shared_cache
+    script = os.path.join(RAIZ, "simulador_refrigeracao.py")
+    for nome in ("streamlit", "streamlit.runtime.caching.cache_data_api", "streamlit.runtime.scriptrunner_utils.script_run_context"):
+        logging.getLogger(nome).setLevel(logging.ERROR)      # avisos de "modo bare" a cada rerun
+
+    def executar():
+        st.cache_data.clear()
+        shared_cache().clear()
+        anterior, cache_disco._padrao = cache_disco._padrao, cache_disco.DiskCache(limite_mb=0)
+        try:
+            at = AppTest.from_file(script, default_timeout=120).run()
+            next(b for b in at.button if b.label == "Simular").click().run()
+        finally:
+            cache_disco._padrao = anterior
+        if at.exception:
+            raise RuntimeError(at.exception)
+    return executar, 1
+
+# ---------------------------
+# EXECUÇÃO E RELATÓRIO
+# ---------------------------
+def fingerprint():
+    """Hash do código do modelo e dos dados do catálogo (muda quando o modelo ou o catálogo muda)."""
+    h = hashlib.sha256()
+    arquivos = [motor.__file__, catalogo.__file__] + sorted(glob.glob(os.path.join(catalogo.DADOS_DIR, "*")))
+    for caminho in arquivos:
+        with open(caminho, "rb") as f:
+            h.update(os.path.basename(caminho).encode() + b"\0" + f.read())
+    return h.hexdigest()[:16]
+
+def run_case(nome, repeticoes, min_segundos=0.2):
+    """Executa um caso: aquecimento, `repeticoes` medições (mais, se forem muito rápidas) e uma com tracemalloc."""
+    executar, cenarios = CASOS[nome](np.random.default_rng(SEMENTE))
+    executar()
+    tempos = []
+    inicio = time.perf_counter()
+    while len(tempos) < repeticoes or (time.perf_counter() - inicio < min_segundos and len(tempos) < 50 * repeticoes):
+        t0 = time.perf_counter()
+        executar()
+        tempos.append(time.perf_counter() - t0)
+    tracemalloc.start()
+    executar()
+    pico = tracemalloc.get_traced_memory()[1]
+    tracemalloc.stop()
+    t = np.array(tempos)
+    p50, p95, p99 = np.percentile(t, [50, 95, 99])
+    return {
+        "cenarios": cenarios,
+        "repeticoes": len(tempos),
+        "cenarios_s": cenarios / p50,
+        "p50_ms": p50 * 1e3,
+        "p95_ms": p95 * 1e3,
+        "p99_ms": p99 * 1e3,
+        "pico_mb": pico / 1e6,
+    }
+
+def compare(resultados, baseline, tolerancia=TOLERANCIA):
+    """Marca em cada resultado a variação contra a baseline e se é regressão (tempo ou memória)."""
+    casos_base = baseline.get("casos", {}) if baseline else {}
+    for nome, r in resultados.items():
+        b = casos_base.get(nome)
+        if b is None:
+            r["delta_p50_pct"], r["regressao"] = None, False
+            continue
+        r["delta_p50_pct"] = (r["p50_ms"] / b["p50_ms"] - 1.0) * 100.0
+        r["regressao"] = (r["p50_ms"] > b["p50_ms"] * (1.0 + tolerancia)
+                          or r["pico_mb"] > max(b["pico_mb"] * (1.0 + tolerancia), b["pico_mb"] + 1.0))
+    return resultados
+
+def report(resultados, baseline=None, arquivo=sys.stdout):
+    print(f"{'caso':34s} {'cenários/s':>13s} {'p50 ms':>10s} {'p95 ms':>10s} {'p99 ms':>10s} {'pico MB':>9s} {'Δ p50':>8s}",
+          file=arquivo)
+    for nome, r in resultados.items():
+        delta = "" if r.get("delta_p50_pct") is None else f"{r['delta_p50_pct']:+.0f}%"
+        marca = "  << REGRESSÃO" if r.get("regressao") else ""
+        print(f"{nome:34s} {r['cenarios_s']:13,.0f} {r['p50_ms']:10.3f} {r['p95_ms']:10.3f} {r['p99_ms']:10.3f} "
+              f"{r['pico_mb']:9.2f} {delta:>8s}{marca}", file=arquivo)
+    if baseline and baseline.get("fingerprint") != fingerprint():
+        print("\nObs.: modelo/catálogo mudaram desde a baseline "
+              f"({baseline.get('fingerprint')} → {fingerprint()}).", file=arquivo)
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(description="Benchmarks do modelo térmico, do motor vetorizado e da interface.")
+    ap.add_argument("-k", "--filtro", default="", help="roda só os casos cujo nome contém o texto")
+    ap.add_argument("--repeticoes", type=int, default=20)
+    ap.add_argument("--rapido", action="store_true", help="5 repetições e sem o caso 1000x nem o AppTest")
+    ap.add_argument("--baseline", default=BASELINE_PADRAO, help="arquivo de baseline (JSON)")
+    ap.add_argument("--salvar-baseline", action="store_true", help="grava os resultados como nova baseline")
+    ap.add_argument("--tolerancia", type=float, default=TOLERANCIA, help="fração tolerada antes de acusar regressão")
+    ap.add_argument("--json", help="grava os resultados (com metadados) neste arquivo")
+    args = ap.parse_args(argv)
+
+    nomes = [n for n in CASOS if args.filtro in n]
+    repeticoes = args.repeticoes
+    if args.rapido:
+        repeticoes = min(repeticoes, 5)
+        nomes = [n for n in nomes if n not in ("lote.sintetico_1000x", "ui.simular_apptest")]
+
+    resultados = {}
+    for nome in nomes:
+        try:
+            resultados[nome] = run_case(nome, repeticoes)
+        except ImportError as exc:
+            print(f"{nome}: ignorado ({exc})", file=sys.stderr)
+
+    baseline = None
+    if os.path.exists(args.baseline) and not args.salvar_baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            baseline = json.load(f)
+    compare(resultados, baseline, args.tolerancia)
+    report(resultados, baseline)
+
+    documento = {
+        "fingerprint": fingerprint(),
+        "data": time.strftime("%Y-%m-%dT%H:%M:%S"),
+        "python": platform.python_version(),
+        "numpy": np.__version__,
+        "maquina": f"{platform.system()} {platform.machine()} ({os.cpu_count()} núcleos)",
+        "casos": resultados,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=2, ensure_ascii=False)
+    if args.salvar_baseline:
+        if args.filtro and os.path.exists(args.baseline):
+            # com filtro, atualiza só os casos rodados e mantém os demais
+            with open(args.baseline, encoding="utf-8") as f:
+                documento["casos"] = dict(json.load(f).get("casos", {}), **resultados)
+        with open(args.baseline, "w", encoding="utf-8") as f:
+            json.dump(documento, f, indent=2, ensure_ascii=False)
+        print(f"\nBaseline gravada em {args.baseline}")
+    return 1 if any(r.get("regressao") for r in resultados.values()) else 0
+
+if __name__ == "__main__":
+    sys.exit(main())
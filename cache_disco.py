@@ -0,0 +1,298 @@
+# cache_disco.py
+# Cache persistente em disco (SQLite) — PT-BR
+# Memoização entre sessões e reinícios do servidor para resultados de simulação e
+# gráficos já renderizados. A chave é o hash das entradas quantizadas (CPU, cooler,
+# perfil, carga, frequência, ambiente, ventilação, PL2) mais a versão do modelo
+# (hash do código e do catálogo): quando as fórmulas mudam, as entradas antigas
+# deixam de ser encontradas. Elas não são apagadas de imediato (outro processo ainda
+# no código anterior pode estar usando): saem pelo LRU, ou quando ficam mais de
+# IDADE_VERSAO_ANTIGA_S sem acesso.
+# - despejo LRU limitado pelo tamanho total dos valores gravados;
+# - estatísticas de acertos / faltas / gravações / despejos por namespace, no próprio banco;
+# - várias sessões Streamlit (threads) e vários processos: uma conexão por thread,
+#   modo WAL, busy_timeout e escritas em BEGIN IMMEDIATE;
+# - leituras são um SELECT simples (sem lock de escrita); o horário de acesso e os
+#   contadores ficam em memória e vão para o banco junto com a próxima gravação, a
+#   cada PENDENTES_MAX consultas ou em stats();
+# - qualquer erro do SQLite vira uma falta e o valor é recalculado: o cache nunca
+#   derruba a simulação.
+
+import atexit
+import glob
+import hashlib
+import json
+import os
+import pickle
+import sqlite3
+import threading
+import time
+from functools import lru_cache
+
+RAIZ = os.path.dirname(os.path.abspath(__file__))
+CAMINHO_PADRAO = os.environ.get("SIMULADOR_CACHE", os.path.join(RAIZ, ".cache", "resultados.sqlite"))
+LIMITE_PADRAO_MB = float(os.environ.get("SIMULADOR_CACHE_MB", 256))    # 0 desliga o cache
+TIMEOUT_S = 10.0
+PENDENTES_MAX = 64                  # consultas acumuladas antes de gravar acessos e contadores
+IDADE_VERSAO_ANTIGA_S = 7 * 86400   # entradas de outra versão sem acesso há mais que isso são apagadas
+# passo de quantização das entradas numéricas (o mesmo passo, ou mais fino, que os controles da UI)
+QUANTIZACAO = {"carga_pct": 1.0, "freq_ghz": 0.01, "amb": 0.1}
+# arquivos que definem o modelo: qualquer mudança neles gera outra versão
+ARQUIVOS_MODELO = tuple(
+    [os.path.join(RAIZ, "motor.py"), os.path.join(RAIZ, "catalogo.py")]
+    + sorted(glob.glob(os.path.join(RAIZ, "dados", "*")))
+)
+CONTADORES = ("acertos", "faltas", "gravacoes", "despejos")
+
+_ESQUEMA = """
+CREATE TABLE IF NOT EXISTS entradas (
+    chave TEXT PRIMARY KEY,
+    namespace TEXT NOT NULL,
+    versao TEXT NOT NULL,
+    valor BLOB NOT NULL,
+    tamanho INTEGER NOT NULL,
+    acesso REAL NOT NULL
+);
+CREATE INDEX IF NOT EXISTS entradas_acesso ON entradas(acesso);
+CREATE TABLE IF NOT EXISTS estatisticas (
+    namespace TEXT PRIMARY KEY,
+    acertos INTEGER NOT NULL DEFAULT 0,
+    faltas INTEGER NOT NULL DEFAULT 0,
+    gravacoes INTEGER NOT NULL DEFAULT 0,
+    despejos INTEGER NOT NULL DEFAULT 0
+);
+"""
+
+# ---------------------------
+# CHAVES
+# ---------------------------
+@lru_cache(maxsize=64)
+def _hash_arquivos(assinatura):
+    h = hashlib.sha256()
+    for caminho, _, _ in assinatura:
+        with open(caminho, "rb") as f:
+            h.update(os.path.basename(caminho).encode() + b"\0" + f.read())
+    return h.hexdigest()[:16]
+
+def model_version(*arquivos):
+    """
+    Hash curto do conteúdo de `arquivos` (por padrão, ARQUIVOS_MODELO).
+    Só relê os arquivos quando data de modificação ou tamanho mudam (o Streamlit recarrega
+    os módulos editados com o servidor no ar, e a versão acompanha).
+    """
+    assinatura = []
+    for caminho in arquivos or ARQUIVOS_MODELO:
+        info = os.stat(caminho)
+        assinatura.append((caminho, info.st_mtime_ns, info.st_size))
+    return _hash_arquivos(tuple(assinatura))
+
+def quantize_params(params):
+    """Cópia de `params` com as entradas numéricas arredondadas ao passo de QUANTIZACAO."""
+    saida = dict(params)
+    for k, passo in QUANTIZACAO.items():
+        if saida.get(k) is not None:
+            saida[k] = round(round(float(saida[k]) / passo) * passo, 10)
+    return saida
+
+def make_key(namespace, versao, entradas):
+    texto = json.dumps([namespace, versao, entradas], sort_keys=True, ensure_ascii=False, default=str)
+    return hashlib.sha256(texto.encode("utf-8")).hexdigest()
+
+# ---------------------------
+# CACHE
+# ---------------------------
+class DiskCache:
+    """
+    Memoização em SQLite com LRU por tamanho.
+    - get_or_compute(namespace, versao, entradas, calcular): valor em cache ou calcular() (e grava);
+    - stats(): contadores por namespace, número de entradas e bytes ocupados;
+    - limite_mb <= 0 desliga o cache (tudo é calculado, nada é gravado).
+    """
+
+    def __init__(self, caminho=CAMINHO_PADRAO, limite_mb=LIMITE_PADRAO_MB):
+        self.caminho = caminho
+        self.limite_bytes = int(limite_mb * 1e6)
+        self.ativo = self.limite_bytes > 0
+        self.erros = 0
+        self._local = threading.local()
+        self._limpos = set()
+        self._trava = threading.Lock()
+        # pendentes de gravação: chave → último acesso; (namespace, contador) → incremento
+        self._acessos = {}
+        self._contagens = {}
+        self._consultas = 0
+
+    # conexões --------------------------------------------------------------
+    def _conexao(self):
+        con = getattr(self._local, "con", None)
+        if con is None or self._local.pid != os.getpid():
+            os.makedirs(os.path.dirname(os.path.abspath(self.caminho)), exist_ok=True)
+            con = sqlite3.connect(self.caminho, timeout=TIMEOUT_S, isolation_level=None)
+            con.execute("PRAGMA journal_mode=WAL")
+            con.execute("PRAGMA synchronous=NORMAL")
+            con.executescript(_ESQUEMA)
+            self._local.con, self._local.pid = con, os.getpid()
+        return con
+
+    def _transacao(self, fn):
+        # BEGIN IMMEDIATE: o lock de escrita é pego no início, então duas sessões não
+        # ficam presas tentando promover uma leitura a escrita (o busy_timeout resolve a fila)
+        con = self._conexao()
+        con.execute("BEGIN IMMEDIATE")
+        try:
+            resultado = fn(con)
+        except BaseException:
+            con.execute("ROLLBACK")
+            raise
+        con.execute("COMMIT")
+        return resultado
+
+    def _falhou(self):
+        self.erros += 1
+        self._local.con = None
+
+    # operações -------------------------------------------------------------
+    def _contar(self, con, namespace, campo, n=1):
+        con.execute("INSERT OR IGNORE INTO estatisticas (namespace) VALUES (?)", (namespace,))
+        con.execute(f"UPDATE estatisticas SET {campo} = {campo} + ? WHERE namespace = ?", (n, namespace))
+
+    def _remover_versoes_antigas(self, con, namespace, versao):
+        # só entradas de outra versão esquecidas há muito tempo: um processo ainda na versão
+        # anterior continua atualizando o acesso das suas e não as perde
+        with self._trava:
+            if (namespace, versao) in self._limpos:
+                return
+            self._limpos.add((namespace, versao))
+        con.execute("DELETE FROM entradas WHERE namespace = ? AND versao != ? AND acesso < ?",
+                    (namespace, versao, time.time() - IDADE_VERSAO_ANTIGA_S))
+
+    def _anotar(self, namespace, campo, chave=None):
+        # registra uma consulta em memória; devolve True quando já é hora de gravar
+        with self._trava:
+            if chave is not None:
+                self._acessos[chave] = time.time()
+            self._contagens[namespace, campo] = self._contagens.get((namespace, campo), 0) + 1
+            self._consultas += 1
+            return self._consultas >= PENDENTES_MAX
+
+    def _gravar_pendentes(self, con):
+        # dentro de uma transação: acessos e contadores acumulados desde a última gravação
+        with self._trava:
+            acessos, self._acessos = self._acessos, {}
+            contagens, self._contagens = self._contagens, {}
+            self._consultas = 0
+        con.executemany("UPDATE entradas SET acesso = MAX(acesso, ?) WHERE chave = ?",
+                        [(t, c) for c, t in acessos.items()])
+        for (ns, campo), n in contagens.items():
+            self._contar(con, ns, campo, n)
+
+    def flush(self):
+        """Grava os acessos e contadores pendentes (feito também em put(), stats() e a cada PENDENTES_MAX consultas)."""
+        if not self.ativo or not (self._acessos or self._contagens):
+            return
+        try:
+            self._transacao(self._gravar_pendentes)
+        except sqlite3.Error:
+            self._falhou()
+
+    def get(self, namespace, versao, entradas):
+        """(True, valor) se houver entrada para a chave, senão (False, None); conta acerto/falta."""
+        if not self.ativo:
+            return False, None
+        chave = make_key(namespace, versao, entradas)
+        try:
+            linha = self._conexao().execute("SELECT valor FROM entradas WHERE chave = ?", (chave,)).fetchone()
+            valor = None if linha is None else pickle.loads(linha[0])
+        except (sqlite3.Error, OSError, pickle.UnpicklingError):
+            self._falhou()
+            return False, None
+        if self._anotar(namespace, "faltas" if linha is None else "acertos", None if linha is None else chave):
+            self.flush()
+        return (False, None) if linha is None else (True, valor)
+
+    def put(self, namespace, versao, entradas, valor):
+        """Grava `valor` e despeja as entradas menos usadas até caber no limite."""
+        if not self.ativo:
+            return
+        dados = pickle.dumps(valor, protocol=pickle.HIGHEST_PROTOCOL)
+        if len(dados) > self.limite_bytes:
+            return
+        chave = make_key(namespace, versao, entradas)
+
+        def gravar(con):
+            self._gravar_pendentes(con)
+            self._remover_versoes_antigas(con, namespace, versao)
+            con.execute(
+                "INSERT OR REPLACE INTO entradas (chave, namespace, versao, valor, tamanho, acesso) VALUES (?, ?, ?, ?, ?, ?)",
+                (chave, namespace, versao, dados, len(dados), time.time()),
+            )
+            self._contar(con, namespace, "gravacoes")
+            excesso = con.execute("SELECT COALESCE(SUM(tamanho), 0) FROM entradas").fetchone()[0] - self.limite_bytes
+            if excesso <= 0:
+                return
+            despejar = []
+            for c, ns, tam in con.execute("SELECT chave, namespace, tamanho FROM entradas ORDER BY acesso"):
+                despejar.append((c, ns))
+                excesso -= tam
+                if excesso <= 0:
+                    break
+            con.executemany("DELETE FROM entradas WHERE chave = ?", [(c,) for c, _ in despejar])
+            for ns in {ns for _, ns in despejar}:
+                self._contar(con, ns, "despejos", sum(1 for _, n in despejar if n == ns))
+
+        try:
+            self._transacao(gravar)
+        except (sqlite3.Error, OSError):
+            self._falhou()
+
+    def get_or_compute(self, namespace, versao, entradas, calcular):
+        achou, valor = self.get(namespace, versao, entradas)
+        if not achou:
+            valor = calcular()
+            self.put(namespace, versao, entradas, valor)
+        return valor
+
+    def stats(self):
+        """Contadores por namespace (com taxa de acerto), total de entradas, bytes e limite."""
+        saida = {"namespaces": {}, "entradas": 0, "bytes": 0, "limite_bytes": self.limite_bytes, "erros": self.erros}
+        if not self.ativo:
+            return saida
+        self.flush()
+        try:
+            con = self._conexao()
+            for linha in con.execute(f"SELECT namespace, {', '.join(CONTADORES)} FROM estatisticas ORDER BY namespace"):
+                c = dict(zip(CONTADORES, linha[1:]))
+                consultas = c["acertos"] + c["faltas"]
+                c["taxa_acerto_pct"] = round(100.0 * c["acertos"] / consultas, 1) if consultas else 0.0
+                saida["namespaces"][linha[0]] = c
+            for ns, n, tam in con.execute("SELECT namespace, COUNT(*), SUM(tamanho) FROM entradas GROUP BY namespace"):
+                saida["namespaces"].setdefault(ns, dict.fromkeys(CONTADORES, 0))
+                saida["namespaces"][ns].update(entradas=n, bytes=tam)
+                saida["entradas"] += n
+                saida["bytes"] += tam
+        except sqlite3.Error:
+            self._falhou()
+        return saida
+
+    def clear(self):
+        """Apaga entradas e estatísticas."""
+        if not self.ativo:
+            return
+        with self._trava:
+            self._acessos, self._contagens, self._consultas = {}, {}, 0
+        try:
+            self._transacao(lambda con: (con.execute("DELETE FROM entradas"), con.execute("DELETE FROM estatisticas")))
+            self._conexao().execute("VACUUM")
+        except sqlite3.Error:
+            self._falhou()
+
+_padrao = None
+_padrao_trava = threading.Lock()
+
+def default_cache():
+    """Instância compartilhada pelo processo (caminho e limite vindos do ambiente)."""
+    global _padrao
+    with _padrao_trava:
+        if _padrao is None:
+            _padrao = DiskCache()
+            atexit.register(_padrao.flush)
+        return _padrao
@@ -0,0 +1,143 @@
+# catalogo.py
+# Catálogo de hardware — PT-BR
+# CPUs e coolers carregados de arquivos (CSV, JSON, JSON Lines ou Parquet) para
+# uma tabela colunar. As colunas usadas pelo modelo (PL1/PL2/TAU, R_cs, R_hs,
+# tdp_nominal, ...) são calculadas uma única vez no carregamento, e os campos de
+# filtro (arquitetura, socket, fabricante, tipo de cooler) ganham índices
+# valor → posições, de modo que nenhuma consulta precisa varrer strings.
+
+import csv
+import json
+import os
+
+import numpy as np
+
+from motor import cpu_arrays, cooler_arrays, cpu_r_cs, derive_rth_heatsink
+
+DADOS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "dados")
+
+# esquema: campo → conversão aplicada ao ler (campos vazios ficam de fora e usam o padrão do modelo)
+CPU_CAMPOS = {
+    "modelo": str, "tdp": int, "ano": int, "socket": str,
+    "frequencia_base": float, "frequencia_turbo": float,
+    "arquitetura": str, "fabricante": str,
+}
+COOLER_CAMPOS = {
+    "modelo": str, "tipo": str, "tdp_manufacturer": int,
+    "ruido_db": int, "durabilidade_anos": int,
+}
+CPU_INDICES = ("arquitetura", "socket", "fabricante")
+COOLER_INDICES = ("tipo",)
+
+# ---------------------------
+# LEITURA
+# ---------------------------
+def _tipar(registro, campos):
+    saida = {}
+    for k, v in registro.items():
+        if v is None or v == "" or (isinstance(v, float) and np.isnan(v)):
+            continue
+        saida[k] = campos[k](v) if k in campos else v
+    return saida
+
+def read_records(path, campos):
+    """Lê registros de .csv, .json (lista), .jsonl/.ndjson ou .parquet (requer pandas + pyarrow)."""
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".csv":
+        with open(path, newline="", encoding="utf-8") as f:
+            registros = list(csv.DictReader(f))
+    elif ext == ".json":
+        with open(path, encoding="utf-8") as f:
+            registros = json.load(f)
+    elif ext in (".jsonl", ".ndjson"):
+        with open(path, encoding="utf-8") as f:
+            registros = [json.loads(linha) for linha in f if linha.strip()]
+    elif ext == ".parquet":
+        import pandas as pd
+        registros = pd.read_parquet(path).to_dict("records")
+    else:
+        raise ValueError(f"Formato de catálogo não suportado: {ext} (use .csv, .json, .jsonl ou .parquet)")
+    return [_tipar(r, campos) for r in registros]
+
+# ---------------------------
+# TABELA COLUNAR
+# ---------------------------
+class Catalog:
+    """
+    Catálogo colunar (struct-of-arrays).
+    - registros: lista de dicionários, compatível com simulate() e com as funções escalares;
+    - colunas: arrays NumPy dos campos lidos e das colunas derivadas do modelo (somente leitura);
+    - indices: campo → {valor: posições}; posicao: modelo → posição (consultas O(1)).
+    """
+
+    def __init__(self, registros, colunas_modelo, campos_indice):
+        self.registros = registros
+        self._modelo = colunas_modelo
+        self.colunas = dict(colunas_modelo)
+        for campo in {k for r in registros for k in r}:
+            if campo not in self.colunas:
+                self.colunas[campo] = np.array([r.get(campo) for r in registros], dtype=object)
+        self.posicao = {r["modelo"]: i for i, r in enumerate(registros)}
+        self.indices = {}
+        for campo in campos_indice:
+            grupos = {}
+            for i, r in enumerate(registros):
+                grupos.setdefault(r.get(campo), []).append(i)
+            self.indices[campo] = {v: np.array(ix, dtype=np.intp) for v, ix in grupos.items()}
+        # compartilhados com quem chama arrays()/where(): ninguém altera o catálogo sem querer
+        for col in list(self.colunas.values()) + [ix for grupos in self.indices.values() for ix in grupos.values()]:
+            col.flags.writeable = False
+
+    def __len__(self):
+        return len(self.registros)
+
+    def __iter__(self):
+        return iter(self.registros)
+
+    def __getitem__(self, i):
+        return self.registros[i]
+
+    def get(self, modelo, default=None):
+        i = self.posicao.get(modelo)
+        return default if i is None else self.registros[i]
+
+    def where(self, campo, valor):
+        """Posições com campo == valor (array vazio se não houver)."""
+        return self.indices[campo].get(valor, np.empty(0, dtype=np.intp))
+
+    def valores(self, campo):
+        """Valores distintos de um campo indexado, em ordem."""
+        return sorted(v for v in self.indices[campo] if v is not None)
+
+    def modelos(self, posicoes=None):
+        col = self.colunas["modelo"]
+        return (col if posicoes is None else col[posicoes]).tolist()
+
+    def arrays(self, posicoes=None):
+        """Colunas do modelo (mesmas chaves de motor.cpu_arrays / cooler_arrays); sem `posicoes`, as do catálogo, somente leitura."""
+        if posicoes is None:
+            return dict(self._modelo)
+        return {k: v[posicoes] for k, v in self._modelo.items()}
+
+    def subset(self, posicoes):
+        """Novo catálogo só com as posições dadas (índices refeitos)."""
+        return Catalog([self.registros[i] for i in posicoes], self.arrays(posicoes), tuple(self.indices))
+
+def load_cpus(path=None):
+    registros = read_records(path or os.path.join(DADOS_DIR, "cpus.csv"), CPU_CAMPOS)
+    # R_cs fica no registro: simulate() e r_total() não refazem a classificação a cada chamada
+    for c in registros:
+        c["r_cs"] = cpu_r_cs(c)
+    return Catalog(registros, cpu_arrays(registros), CPU_INDICES)
+
+def load_coolers(path=None):
+    registros = read_records(path or os.path.join(DADOS_DIR, "coolers.csv"), COOLER_CAMPOS)
+    # ajuste prático do nominal do cooler (eficiência prática)
+    for c in registros:
+        c["tdp_nominal"] = round(0.85 * c.get("tdp_manufacturer", 0.0), 1)
+        c["r_hs"] = derive_rth_heatsink(c)
+    return Catalog(registros, cooler_arrays(registros), COOLER_INDICES)
+
+# catálogo padrão (dados/)
+CPUS = load_cpus()
+COOLERS = load_coolers()
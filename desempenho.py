@@ -0,0 +1,206 @@
+# desempenho.py
+# Instrumentação de desempenho — PT-BR
+# - span("nome"): mede uma etapa (aninhável) do rerun atual;
+# - contadores de chamadas das funções do modelo (motor, transiente, acoplado, ...);
+# - captura opcional de cProfile e tracemalloc durante o rerun;
+# - exportação em JSON Lines para agregação offline.
+# As funções contadas recebem o decorador @counted uma vez, na importação do módulo
+# (nada é trocado depois). Desligado (nenhum Collector ativo no processo), o contador
+# só lê uma flag do módulo e span() devolve um contexto nulo compartilhado, então o
+# custo desligado é praticamente zero. Ligado, cada thread conta só no seu Collector:
+# outras sessões passam pelo mesmo contador sem registrar nada. Se o rerun for
+# interrompido antes do stop() (st.stop(), RerunException, erro), o Collector é
+# encerrado quando a thread do script termina ou no próximo start() da mesma thread.
+
+import contextlib
+import cProfile
+import functools
+import io
+import json
+import pstats
+import threading
+import time
+import tracemalloc
+from collections import Counter
+
+TOP_PERFIL = 25         # linhas do relatório do cProfile
+TOP_MEMORIA = 10        # linhas de maior alocação no tracemalloc
+
+_local = threading.local()
+_NULO = contextlib.nullcontext()
+
+# ---------------------------
+# COLETOR (um por rerun medido)
+# ---------------------------
+class Collector:
+    """
+    Spans, contadores e capturas de um rerun.
+    - spans: lista de {"nome", "nivel", "inicio_ms", "duracao_ms"} (início relativo ao Collector);
+    - contadores: Counter nome da função → chamadas;
+    - perfil / memoria: texto do cProfile e pico + maiores alocações do tracemalloc (se pedidos).
+    """
+
+    def __init__(self, rotulo="", perfil=False, memoria=False):
+        self.rotulo = rotulo
+        self.ts = time.time()
+        self.spans = []
+        self.contadores = Counter()
+        self.perfil = None
+        self.memoria = None
+        self._pedir_perfil = perfil
+        self._pedir_memoria = memoria
+        self._nivel = 0
+        self._t0 = time.perf_counter()
+        self._profiler = None
+        self._tracemalloc_proprio = False
+        self._raiz = None
+
+    @contextlib.contextmanager
+    def span(self, nome):
+        registro = {"nome": nome, "nivel": self._nivel, "inicio_ms": (time.perf_counter() - self._t0) * 1e3}
+        self.spans.append(registro)
+        self._nivel += 1
+        t0 = time.perf_counter()
+        try:
+            yield registro
+        finally:
+            registro["duracao_ms"] = (time.perf_counter() - t0) * 1e3
+            self._nivel -= 1
+
+    def total_ms(self):
+        return sum(s.get("duracao_ms", 0.0) for s in self.spans if s["nivel"] == 0)
+
+    def records(self):
+        """Linhas para JSON Lines: um registro por span e por contador, todos com o rótulo e o horário do rerun."""
+        base = {"rerun": self.rotulo, "ts": round(self.ts, 3)}
+        linhas = [dict(base, tipo="span", **s) for s in self.spans]
+        linhas += [dict(base, tipo="contador", nome=n, chamadas=c) for n, c in sorted(self.contadores.items())]
+        if self.memoria:
+            linhas.append(dict(base, tipo="memoria", pico_mb=self.memoria["pico_mb"]))
+        return linhas
+
+def to_jsonl(coletores):
+    return "".join(json.dumps(r, ensure_ascii=False) + "\n" for c in coletores for r in c.records())
+
+def append_jsonl(caminho, coletores):
+    with open(caminho, "a", encoding="utf-8") as f:
+        f.write(to_jsonl(coletores))
+
+# ---------------------------
+# API USADA NO CÓDIGO INSTRUMENTADO
+# ---------------------------
+def current():
+    return getattr(_local, "coletor", None)
+
+def span(nome):
+    """Contexto que mede a etapa `nome` no rerun medido desta thread (contexto nulo se não houver)."""
+    coletor = getattr(_local, "coletor", None)
+    return _NULO if coletor is None else coletor.span(nome)
+
+class _Escopo:
+    # guardado no thread-local junto com o Collector: se a thread terminar sem stop(),
+    # o thread-local é descartado e __del__ desliga os contadores e o tracemalloc
+    def __init__(self, coletor):
+        self.coletor = coletor
+        self.ativo = True
+
+    def encerrar(self):
+        if not self.ativo:
+            return
+        self.ativo = False
+        if self.coletor._tracemalloc_proprio and tracemalloc.is_tracing():
+            tracemalloc.stop()
+        _ligar(-1)
+
+    def __del__(self):
+        self.encerrar()
+
+def start(coletor, nome="rerun"):
+    """
+    Ativa `coletor` nesta thread: abre o span raiz `nome`, liga os contadores e as capturas pedidas.
+    Vários reruns medidos ao mesmo tempo (outras sessões) contam cada um no seu Collector.
+    """
+    if current() is not None:       # rerun anterior interrompido antes do stop()
+        stop()
+    _local.coletor = coletor
+    _ligar(1)
+    _local.escopo = _Escopo(coletor)
+    if coletor._pedir_perfil:
+        coletor._profiler = cProfile.Profile()
+        try:
+            coletor._profiler.enable()
+        except ValueError:          # outro profiler já ativo no processo
+            coletor._profiler = None
+            coletor.perfil = "cProfile indisponível: outro profiler já está ativo."
+    if coletor._pedir_memoria:
+        coletor._tracemalloc_proprio = not tracemalloc.is_tracing()
+        if coletor._tracemalloc_proprio:
+            tracemalloc.start()
+        else:
+            tracemalloc.reset_peak()
+    coletor._raiz = coletor.span(nome)
+    coletor._raiz.__enter__()
+    return coletor
+
+def stop():
+    """Fecha o rerun medido desta thread (spans, capturas e contadores) e devolve o Collector."""
+    coletor = current()
+    if coletor is None:
+        return None
+    try:
+        coletor._raiz.__exit__(None, None, None)
+        if coletor._profiler is not None:
+            coletor._profiler.disable()
+            saida = io.StringIO()
+            pstats.Stats(coletor._profiler, stream=saida).sort_stats("cumulative").print_stats(TOP_PERFIL)
+            coletor.perfil = saida.getvalue()
+            coletor._profiler = None
+        if coletor._pedir_memoria:
+            maiores = tracemalloc.take_snapshot().statistics("lineno")[:TOP_MEMORIA]
+            coletor.memoria = {
+                "pico_mb": tracemalloc.get_traced_memory()[1] / 1e6,
+                "maiores": [(str(s.traceback), s.size / 1e3, s.count) for s in maiores],
+            }
+            if coletor._tracemalloc_proprio:
+                tracemalloc.stop()
+    finally:
+        _local.escopo.ativo = False
+        _local.escopo = None
+        _ligar(-1)
+        _local.coletor = None
+    return coletor
+
+@contextlib.contextmanager
+def measure(coletor, nome="rerun"):
+    """start()/stop() como bloco with."""
+    start(coletor, nome)
+    try:
+        yield coletor
+    finally:
+        stop()
+
+# ---------------------------
+# CONTADORES (decorador nas funções do modelo)
+# ---------------------------
+_trava = threading.RLock()       # reentrante: _Escopo.__del__ pode rodar durante um _ligar()
+_ativos = 0                      # Collectors ativos no processo (todas as threads)
+_ligado = False
+
+def _ligar(delta):
+    global _ativos, _ligado
+    with _trava:
+        _ativos += delta
+        _ligado = _ativos > 0
+
+def counted(fn):
+    """Decorador: conta as chamadas de `fn` no Collector da thread que chama (se houver)."""
+    nome = fn.__name__
+
+    @functools.wraps(fn)
+    def contado(*args, **kwargs):
+        if _ligado:
+            coletor = getattr(_local, "coletor", None)
+            if coletor is not None:
+                coletor.contadores[nome] += 1
+        return fn(*args, **kwargs)
+    return contado
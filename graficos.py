@@ -0,0 +1,159 @@
+# graficos.py
+# Camada de gráficos — PT-BR
+# As figuras são criadas com matplotlib.figure.Figure, sem pyplot: nada fica
+# registrado no gerenciador global de figuras, então cada figura é liberada assim
+# que vira PNG (um servidor Streamlit de longa duração não acumula figuras).
+# As funções *_png devolvem bytes e recebem só valores simples, para que a camada
+# de interface possa cachear a imagem pelas entradas da simulação.
+# O backend "nativo" gera especificações Altair (gráficos do próprio navegador),
+# mais leves para varreduras grandes como a matriz CPU × cooler completa.
+
+import io
+from functools import lru_cache
+
+import numpy as np
+
+BACKENDS = ("matplotlib", "nativo")
+PONTOS_CURVA = 40
+DPI = 100
+
+# ---------------------------
+# DADOS DOS GRÁFICOS
+# ---------------------------
+@lru_cache(maxsize=256)
+def temp_power_curve(tdp_ref, potencia_aplicada, r_total, amb, hotspot_c=0.0):
+    """Curva temperatura × potência (PONTOS_CURVA pontos); só é recalculada quando as entradas mudam."""
+    pvals = np.linspace(0.2 * tdp_ref, max(tdp_ref * 1.6, potencia_aplicada * 1.2), PONTOS_CURVA)
+    temps = amb + pvals * r_total + hotspot_c
+    # arrays compartilhados pelo cache: somente leitura
+    pvals.flags.writeable = False
+    temps.flags.writeable = False
+    return pvals, temps
+
+# ---------------------------
+# MATPLOTLIB (PNG)
+# ---------------------------
+def _figura(largura, altura):
+    from matplotlib.figure import Figure
+    fig = Figure(figsize=(largura, altura), dpi=DPI)
+    return fig, fig.subplots()
+
+def _png(fig):
+    buf = io.BytesIO()
+    fig.savefig(buf, format="png", bbox_inches="tight")
+    return buf.getvalue()
+
+def temp_power_png(tdp_ref, potencia_aplicada, temp_steady, r_total, amb, hotspot_c=0.0):
+    pvals, temps = temp_power_curve(tdp_ref, potencia_aplicada, r_total, amb, hotspot_c)
+    fig, ax = _figura(6, 3)
+    ax.plot(pvals, temps, linewidth=2)
+    ax.scatter([potencia_aplicada], [temp_steady], color='red', zorder=6)
+    ax.set_xlabel("Potência (W)")
+    ax.set_ylabel("Temperatura estimada (°C)")
+    ax.grid(alpha=0.4, ls='--')
+    return _png(fig)
+
+def power_capacity_png(potencia_aplicada, cap_eff):
+    fig, ax = _figura(5, 3)
+    ax.bar(["Power(W)", "Cap.Efetiva(W)"], [potencia_aplicada, cap_eff])
+    for i, v in enumerate([potencia_aplicada, cap_eff]):
+        ax.text(i, v + max(1, 0.02 * v), f"{v:.1f}", ha='center')
+    ax.set_ylim(0, max(cap_eff, potencia_aplicada) * 1.3 if max(cap_eff, potencia_aplicada) > 0 else 1)
+    return _png(fig)
+
+def transient_png(t, temp, potencia, limite):
+    fig, ax = _figura(10, 3)
+    ax.plot(t, temp, linewidth=2, label="Temperatura (°C)")
+    ax.axhline(limite, color='red', ls='--', alpha=0.6)
+    ax.set_xlabel("Tempo (s)")
+    ax.set_ylabel("Temperatura estimada (°C)")
+    ax.grid(alpha=0.4, ls='--')
+    ax_p = ax.twinx()
+    ax_p.plot(t, potencia, color='tab:orange', alpha=0.7, label="Potência (W)")
+    ax_p.set_ylabel("Potência aplicada (W)")
+    # uma legenda só, com as séries dos dois eixos
+    linhas, rotulos = ax.get_legend_handles_labels()
+    linhas_p, rotulos_p = ax_p.get_legend_handles_labels()
+    ax.legend(linhas + linhas_p, rotulos + rotulos_p, loc="lower right")
+    return _png(fig)
+
+def histogram_png(bordas, pct, limite):
+    fig, ax = _figura(10, 3)
+    ax.stairs(pct, bordas, fill=True, alpha=0.7)
+    ax.axvline(limite, color='red', ls='--', alpha=0.6)
+    ax.set_xlabel("Temperatura steady (°C)")
+    ax.set_ylabel("Amostras (%)")
+    ax.grid(alpha=0.4, ls='--')
+    return _png(fig)
+
+def heatmap_png(valores, linhas, colunas, rotulo="Temperatura steady (°C)"):
+    """Mapa de calor de uma matriz 2D (linhas × colunas), ex.: CPU × cooler."""
+    valores = np.asarray(valores, dtype=float)
+    fig, ax = _figura(max(6, 0.22 * len(colunas) + 3), max(4, 0.2 * len(linhas) + 1.5))
+    im = ax.imshow(valores, aspect="auto", cmap="inferno", interpolation="nearest")
+    ax.set_xticks(np.arange(len(colunas)), colunas, rotation=90, fontsize=6)
+    ax.set_yticks(np.arange(len(linhas)), linhas, fontsize=6)
+    fig.colorbar(im, ax=ax, label=rotulo)
+    return _png(fig)
+
+def tornado_png(rotulos, temp_baixo, temp_alto, temp_base, rotulos_baixo=None, rotulos_alto=None):
+    """Gráfico tornado: uma barra por entrada, de T(baixo) a T(alto), em torno da temperatura base."""
+    n = len(rotulos)
+    y = np.arange(n)[::-1]
+    baixo, alto = np.asarray(temp_baixo, dtype=float), np.asarray(temp_alto, dtype=float)
+    fig, ax = _figura(10, max(2.5, 0.5 * n + 1))
+    ax.barh(y, baixo - temp_base, left=temp_base, color='tab:blue', alpha=0.8, label="valor baixo / opção mais fria")
+    ax.barh(y, alto - temp_base, left=temp_base, color='tab:red', alpha=0.8, label="valor alto / opção mais quente")
+    for i in range(n):
+        for t, texto in ((baixo[i], rotulos_baixo), (alto[i], rotulos_alto)):
+            if texto is not None:
+                ax.text(t, y[i], f" {texto[i]} ", va='center', fontsize=7,
+                        ha='left' if t >= temp_base else 'right')
+    ax.axvline(temp_base, color='black', lw=1)
+    ax.set_yticks(y, rotulos)
+    ax.set_xlabel("Temperatura steady (°C)")
+    ax.grid(alpha=0.4, ls='--', axis='x')
+    ax.legend(loc='lower right', fontsize=7)
+    ax.margins(x=0.25)
+    return _png(fig)
+
+def contour_png(x, y, valores, limite, ponto=None, rotulo_x="Frequência (GHz)", rotulo_y="Carga (% TDP)",
+                rotulo="Temperatura steady (°C)"):
+    """Contorno preenchido de valores[i, j] sobre x[i] × y[j], com a curva do limite e o ponto atual."""
+    valores = np.asarray(valores, dtype=float).T
+    fig, ax = _figura(10, 4)
+    cs = ax.contourf(x, y, valores, levels=20, cmap="inferno")
+    if valores.min() < limite < valores.max():
+        ax.contour(x, y, valores, levels=[limite], colors='cyan', linewidths=1.5, linestyles='--')
+    if ponto is not None:
+        ax.scatter([ponto[0]], [ponto[1]], color='cyan', edgecolor='black', s=60, zorder=6)
+    ax.set_xlabel(rotulo_x)
+    ax.set_ylabel(rotulo_y)
+    fig.colorbar(cs, ax=ax, label=rotulo)
+    return _png(fig)
+
+# ---------------------------
+# NATIVO (Altair)
+# ---------------------------
+def heatmap_chart(tabela, x="cooler", y="cpu", valor="temp_steady_C"):
+    """Mapa de calor Altair a partir de uma tabela longa (uma linha por célula)."""
+    import altair as alt
+    return alt.Chart(tabela).mark_rect().encode(
+        x=alt.X(f"{x}:N", sort=None, title=x),
+        y=alt.Y(f"{y}:N", sort=None, title=y),
+        color=alt.Color(f"{valor}:Q", scale=alt.Scale(scheme="inferno")),
+        tooltip=[x, y, valor],
+    )
+
+def tornado_chart(tabela, temp_base, entrada="entrada", baixo="temp_baixo", alto="temp_alto"):
+    """Gráfico tornado Altair a partir de uma tabela com uma linha por entrada (já ordenada)."""
+    import altair as alt
+    ordem = list(tabela[entrada])
+    barras = alt.Chart(tabela).transform_fold([baixo, alto], as_=["lado", "temp"]).mark_bar().encode(
+        y=alt.Y(f"{entrada}:N", sort=ordem, title=None),
+        x=alt.X("temp:Q", title="Temperatura steady (°C)", scale=alt.Scale(zero=False)),
+        x2=alt.datum(temp_base),
+        color=alt.Color("lado:N", title=None),
+        tooltip=list(tabela.columns),
+    )
+    return barras + alt.Chart().mark_rule(color="black").encode(x=alt.datum(temp_base))
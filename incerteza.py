@@ -0,0 +1,182 @@
+# incerteza.py
+# Modo Monte Carlo — PT-BR
+# As constantes heurísticas do modelo (derating 0.85 do cooler, BASE_SAFETY_PCT,
+# ventilação, R_cs/R_hs, offset de hotspot AMD, ambiente) viram distribuições.
+# As amostras são geradas e avaliadas em blocos de tamanho fixo, e só estatísticas
+# acumuláveis (histograma, somas, contagens) são guardadas: a memória não cresce
+# com o número de amostras. Os blocos podem ser distribuídos num pool de processos.
+
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+
+from desempenho import counted
+from motor import (
+    THROTTLE_TEMP, HOTSPOT_AMD_C,
+    cpu_arrays, cooler_arrays, steady_state_batch, batch_args,
+)
+
+# ---------------------------
+# DISTRIBUIÇÕES PADRÃO
+# ---------------------------
+# nome → (tipo, parâmetros...). Tipos: ("fixo", v), ("normal", média, desvio),
+# ("uniforme", min, max), ("triangular", min, moda, max).
+# Multiplicadores (*_mult) aplicam-se ao valor do modelo; amb_delta soma-se ao ambiente.
+DISTRIBUICOES = {
+    "derating": ("triangular", 0.78, 0.85, 0.92),          # fração prática do TDP do fabricante
+    "safety_pct": ("uniforme", 0.05, 0.15),                 # margem de segurança (BASE_SAFETY_PCT)
+    "vent_mult": ("normal", 1.0, 0.03),                     # sobre o fator da condição do gabinete
+    "r_cs_mult": ("normal", 1.0, 0.10),
+    "r_hs_mult": ("normal", 1.0, 0.15),
+    "hotspot_c": ("normal", HOTSPOT_AMD_C, 2.0),           # só para AMD
+    "amb_delta": ("normal", 0.0, 1.5),
+}
+TAMANHO_BLOCO = 100_000
+# histograma fixo da temperatura: quantis com erro <= largura da faixa
+HIST_MIN, HIST_MAX, HIST_FAIXA = -20.0, 250.0, 0.05
+PERCENTIS = (1, 5, 25, 50, 75, 95, 99)
+
+# ---------------------------
+# ESTATÍSTICAS EM FLUXO
+# ---------------------------
+class StreamingStats:
+    """Histograma + momentos acumulados; update() por bloco e merge() entre processos."""
+
+    def __init__(self, limiar=THROTTLE_TEMP):
+        self.limiar = limiar
+        self.bordas = np.arange(HIST_MIN, HIST_MAX + HIST_FAIXA / 2, HIST_FAIXA)
+        self.contagens = np.zeros(self.bordas.size + 1, dtype=np.int64)   # +1: faixa de estouro
+        self.n = 0
+        self.media = 0.0
+        self.m2 = 0.0
+        self.acima = 0
+        self.minimo = np.inf
+        self.maximo = -np.inf
+
+    def update(self, x):
+        x = np.asarray(x, dtype=float).ravel()
+        if x.size == 0:
+            return self
+        pos = np.clip(np.searchsorted(self.bordas, x, side="right"), 0, self.bordas.size)
+        self.contagens += np.bincount(pos, minlength=self.contagens.size)
+        outro = StreamingStats(self.limiar)
+        outro.n, outro.media, outro.m2 = x.size, float(x.mean()), float(((x - x.mean()) ** 2).sum())
+        outro.acima = int((x >= self.limiar).sum())
+        outro.minimo, outro.maximo = float(x.min()), float(x.max())
+        outro.contagens = None
+        return self._somar(outro)
+
+    def merge(self, outro):
+        self.contagens += outro.contagens
+        return self._somar(outro)
+
+    def _somar(self, outro):
+        # combinação de médias/variâncias de Chan et al. (estável para blocos grandes)
+        n = self.n + outro.n
+        delta = outro.media - self.media
+        self.m2 += outro.m2 + delta ** 2 * self.n * outro.n / n
+        self.media += delta * outro.n / n
+        self.n = n
+        self.acima += outro.acima
+        self.minimo = min(self.minimo, outro.minimo)
+        self.maximo = max(self.maximo, outro.maximo)
+        return self
+
+    @property
+    def desvio(self):
+        return float(np.sqrt(self.m2 / (self.n - 1))) if self.n > 1 else 0.0
+
+    @property
+    def prob_acima(self):
+        return self.acima / self.n if self.n else float("nan")
+
+    def quantile(self, q):
+        """Quantil q (0–1) interpolado dentro da faixa do histograma."""
+        alvo = q * self.n
+        acum = np.cumsum(self.contagens)
+        i = int(np.searchsorted(acum, alvo, side="left"))
+        if i == 0:
+            return self.minimo
+        if i >= self.bordas.size:
+            return self.maximo
+        antes = acum[i - 1]
+        frac = (alvo - antes) / max(self.contagens[i], 1)
+        v = self.bordas[i - 1] + frac * HIST_FAIXA
+        return float(min(max(v, self.minimo), self.maximo))
+
+# ---------------------------
+# AMOSTRAGEM
+# ---------------------------
+def _amostrar(rng, dist, n):
+    tipo = dist[0]
+    if tipo == "fixo":
+        return np.full(n, float(dist[1]))
+    if tipo == "normal":
+        return rng.normal(dist[1], dist[2], n)
+    if tipo == "uniforme":
+        return rng.uniform(dist[1], dist[2], n)
+    if tipo == "triangular":
+        return rng.triangular(dist[1], dist[2], dist[3], n)
+    raise ValueError(f"Distribuição desconhecida: {tipo} (use fixo, normal, uniforme ou triangular)")
+
+def sample_temperatures(cpu, cooler, params, n, rng, distribuicoes=None):
+    """Temperaturas steady de n amostras (um bloco) para o par CPU/cooler."""
+    dist = dict(DISTRIBUICOES, **(distribuicoes or {}))
+    s = {k: _amostrar(rng, d, n) for k, d in dist.items()}
+    a = batch_args(cpu, params)
+
+    cpu_cols = dict(cpu_arrays([cpu]))
+    cpu_cols["r_cs"] = cpu_cols["r_cs"] * np.maximum(s["r_cs_mult"], 0.05)
+    cpu_cols["hotspot"] = np.where(cpu_cols["hotspot"] > 0, s["hotspot_c"], 0.0)
+    cooler_cols = dict(cooler_arrays([cooler]))
+    cooler_cols["nominal"] = cooler.get("tdp_manufacturer", 0.0) * np.clip(s["derating"], 0.05, 1.0)
+    cooler_cols["r_hs"] = cooler_cols["r_hs"] * np.maximum(s["r_hs_mult"], 0.05)
+
+    res = steady_state_batch(cpu_cols, cooler_cols, a["carga_pct"], a["profile"], a["freq_scale"],
+                             a["amb"] + s["amb_delta"], a["vent_factor"] * np.maximum(s["vent_mult"], 0.05),
+                             a["permitir_pl2"], safety_pct=np.clip(s["safety_pct"], 0.0, 0.95))
+    return res["temp_steady"]
+
+def _rodar_blocos(cpu, cooler, params, tamanhos, sementes, distribuicoes, limiar):
+    stats = StreamingStats(limiar)
+    for n, semente in zip(tamanhos, sementes):
+        stats.update(sample_temperatures(cpu, cooler, params, n, np.random.default_rng(semente), distribuicoes))
+    return stats
+
+@counted
+def monte_carlo(cpu, cooler, params=None, n_amostras=1_000_000, distribuicoes=None, semente=None,
+                tamanho_bloco=TAMANHO_BLOCO, processos=1, limiar=THROTTLE_TEMP):
+    """
+    Monte Carlo da temperatura steady de um par CPU/cooler.
+    - cada bloco tem sua própria semente (SeedSequence.spawn), então o resultado é o mesmo
+      com 1 ou N processos;
+    - processos > 1 distribui os blocos num ProcessPoolExecutor (None = todos os núcleos).
+    - retorna {"n", "media", "desvio", "min", "max", "percentis", "prob_throttle", "stats"}.
+    """
+    n_blocos = max(1, -(-int(n_amostras) // tamanho_bloco))
+    tamanhos = [tamanho_bloco] * (n_blocos - 1) + [int(n_amostras) - tamanho_bloco * (n_blocos - 1)]
+    sementes = np.random.SeedSequence(semente).spawn(n_blocos)
+
+    processos = os.cpu_count() if processos is None else processos
+    if processos <= 1 or n_blocos == 1:
+        stats = _rodar_blocos(cpu, cooler, params, tamanhos, sementes, distribuicoes, limiar)
+    else:
+        stats = StreamingStats(limiar)
+        fatias = [slice(i, None, processos) for i in range(min(processos, n_blocos))]
+        with ProcessPoolExecutor(max_workers=len(fatias)) as pool:
+            futuros = [pool.submit(_rodar_blocos, cpu, cooler, params, tamanhos[f], sementes[f], distribuicoes, limiar)
+                       for f in fatias]
+            for fut in futuros:
+                stats.merge(fut.result())
+
+    return {
+        "n": stats.n,
+        "media": stats.media,
+        "desvio": stats.desvio,
+        "min": stats.minimo,
+        "max": stats.maximo,
+        "percentis": {p: stats.quantile(p / 100.0) for p in PERCENTIS},
+        "prob_throttle": stats.prob_acima,
+        "stats": stats,
+    }
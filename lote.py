@@ -0,0 +1,340 @@
+# lote.py
+# Execução em lote (linha de comando) — PT-BR
+# Avalia arquivos grandes de cenários sem Streamlit:
+#   python lote.py cenarios.csv -o resultados.parquet
+#   cat cenarios.jsonl | python lote.py - --formato-entrada jsonl --processos 4 > resultados.csv
+#
+# Cada linha de entrada é um cenário com as colunas cpu, cooler (modelos do
+# catálogo) e, opcionalmente, perfil, carga_pct, freq_ghz (vazio = turbo), amb,
+# vent e permitir_pl2 (ausentes usam motor.DEFAULT_PARAMS). A entrada é lida em
+# blocos, cada bloco é avaliado numa única chamada de steady_state_batch e o
+# resultado é escrito logo em seguida (CSV, JSON Lines ou Parquet), com as mesmas
+# colunas da tabela "Dados resumidos". Com --processos os blocos vão para um pool,
+# com no máximo 2 blocos por processo em andamento: a memória fica limitada
+# qualquer que seja o tamanho da entrada, e a ordem das linhas é preservada.
+
+import argparse
+import os
+import sys
+import time
+from collections import deque
+from concurrent.futures import ProcessPoolExecutor
+
+import numpy as np
+import pandas as pd
+
+from motor import DEFAULT_PARAMS, WORKLOAD_PROFILES, VENT_FACTORS, SUMMARY_COLUMNS, steady_state_batch
+import catalogo
+
+FORMATOS = ("csv", "jsonl", "parquet")
+EXTENSOES = {".csv": "csv", ".jsonl": "jsonl", ".ndjson": "jsonl", ".parquet": "parquet"}
+TAMANHO_BLOCO = 50_000
+CAMPOS_CENARIO = ("cpu", "cooler") + tuple(DEFAULT_PARAMS)
+VERDADEIRO = ("1", "true", "sim", "s", "yes", "y")
+MAX_REJEICOES_LOG = 20      # rejeições listadas individualmente no log
+# tipo de cada coluna de saída (esquema fixo do Parquet: não depende do conteúdo do primeiro bloco)
+TIPOS_SAIDA = dict(
+    {c: "double" for c in SUMMARY_COLUMNS}, cpu="string", arquitetura="string", tdp_ref_W="int64",
+    entrada_cpu="string", entrada_cooler="string", entrada_perfil="string", entrada_carga_pct="double",
+    entrada_freq_ghz="double", entrada_amb="double", entrada_vent="string", entrada_permitir_pl2="bool",
+)
+
+# catálogos usados pelo processo atual (trocados por _iniciar com --cpus/--coolers)
+_CATALOGOS = {"cpus": catalogo.CPUS, "coolers": catalogo.COOLERS}
+
+def _iniciar(cpus_path=None, coolers_path=None):
+    if cpus_path:
+        _CATALOGOS["cpus"] = catalogo.load_cpus(cpus_path)
+    if coolers_path:
+        _CATALOGOS["coolers"] = catalogo.load_coolers(coolers_path)
+
+# ---------------------------
+# ENTRADA
+# ---------------------------
+def _formato(caminho, formato):
+    """Formato explícito, ou pela extensão do arquivo ("-" = stdin/stdout usa csv)."""
+    if formato:
+        return formato
+    if caminho == "-":
+        return "csv"
+    ext = os.path.splitext(caminho)[1].lower()
+    if ext not in EXTENSOES:
+        raise ValueError(f"Extensão não reconhecida: {ext or caminho} (use .csv, .jsonl ou .parquet, ou informe o formato)")
+    return EXTENSOES[ext]
+
+def read_scenarios(fonte, formato=None, bloco=TAMANHO_BLOCO):
+    """Gera DataFrames de até `bloco` cenários; fonte "-" = stdin (formato padrão: csv)."""
+    formato = _formato(fonte, formato)
+    arquivo = sys.stdin if fonte == "-" else fonte
+    if formato == "csv":
+        yield from pd.read_csv(arquivo, chunksize=bloco, dtype={"cpu": str, "cooler": str})
+    elif formato == "jsonl":
+        yield from pd.read_json(arquivo, lines=True, chunksize=bloco, dtype={"cpu": str, "cooler": str})
+    elif formato == "parquet":
+        import pyarrow.parquet as pq
+        for lote in pq.ParquetFile(arquivo).iter_batches(batch_size=bloco):
+            yield lote.to_pandas()
+    else:
+        raise ValueError(f"Formato de entrada não suportado: {formato} (use um de {FORMATOS})")
+
+def _arredondar(x, casas):
+    # mesmo resultado do round() do Python (como em summary_record): np.round difere só perto
+    # dos empates (ex.: 169.65 → 169.6), então apenas esses valores passam pelo round()
+    r = np.round(x, casas)
+    escalado = x * 10.0 ** casas
+    empate = np.flatnonzero(np.abs(escalado - np.floor(escalado) - 0.5) < 1e-6)
+    r[empate] = [round(v, casas) for v in x[empate].tolist()]
+    return r
+
+def _bool(v):
+    return str(v).strip().lower() in VERDADEIRO if isinstance(v, str) else bool(v)
+
+def output_columns(com_entrada=False):
+    """Colunas de saída, na ordem: as do cenário (prefixo entrada_, se com_entrada) e SUMMARY_COLUMNS."""
+    return [f"entrada_{c}" for c in CAMPOS_CENARIO if com_entrada] + list(SUMMARY_COLUMNS)
+
+def _coluna(df, campo):
+    padrao = DEFAULT_PARAMS[campo]
+    if campo not in df:
+        return pd.Series(padrao, index=df.index, dtype=object)
+    return df[campo].where(df[campo].notna(), padrao)
+
+# ---------------------------
+# AVALIAÇÃO
+# ---------------------------
+def evaluate_chunk(df, com_entrada=False):
+    """
+    Avalia um bloco de cenários. Retorna (resultado, rejeitados):
+    - resultado: DataFrame com output_columns(com_entrada); as colunas de entrada trazem os valores
+      interpretados, com os padrões de DEFAULT_PARAMS no lugar dos ausentes (freq_ghz vazia = turbo);
+    - rejeitados: lista de (índice da linha em df, motivo) para CPU/cooler desconhecidos ou números inválidos.
+    """
+    cpus, coolers = _CATALOGOS["cpus"], _CATALOGOS["coolers"]
+    pos_cpu = df["cpu"].map(cpus.posicao) if "cpu" in df else pd.Series(np.nan, index=df.index)
+    pos_cooler = df["cooler"].map(coolers.posicao) if "cooler" in df else pd.Series(np.nan, index=df.index)
+    carga = pd.to_numeric(_coluna(df, "carga_pct"), errors="coerce")
+    amb = pd.to_numeric(_coluna(df, "amb"), errors="coerce")
+    freq = pd.to_numeric(df["freq_ghz"], errors="coerce") if "freq_ghz" in df else pd.Series(np.nan, index=df.index)
+
+    motivos = pd.Series("", index=df.index)
+    motivos[carga.isna()] = "carga_pct inválida"
+    motivos[amb.isna()] = "amb inválido"
+    if "freq_ghz" in df:
+        motivos[df["freq_ghz"].notna() & freq.isna()] = "freq_ghz inválida"
+    motivos[pos_cooler.isna()] = "cooler desconhecido"
+    motivos[pos_cpu.isna()] = "CPU desconhecido"
+    ok = (motivos == "").to_numpy()
+    rejeitados = [(i, m) for i, m in zip(df.index[~ok], motivos[~ok])]
+
+    df, carga, amb, freq = df[ok], carga[ok].to_numpy(float), amb[ok].to_numpy(float), freq[ok].to_numpy(float)
+    pos_cpu = pos_cpu[ok].to_numpy(np.intp)
+    pos_cooler = pos_cooler[ok].to_numpy(np.intp)
+    cpu_cols = cpus.arrays(pos_cpu)
+    base, turbo = cpu_cols["freq_base"], cpu_cols["freq_turbo"]
+
+    # mesmas regras de simulate(): perfil/ventilação desconhecidos valem 1.0, freq vazia = turbo
+    profile = _coluna(df, "perfil").map(WORKLOAD_PROFILES).fillna(1.0).to_numpy(float)
+    vent_factor = _coluna(df, "vent").map(VENT_FACTORS).fillna(1.0).to_numpy(float)
+    pl2 = _coluna(df, "permitir_pl2").map(_bool).to_numpy(bool)
+    freq_used = np.where(np.isnan(freq), turbo, freq)
+    freq_scale = np.divide(freq_used, base, out=np.ones_like(freq_used), where=base > 0)
+
+    res = steady_state_batch(cpu_cols, coolers.arrays(pos_cooler), carga, profile, freq_scale, amb, vent_factor, pl2)
+    saida = pd.DataFrame({
+        "cpu": cpus.colunas["modelo"][pos_cpu],
+        "arquitetura": cpus.colunas["arquitetura"][pos_cpu],
+        "tdp_ref_W": cpu_cols["tdp"].astype(int),
+        "freq_base_GHz": base,
+        "freq_turbo_GHz": turbo,
+        "freq_usada_GHz": _arredondar(freq_used, 2),
+        "pot_modelo_W": _arredondar(res["potencia_modelo"], 1),
+        "pot_aplicada_W": _arredondar(res["potencia_aplicada"], 1),
+        "cap_eff_W": _arredondar(res["cap_eff"], 1),
+        "temp_steady_C": _arredondar(res["temp_steady"], 1),
+        "util_pct": res["util_pct"],
+    }, columns=list(SUMMARY_COLUMNS))
+    if com_entrada:
+        entrada = pd.DataFrame({
+            "cpu": df["cpu"].to_numpy(object),
+            "cooler": df["cooler"].to_numpy(object),
+            "perfil": _coluna(df, "perfil").to_numpy(object),
+            "carga_pct": carga,
+            "freq_ghz": freq,
+            "amb": amb,
+            "vent": _coluna(df, "vent").to_numpy(object),
+            "permitir_pl2": pl2,
+        }, columns=list(CAMPOS_CENARIO))
+        saida = pd.concat([entrada.add_prefix("entrada_"), saida], axis=1)
+    return saida, rejeitados
+
+# ---------------------------
+# SAÍDA
+# ---------------------------
+def serialize(df, formato):
+    """Bloco pronto para escrita: texto CSV (sem cabeçalho) / JSON Lines, ou o próprio DataFrame (parquet)."""
+    if formato == "csv":
+        return df.to_csv(header=False, index=False)
+    if formato == "jsonl":
+        if not len(df):
+            return ""
+        texto = df.to_json(orient="records", lines=True, force_ascii=False)
+        # versões antigas do pandas não terminam a última linha com "\n"
+        return texto if texto.endswith("\n") else texto + "\n"
+    return df
+
+class ResultWriter:
+    """
+    Escrita incremental por bloco: CSV/JSON Lines (arquivo ou stdout) ou Parquet (requer pyarrow).
+    - colunas: colunas de saída (padrão: SUMMARY_COLUMNS); o Parquet usa um esquema fixo com os
+      tipos de TIPOS_SAIDA, e o arquivo (ou o cabeçalho do CSV) existe mesmo sem nenhuma linha.
+    """
+
+    def __init__(self, destino, formato=None, colunas=SUMMARY_COLUMNS):
+        self.formato = _formato(destino, formato)
+        if self.formato not in FORMATOS:
+            raise ValueError(f"Formato de saída não suportado: {self.formato} (use um de {FORMATOS})")
+        self.destino = destino
+        self.colunas = list(colunas)
+        self._arquivo = None
+        self._parquet = None
+        self._esquema = None
+        self._cabecalho = True
+        self._fechado = False
+        if self.formato == "parquet":
+            if destino == "-":
+                raise ValueError("Parquet não pode ser escrito no stdout; informe um arquivo com -o")
+            import pyarrow as pa
+            self._esquema = pa.schema([(c, pa.type_for_alias(TIPOS_SAIDA.get(c, "string"))) for c in self.colunas])
+        else:
+            self._arquivo = sys.stdout if destino == "-" else open(destino, "w", newline="", encoding="utf-8")
+
+    def write(self, df):
+        self.write_serialized(serialize(df, self.formato), list(df.columns))
+
+    def write_serialized(self, bloco, colunas):
+        """Escreve um bloco já passado por serialize() (a serialização pode ter sido feita em outro processo)."""
+        if list(colunas) != self.colunas:
+            raise ValueError(f"Colunas do bloco diferentes das do arquivo de saída: {list(colunas)}")
+        if self.formato == "parquet":
+            import pyarrow as pa
+            # o bloco é convertido já no esquema fixo: um bloco só de rejeições (colunas vazias,
+            # sem tipo) não define tipos nulos para o arquivo inteiro
+            self._abrir_parquet().write_table(pa.Table.from_pandas(bloco, schema=self._esquema, preserve_index=False))
+            return
+        self._escrever_cabecalho()
+        self._arquivo.write(bloco)
+        self._arquivo.flush()
+
+    def _abrir_parquet(self):
+        if self._parquet is None:
+            import pyarrow.parquet as pq
+            self._parquet = pq.ParquetWriter(self.destino, self._esquema)
+        return self._parquet
+
+    def _escrever_cabecalho(self):
+        if self._cabecalho and self.formato == "csv":
+            self._arquivo.write(pd.DataFrame(columns=self.colunas).to_csv(index=False))
+        self._cabecalho = False
+
+    def close(self):
+        if self._fechado:
+            return
+        self._fechado = True
+        # sem nenhum bloco escrito, a saída ainda tem o esquema (Parquet) ou o cabeçalho (CSV)
+        if self.formato == "parquet":
+            self._abrir_parquet().close()
+            return
+        self._escrever_cabecalho()
+        self._arquivo.flush()
+        if self._arquivo is not sys.stdout:
+            self._arquivo.close()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, *exc):
+        self.close()
+
+# ---------------------------
+# EXECUÇÃO
+# ---------------------------
+def _avaliar(df, com_entrada, formato):
+    # avaliação + serialização: no modo com processos, a formatação do texto também é paralela
+    saida, rejeitados = evaluate_chunk(df, com_entrada)
+    return serialize(saida, formato), list(saida.columns), len(saida), rejeitados
+
+def run_batch(entrada, saida="-", formato_entrada=None, formato_saida=None, bloco=TAMANHO_BLOCO,
+              processos=1, com_entrada=False, cpus_path=None, coolers_path=None, log=sys.stderr):
+    """
+    Avalia todos os cenários de `entrada` ("-" = stdin) e escreve em `saida` ("-" = stdout).
+    - processos > 1 usa um pool (None = todos os núcleos), com até 2 blocos por processo em andamento;
+    - retorna {"cenarios", "avaliados", "rejeitados", "segundos"}; as rejeições são listadas em `log`.
+    """
+    inicio = time.perf_counter()
+    _iniciar(cpus_path, coolers_path)
+    processos = os.cpu_count() if processos is None else processos
+    total = avaliados = rejeitados = 0
+
+    def numerar(df):
+        # índice = número da linha na entrada (os leitores nem sempre continuam a contagem entre blocos)
+        nonlocal total
+        df.index = pd.RangeIndex(total, total + len(df))
+        total += len(df)
+        return df
+
+    def registrar(resultado):
+        nonlocal avaliados, rejeitados
+        serializado, colunas, n, rej = resultado
+        escritor.write_serialized(serializado, colunas)
+        avaliados += n
+        for linha, motivo in rej:
+            if rejeitados < MAX_REJEICOES_LOG:
+                print(f"linha {linha + 1}: {motivo}", file=log)
+            rejeitados += 1
+
+    with ResultWriter(saida, formato_saida, output_columns(com_entrada)) as escritor:
+        blocos = read_scenarios(entrada, formato_entrada, bloco)
+        if processos <= 1:
+            for df in blocos:
+                registrar(_avaliar(numerar(df), com_entrada, escritor.formato))
+        else:
+            with ProcessPoolExecutor(processos, initializer=_iniciar, initargs=(cpus_path, coolers_path)) as pool:
+                pendentes = deque()
+                for df in blocos:
+                    pendentes.append(pool.submit(_avaliar, numerar(df), com_entrada, escritor.formato))
+                    if len(pendentes) >= 2 * processos:
+                        registrar(pendentes.popleft().result())
+                while pendentes:
+                    registrar(pendentes.popleft().result())
+
+    if rejeitados > MAX_REJEICOES_LOG:
+        print(f"... e mais {rejeitados - MAX_REJEICOES_LOG} linhas rejeitadas", file=log)
+    return {"cenarios": total, "avaliados": avaliados, "rejeitados": rejeitados,
+            "segundos": time.perf_counter() - inicio}
+
+def main(argv=None):
+    ap = argparse.ArgumentParser(
+        description="Avalia cenários CPU/cooler em lote (mesmas colunas da tabela \"Dados resumidos\").")
+    ap.add_argument("entrada", help='arquivo de cenários (.csv, .jsonl, .parquet) ou "-" para stdin')
+    ap.add_argument("-o", "--saida", default="-", help='arquivo de saída (padrão: stdout em CSV)')
+    ap.add_argument("--formato-entrada", choices=FORMATOS, help="padrão: pela extensão (stdin: csv)")
+    ap.add_argument("--formato", choices=FORMATOS, help="formato de saída (padrão: pela extensão)")
+    ap.add_argument("--bloco", type=int, default=TAMANHO_BLOCO, help=f"cenários por bloco (padrão: {TAMANHO_BLOCO})")
+    ap.add_argument("--processos", type=int, default=1, help="processos do pool (0 = todos os núcleos)")
+    ap.add_argument("--com-entrada", action="store_true", help="inclui as colunas do cenário (prefixo entrada_)")
+    ap.add_argument("--cpus", help="catálogo de CPUs alternativo")
+    ap.add_argument("--coolers", help="catálogo de coolers alternativo")
+    args = ap.parse_args(argv)
+
+    try:
+        r = run_batch(args.entrada, args.saida, args.formato_entrada, args.formato, args.bloco,
+                      args.processos or None, args.com_entrada, args.cpus, args.coolers)
+    except (ValueError, ImportError, OSError) as exc:
+        print(f"erro: {exc}", file=sys.stderr)
+        return 2
+    print(f"{r['avaliados']} de {r['cenarios']} cenários avaliados em {r['segundos']:.2f} s "
+          f"({r['rejeitados']} rejeitados)", file=sys.stderr)
+    return 0
+
+if __name__ == "__main__":
+    sys.exit(main())
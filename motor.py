@@ -0,0 +1,366 @@
+# motor.py
+# Núcleo do simulador (sem Streamlit): modelo térmico e API simulate().
+# Pode ser importado por scripts, notebooks e pela UI (simulador_refrigeracao.py).
+# Os dados de CPUs e coolers ficam em catalogo.py (arquivos em dados/).
+
+import numpy as np
+from math import sqrt
+
+from desempenho import counted
+
+# ---------------------------
+# PERFIS e PARÂMETROS
+# ---------------------------
+BASE_SAFETY_PCT = 0.10
+WORKLOAD_PROFILES = {
+    "Idle / Leve": 0.15,
+    "Navegação / Escritório": 0.30,
+    "Jogos (típico)": 0.55,
+    "Bench sustentado (Cinebench)": 1.00,
+    "AVX/Prime (pesado)": 1.30
+}
+VENT_FACTORS = {
+    "Bem ventilado": 1.0,
+    "Moderado": 0.92,
+    "Pouco ventilado": 0.85
+}
+THROTTLE_TEMP = 95.0
+HOTSPOT_AMD_C = 8.0
+
+# ---------------------------
+# FUNÇÕES (explicadas)
+# ---------------------------
+def avg_freq(cpu):
+    return (cpu.get("frequencia_base", 3.5) + cpu.get("frequencia_turbo", 3.5)) / 2.0
+
+def cpu_power_model(tdp, carga_pct, profile, freq_scale=1.0):
+    """
+    Modelo heurístico de potência:
+    - idle: fração do TDP
+    - dyn: parte dinâmica proporcional a carga, perfil e escala de frequência.
+      aqui aplicamos um expoente (>1) para refletir que overclock (freq+voltagem)
+      aumenta consumo mais que linearmente.
+    - leak: leakage aumenta com frequência/voltagem (simplesmente modelado).
+    """
+    idle = 0.10 * tdp
+    dyn = tdp * (carga_pct / 100.0) * (0.80 * profile) * (freq_scale ** 1.20)
+    leak = 0.02 * tdp * (1 + 0.15 * (freq_scale - 1.0))
+    return max(0.0, idle + dyn + leak)
+
+def compute_PLs(cpu):
+    t = cpu.get("tdp", 65)
+    y = cpu.get("ano", 2018)
+    if y >= 2022:
+        return round(t * 1.2, 1), round(t * 1.8, 1), 28.0
+    if y >= 2017:
+        return round(t * 1.05, 1), round(t * 1.4, 1), 20.0
+    return round(t * 1.0, 1), round(t * 1.2, 1), 10.0
+
+def derive_rth_heatsink(c):
+    # registros do catálogo já trazem o valor (calculado uma vez no carregamento)
+    if "r_hs" in c: return c["r_hs"]
+    nome = c.get("modelo", "").lower()
+    tipo = c.get("tipo", "air").lower()
+    if tipo == "aio":
+        if "360" in nome: return 0.07
+        if "280" in nome: return 0.09
+        if "240" in nome or "h100" in nome: return 0.11
+        return 0.10
+    premium = ["noctua", "dark rock", "true spirit", "ak620"]
+    if "hyper 212" in nome: return 0.16
+    if any(k in nome for k in premium): return 0.12
+    if any(k in nome for k in ["gammaxx", "superframe", "gamedias", "glacier", "tyr"]): return 0.18
+    return 0.18
+
+def cpu_r_cs(cpu):
+    if "r_cs" in cpu: return cpu["r_cs"]
+    fab = cpu.get("fabricante", "Intel").lower()
+    ano = cpu.get("ano", 2018)
+    if fab == "amd": return 0.25
+    if ano >= 2022: return 0.20
+    if ano >= 2015: return 0.22
+    return 0.30
+
+def fan_rpm(util):
+    idle, maxr = 600, 2200
+    u = max(0.0, min(100.0, util))
+    return idle if u <= 15 else int(idle + (maxr - idle) * ((u - 15) / 85.0))
+
+def r_total(cpu, cooler, rpm):
+    Rcs = cpu_r_cs(cpu)
+    Rhs = derive_rth_heatsink(cooler)
+    rpm_ref = 1500.0
+    if rpm <= 0: rpm = rpm_ref
+    Rhs_adj = Rhs * (rpm_ref / rpm) ** 0.8
+    return Rcs + Rhs_adj
+
+def estimate_noise(cooler, util):
+    base = cooler.get("ruido_db", 30)
+    return round(base * (0.6 + 0.4 * sqrt(min(1.0, util / 100.0))), 1)
+
+def estimate_durability(cooler, util):
+    b = cooler.get("durabilidade_anos", 5)
+    if util <= 80: return b
+    exc = (util - 80) / 20.0
+    return max(1, int(b * (1.0 - 0.5 * exc)))
+
+# ---------------------------
+# API DE SIMULAÇÃO (um par CPU/cooler)
+# ---------------------------
+DEFAULT_PARAMS = {
+    "carga_pct": 100,            # carga (percentual do TDP)
+    "perfil": "Bench sustentado (Cinebench)",
+    "freq_ghz": None,            # None = frequência turbo do CPU
+    "amb": 25.0,                 # temperatura ambiente (°C)
+    "vent": "Bem ventilado",     # chave de VENT_FACTORS
+    "permitir_pl2": True,
+}
+
+@counted
+def simulate(cpu, cooler, params=None):
+    """
+    Simula um par CPU/cooler em regime permanente (o antigo bloco "Simular").
+    - params: dicionário com as chaves de DEFAULT_PARAMS (as ausentes usam o padrão).
+    - retorna um dicionário com todos os valores intermediários exibidos na UI.
+    """
+    p = dict(DEFAULT_PARAMS, **(params or {}))
+    tdp_ref = cpu["tdp"]
+    perfil_f = WORKLOAD_PROFILES.get(p["perfil"], 1.0)
+    vent_factor = VENT_FACTORS.get(p["vent"], 1.0)
+
+    base_freq = cpu.get("frequencia_base", 0.0)
+    turbo_freq = cpu.get("frequencia_turbo", base_freq)
+
+    # usamos a frequência definida pelo usuário (sem cap)
+    freq_used = float(turbo_freq if p["freq_ghz"] is None else p["freq_ghz"])
+    # escala efetiva relativa à base (para o modelo)
+    freq_scale = (freq_used / base_freq) if base_freq > 0 else 1.0
+
+    # potência/modelo usa o fator de frequência efetivo (com expoente >1 para OC)
+    potencia_modelo = cpu_power_model(tdp_ref, p["carga_pct"], perfil_f, freq_scale)
+    PL1, PL2, TAU = compute_PLs(cpu)
+    potencia_aplicada = min(potencia_modelo, PL2 if p["permitir_pl2"] else PL1)
+
+    # capacidade do cooler ajustada por ventilação e margem de segurança
+    nominal = cooler.get("tdp_nominal", round(0.85 * cooler.get("tdp_manufacturer", 0.0), 1))
+    nominal_v = nominal * vent_factor * (1.0 - BASE_SAFETY_PCT)
+
+    # dinâmica de redução: se power próxima do nominal, desempenho/prática cai
+    dyn_pct = min(0.20, 0.15 * (potencia_aplicada / max(1.0, nominal_v)))
+    cap_eff = nominal_v * (1.0 - dyn_pct)
+
+    util_pct = round((potencia_aplicada / max(1.0, cap_eff)) * 100.0, 1) if cap_eff > 0 else 999.9
+    rpm = fan_rpm(util_pct)
+    Rtot = r_total(cpu, cooler, rpm)
+
+    # temperatura steady (IHS aproximado)
+    temp_steady = p["amb"] + potencia_aplicada * Rtot
+
+    # hotspot AMD offset (simula Tj > IHS)
+    hotspot = cpu.get("fabricante", "Intel").lower() == "amd"
+    if hotspot:
+        temp_steady += HOTSPOT_AMD_C
+
+    return {
+        "params": p,
+        "tdp_ref": tdp_ref,
+        "perfil_f": perfil_f,
+        "vent_factor": vent_factor,
+        "base_freq": base_freq,
+        "turbo_freq": turbo_freq,
+        "freq_used": freq_used,
+        "freq_scale": freq_scale,
+        "potencia_modelo": potencia_modelo,
+        "PL1": PL1, "PL2": PL2, "TAU": TAU,
+        "potencia_aplicada": potencia_aplicada,
+        "nominal": nominal,
+        "dyn_pct": dyn_pct,
+        "cap_eff": cap_eff,
+        "util_pct": util_pct,
+        "rpm": rpm,
+        "r_total": Rtot,
+        "temp_steady": temp_steady,
+        "hotspot": hotspot,
+        "throttle": temp_steady >= THROTTLE_TEMP,
+        "ruido_db": estimate_noise(cooler, util_pct),
+        "durabilidade_anos": estimate_durability(cooler, util_pct),
+    }
+
+def batch_args(cpu, params=None):
+    """Converte os params de simulate() nos argumentos escalares de steady_state_batch."""
+    p = dict(DEFAULT_PARAMS, **(params or {}))
+    base_freq = cpu.get("frequencia_base", 0.0)
+    turbo_freq = cpu.get("frequencia_turbo", base_freq)
+    freq_used = float(turbo_freq if p["freq_ghz"] is None else p["freq_ghz"])
+    return {
+        "carga_pct": p["carga_pct"],
+        "profile": WORKLOAD_PROFILES.get(p["perfil"], 1.0),
+        "freq_scale": (freq_used / base_freq) if base_freq > 0 else 1.0,
+        "amb": p["amb"],
+        "vent_factor": VENT_FACTORS.get(p["vent"], 1.0),
+        "permitir_pl2": p["permitir_pl2"],
+    }
+
+# colunas da tabela "Dados resumidos" (summary_record), na ordem exibida
+SUMMARY_COLUMNS = (
+    "cpu", "arquitetura", "tdp_ref_W", "freq_base_GHz", "freq_turbo_GHz", "freq_usada_GHz",
+    "pot_modelo_W", "pot_aplicada_W", "cap_eff_W", "temp_steady_C", "util_pct",
+)
+
+def summary_record(cpu, res):
+    """Linha da tabela "Dados resumidos" para um resultado de simulate()."""
+    return {
+        "cpu": cpu['modelo'],
+        "arquitetura": cpu.get("arquitetura"),
+        "tdp_ref_W": res["tdp_ref"],
+        "freq_base_GHz": res["base_freq"],
+        "freq_turbo_GHz": res["turbo_freq"],
+        "freq_usada_GHz": round(res["freq_used"], 2),
+        "pot_modelo_W": round(res["potencia_modelo"], 1),
+        "pot_aplicada_W": round(res["potencia_aplicada"], 1),
+        "cap_eff_W": round(res["cap_eff"], 1),
+        "temp_steady_C": round(res["temp_steady"], 1),
+        "util_pct": res["util_pct"]
+    }
+
+# ---------------------------
+# MOTOR VETORIZADO (NumPy)
+# ---------------------------
+# Mesmas fórmulas das funções acima, reescritas para operar sobre arrays que
+# fazem broadcast entre si. Assim a grade inteira CPU × cooler × perfil ×
+# ambiente × ventilação é calculada numa única passada. As versões escalares ficam em
+# Python puro (rápidas para um cenário só); tests/test_motor.py confere que os dois
+# caminhos coincidem.
+
+def cpu_arrays(cpus):
+    """
+    Colunas NumPy por CPU: TDP, PL1/PL2/TAU, R_cs, offset de hotspot e frequências base/turbo.
+    Um catalogo.Catalog já traz essas colunas prontas (calculadas no carregamento).
+    """
+    if hasattr(cpus, "arrays"):
+        return cpus.arrays()
+    pls = np.array([compute_PLs(c) for c in cpus], dtype=float).reshape(-1, 3)
+    return {
+        "tdp": np.array([c.get("tdp", 65) for c in cpus], dtype=float),
+        "pl1": pls[:, 0],
+        "pl2": pls[:, 1],
+        "tau": pls[:, 2],
+        "r_cs": np.array([cpu_r_cs(c) for c in cpus], dtype=float),
+        "hotspot": np.array([HOTSPOT_AMD_C if c.get("fabricante", "Intel").lower() == "amd" else 0.0 for c in cpus]),
+        "freq_base": np.array([c.get("frequencia_base", 0.0) for c in cpus], dtype=float),
+        "freq_turbo": np.array([c.get("frequencia_turbo", c.get("frequencia_base", 0.0)) for c in cpus], dtype=float),
+    }
+
+def cooler_arrays(coolers):
+    """Colunas NumPy por cooler: nominal ajustado, R_hs, ruído base, durabilidade base e se é AIO."""
+    if hasattr(coolers, "arrays"):
+        return coolers.arrays()
+    return {
+        "nominal": np.array([c.get("tdp_nominal", round(0.85 * c.get("tdp_manufacturer", 0.0), 1)) for c in coolers], dtype=float),
+        "r_hs": np.array([derive_rth_heatsink(c) for c in coolers], dtype=float),
+        "ruido_db": np.array([c.get("ruido_db", 30) for c in coolers], dtype=float),
+        "durabilidade_anos": np.array([c.get("durabilidade_anos", 5) for c in coolers], dtype=float),
+        "aio": np.array([c.get("tipo", "Air").lower() == "aio" for c in coolers]),
+    }
+
+def cpu_power_model_batch(tdp, carga_pct, profile, freq_scale=1.0):
+    idle = 0.10 * tdp
+    dyn = tdp * (carga_pct / 100.0) * (0.80 * profile) * (freq_scale ** 1.20)
+    leak = 0.02 * tdp * (1 + 0.15 * (freq_scale - 1.0))
+    return np.maximum(0.0, idle + dyn + leak)
+
+def fan_rpm_batch(util):
+    idle, maxr = 600, 2200
+    u = np.clip(util, 0.0, 100.0)
+    return np.where(u <= 15, idle, np.floor(idle + (maxr - idle) * ((u - 15) / 85.0)))
+
+def r_total_batch(r_cs, r_hs, rpm):
+    rpm_ref = 1500.0
+    rpm = np.where(rpm <= 0, rpm_ref, rpm)
+    return r_cs + r_hs * (rpm_ref / rpm) ** 0.8
+
+def estimate_noise_batch(ruido_db, util):
+    return np.round(ruido_db * (0.6 + 0.4 * np.sqrt(np.minimum(1.0, util / 100.0))), 1)
+
+def estimate_durability_batch(durabilidade_anos, util):
+    exc = (util - 80) / 20.0
+    reduzida = np.maximum(1, np.trunc(durabilidade_anos * (1.0 - 0.5 * exc)))
+    return np.where(util <= 80, durabilidade_anos, reduzida)
+
+def cooler_capacity_batch(potencia_aplicada, cooler_cols, vent_factor, safety_pct=BASE_SAFETY_PCT):
+    """Redução dinâmica (fração), capacidade efetiva e utilização (%) do cooler (broadcast)."""
+    # capacidade ajustada por ventilação e margem de segurança; perto do nominal, a prática cai
+    nominal_v = cooler_cols["nominal"] * vent_factor * (1.0 - safety_pct)
+    dyn_pct = np.minimum(0.20, 0.15 * (potencia_aplicada / np.maximum(1.0, nominal_v)))
+    cap_eff = nominal_v * (1.0 - dyn_pct)
+
+    util_pct = np.where(cap_eff > 0, np.round((potencia_aplicada / np.maximum(1.0, cap_eff)) * 100.0, 1), 999.9)
+    return dyn_pct, cap_eff, util_pct
+
+def cooling_batch(potencia_aplicada, cooler_cols, vent_factor, safety_pct=BASE_SAFETY_PCT):
+    """Capacidade efetiva, utilização (%) e RPM do cooler para a potência aplicada (broadcast)."""
+    _, cap_eff, util_pct = cooler_capacity_batch(potencia_aplicada, cooler_cols, vent_factor, safety_pct)
+    return cap_eff, util_pct, fan_rpm_batch(util_pct)
+
+@counted
+def steady_state_batch(cpu_cols, cooler_cols, carga_pct, profile, freq_scale, amb, vent_factor, permitir_pl2=True,
+                       safety_pct=BASE_SAFETY_PCT):
+    """
+    Versão vetorizada do bloco "Simular": todos os argumentos fazem broadcast.
+    - cpu_cols / cooler_cols: dicionários de cpu_arrays / cooler_arrays (já com o shape desejado).
+    - permitir_pl2 pode ser um array de bool (um valor por cenário).
+    - retorna um dicionário de arrays com potência, redução dinâmica, capacidade, utilização, RPM,
+      R_total, temperatura steady, flag de throttle, ruído e durabilidade.
+    """
+    potencia_modelo = cpu_power_model_batch(cpu_cols["tdp"], carga_pct, profile, freq_scale)
+    limite = np.where(permitir_pl2, cpu_cols["pl2"], cpu_cols["pl1"])
+    potencia_aplicada = np.minimum(potencia_modelo, limite)
+
+    dyn_pct, cap_eff, util_pct = cooler_capacity_batch(potencia_aplicada, cooler_cols, vent_factor, safety_pct)
+    rpm = fan_rpm_batch(util_pct)
+    Rtot = r_total_batch(cpu_cols["r_cs"], cooler_cols["r_hs"], rpm)
+    temp_steady = amb + potencia_aplicada * Rtot + cpu_cols["hotspot"]
+
+    return {
+        "potencia_modelo": potencia_modelo,
+        "potencia_aplicada": potencia_aplicada,
+        "dyn_pct": dyn_pct,
+        "cap_eff": cap_eff,
+        "util_pct": util_pct,
+        "rpm": rpm,
+        "r_total": Rtot,
+        "temp_steady": temp_steady,
+        "throttle": temp_steady >= THROTTLE_TEMP,
+        "ruido_db": estimate_noise_batch(cooler_cols["ruido_db"], util_pct),
+        "durabilidade_anos": estimate_durability_batch(cooler_cols["durabilidade_anos"], util_pct),
+    }
+
+@counted
+def compatibility_matrix(cpus, coolers, perfis=None, ambientes=(25.0,), ventilacoes=None,
+                         carga_pct=100.0, freq_scale=1.0, permitir_pl2=True):
+    """
+    Matriz de compatibilidade CPU × cooler × perfil × ambiente × ventilação.
+    Todos os arrays de saída têm shape (n_cpus, n_coolers, n_perfis, n_ambientes, n_ventilacoes);
+    "eixos" traz os rótulos de cada dimensão, na mesma ordem.
+    """
+    perfis = WORKLOAD_PROFILES if perfis is None else perfis
+    ventilacoes = VENT_FACTORS if ventilacoes is None else ventilacoes
+    ambientes = np.asarray(ambientes, dtype=float).ravel()
+
+    cpu_cols = {k: v[:, None, None, None, None] for k, v in cpu_arrays(cpus).items()}
+    cooler_cols = {k: v[None, :, None, None, None] for k, v in cooler_arrays(coolers).items()}
+    prof = np.array(list(perfis.values()), dtype=float)[None, None, :, None, None]
+    amb = ambientes[None, None, None, :, None]
+    vent = np.array(list(ventilacoes.values()), dtype=float)[None, None, None, None, :]
+
+    res = steady_state_batch(cpu_cols, cooler_cols, carga_pct, prof, freq_scale, amb, vent, permitir_pl2)
+    shape = (len(cpus), len(coolers), len(perfis), len(ambientes), len(ventilacoes))
+    saida = {k: np.broadcast_to(v, shape) for k, v in res.items()}
+    saida["eixos"] = {
+        "cpu": [c["modelo"] for c in cpus],
+        "cooler": [c["modelo"] for c in coolers],
+        "perfil": list(perfis),
+        "ambiente": ambientes.tolist(),
+        "ventilacao": list(ventilacoes),
+    }
+    return saida
@@ -0,0 +1,88 @@
+# overclock.py
+# Overclock máximo estável — PT-BR
+# Para cada par CPU/cooler, encontra a maior frequência que mantém a temperatura
+# steady abaixo de um limite sem estourar o limite de potência (PL2, ou PL1 sem
+# burst). Temperatura e potência crescem com a frequência (cpu_power_model é
+# monotônico em freq_scale e P·R_total cresce com P), então a busca é uma
+# bisseção feita em lote sobre todos os pares ao mesmo tempo.
+
+import numpy as np
+
+from desempenho import counted
+from motor import (
+    WORKLOAD_PROFILES, VENT_FACTORS, THROTTLE_TEMP,
+    cpu_arrays, cooler_arrays, steady_state_batch,
+)
+
+# motivo que limita a frequência encontrada
+MOTIVOS = ("térmico", "potência", "faixa", "nenhuma")
+MOTIVO_TERMICO, MOTIVO_POTENCIA, MOTIVO_FAIXA, MOTIVO_NENHUMA = range(4)
+
+# ---------------------------
+# FUNÇÕES
+# ---------------------------
+def freq_limits(cpu_cols):
+    """Faixa de frequência permitida (GHz), a mesma do controle manual da barra lateral."""
+    base, turbo = cpu_cols["freq_base"], cpu_cols["freq_turbo"]
+    return np.maximum(0.5, base * 0.8), np.maximum(turbo * 1.6, base * 1.2)
+
+@counted
+def max_stable_frequency(cpu_cols, cooler_cols, carga_pct, profile, amb, vent_factor,
+                         temp_limite=THROTTLE_TEMP, permitir_pl2=True, tol_ghz=0.001):
+    """
+    Maior frequência (GHz) estável para cada cenário (argumentos fazem broadcast, como em steady_state_batch).
+    - estável = temperatura steady < temp_limite e potência do modelo <= PL2 (ou PL1 sem burst);
+    - retorna freq_max_ghz (NaN se nem a frequência mínima é estável), freq_scale, temp_steady,
+      potencia_aplicada e motivo (índice em MOTIVOS: o que impede subir mais).
+    """
+    base = cpu_cols["freq_base"]
+    limite_pot = cpu_cols["pl2"] if permitir_pl2 else cpu_cols["pl1"]
+
+    def avaliar(f_ghz):
+        res = steady_state_batch(cpu_cols, cooler_cols, carga_pct, profile, f_ghz / base, amb, vent_factor, permitir_pl2)
+        quente = res["temp_steady"] >= temp_limite
+        return ~quente & (res["potencia_modelo"] <= limite_pot), quente, res
+
+    f_min, f_max = freq_limits(cpu_cols)
+    ok_min, _, res_min = avaliar(f_min)
+    shape = ok_min.shape
+    lo = np.broadcast_to(f_min, shape).copy()
+    hi = np.broadcast_to(f_max, shape).copy()
+    ok_max, quente_max, _ = avaliar(hi)
+
+    # invariante: lo é estável e hi não é (onde a busca faz sentido)
+    n_iter = int(np.ceil(np.log2(max(float(np.max(hi - lo)), tol_ghz) / tol_ghz)))
+    for _ in range(n_iter):
+        meio = 0.5 * (lo + hi)
+        ok, _, _ = avaliar(meio)
+        lo = np.where(ok, meio, lo)
+        hi = np.where(ok, hi, meio)
+
+    _, quente_hi, _ = avaliar(hi)
+    freq = np.where(ok_max, np.broadcast_to(f_max, shape), np.where(ok_min, lo, np.nan))
+    motivo = np.where(quente_hi, MOTIVO_TERMICO, MOTIVO_POTENCIA)
+    motivo = np.where(ok_max, MOTIVO_FAIXA, np.where(ok_min, motivo, MOTIVO_NENHUMA))
+
+    final = steady_state_batch(cpu_cols, cooler_cols, carga_pct, profile,
+                               np.where(np.isnan(freq), f_min, freq) / base, amb, vent_factor, permitir_pl2)
+    return {
+        "freq_max_ghz": freq,
+        "freq_scale": freq / base,
+        "temp_steady": np.where(np.isnan(freq), res_min["temp_steady"], final["temp_steady"]),
+        "potencia_aplicada": final["potencia_aplicada"],
+        "motivo": motivo,
+    }
+
+def oc_headroom_table(cpus, coolers, carga_pct=100, perfil="Bench sustentado (Cinebench)", amb=25.0,
+                      vent="Bem ventilado", temp_limite=THROTTLE_TEMP, permitir_pl2=True):
+    """
+    Tabela de "headroom" de overclock para todos os pares CPU × cooler (shape (n_cpus, n_coolers)).
+    headroom_ghz = frequência máxima estável − frequência turbo de referência.
+    """
+    cpu_cols = {k: v[:, None] for k, v in cpu_arrays(cpus).items()}
+    cooler_cols = {k: v[None, :] for k, v in cooler_arrays(coolers).items()}
+    r = max_stable_frequency(cpu_cols, cooler_cols, carga_pct, WORKLOAD_PROFILES.get(perfil, 1.0), amb,
+                             VENT_FACTORS.get(vent, 1.0), temp_limite, permitir_pl2)
+    r["headroom_ghz"] = r["freq_max_ghz"] - cpu_cols["freq_turbo"]
+    r["eixos"] = {"cpu": [c["modelo"] for c in cpus], "cooler": [c["modelo"] for c in coolers]}
+    return r
@@ -0,0 +1,101 @@
+# rack.py
+# Modo rack / vários nós — PT-BR
+# N chassis × M sockets (ex.: Xeons E5 dual-socket) respirando o mesmo ar do
+# corredor frio. O ar aquece ao longo da cadeia:
+# - dentro do chassis, cada socket recebe o calor dos sockets a montante
+#   (ΔT_ar = P / (ρ·cp·vazão), ponderado pelo "sombreamento": 1 = em série, 0 = lado a lado);
+# - entre chassis empilhados no mesmo rack, uma fração (recirculação) do aquecimento
+#   da saída do chassis de baixo volta para a entrada do de cima;
+# - cada chassis tem sua própria vazão, ventilação (vent_factor) e calor extra (memória, fontes, discos).
+# A potência do modelo não depende da temperatura de entrada (e a temperatura steady
+# é linear no ambiente), então toda a frota cabe numa chamada de steady_state_batch:
+# potências → cadeia de ar (somas acumuladas) → temperatura de cada socket.
+
+import numpy as np
+
+from motor import WORKLOAD_PROFILES, THROTTLE_TEMP, batch_args, cpu_arrays, cooler_arrays, steady_state_batch
+
+RHO_AR = 1.2            # kg/m³
+CP_AR = 1005.0          # J/(kg·K)
+CFM_M3S = 0.000471947   # 1 CFM em m³/s
+W_BTU_H = 3.412142      # 1 W em BTU/h
+
+# ---------------------------
+# FUNÇÕES
+# ---------------------------
+def air_rise(potencia_w, fluxo_cfm):
+    """Aquecimento do ar (°C) ao absorver `potencia_w` com vazão `fluxo_cfm` (broadcast)."""
+    return np.asarray(potencia_w, dtype=float) / (RHO_AR * CP_AR * np.asarray(fluxo_cfm, dtype=float) * CFM_M3S)
+
+def simulate_rack(cpu, cooler, n_chassis, sockets_por_chassis=2, chassis_por_rack=None, carga_pct=100,
+                  perfil="Bench sustentado (Cinebench)", freq_ghz=None, amb=22.0, vent_factor=1.0,
+                  fluxo_cfm=100.0, recirculacao=0.0, sombreamento=1.0, calor_extra_w=0.0, permitir_pl2=True):
+    """
+    Temperaturas de todos os sockets de uma fileira de racks.
+    - chassis numerados de baixo para cima, rack a rack (chassis_por_rack=None: um rack só);
+    - por chassis (escalar ou array (n_chassis,)): vent_factor, fluxo_cfm, calor_extra_w;
+    - carga_pct: escalar, (n_chassis,) ou (n_chassis, sockets_por_chassis);
+    - amb: temperatura do corredor frio; recirculacao e sombreamento em [0, 1];
+    - retorna arrays (n_chassis, sockets) com entrada, potência, utilização, RPM, temperatura e throttle,
+      arrays por chassis (entrada, saída, calor, rack, posição) e os totais da fileira.
+    """
+    n, m = int(n_chassis), int(sockets_por_chassis)
+    por_rack = n if chassis_por_rack is None else int(chassis_por_rack)
+    a = batch_args(cpu, {"perfil": perfil, "freq_ghz": freq_ghz})
+
+    def por_chassis(x):
+        return np.broadcast_to(np.asarray(x, dtype=float), (n,))
+
+    vent, fluxo, extra = por_chassis(vent_factor), por_chassis(fluxo_cfm), por_chassis(calor_extra_w)
+    carga = np.broadcast_to(np.asarray(carga_pct, dtype=float).reshape(
+        (n, -1) if np.ndim(carga_pct) == 1 else np.shape(carga_pct)), (n, m))
+
+    # potência e resistência de cada socket (com ambiente 0: a temperatura é linear no ambiente)
+    res = steady_state_batch(cpu_arrays([cpu]), cooler_arrays([cooler]), carga, WORKLOAD_PROFILES.get(perfil, 1.0),
+                             a["freq_scale"], 0.0, vent[:, None], permitir_pl2)
+    potencia = np.broadcast_to(res["potencia_aplicada"], (n, m))
+
+    # pré-aquecimento dentro do chassis: calor dos sockets a montante
+    montante = np.cumsum(potencia, axis=1) - potencia
+    preaquecimento = sombreamento * air_rise(montante, fluxo[:, None])
+
+    # cadeia entre chassis do mesmo rack: entrada_i = amb + r·(saída_{i-1} − amb)
+    calor_chassis = potencia.sum(axis=1) + extra
+    dt_chassis = air_rise(calor_chassis, fluxo)
+    posicao = np.arange(n) % por_rack
+    elevacao = np.zeros(n)
+    for p in range(1, min(por_rack, n)):
+        i = np.flatnonzero(posicao == p)
+        elevacao[i] = recirculacao * (elevacao[i - 1] + dt_chassis[i - 1])
+    entrada_chassis = amb + elevacao
+
+    entrada = entrada_chassis[:, None] + preaquecimento
+    temp = np.broadcast_to(res["temp_steady"], (n, m)) + entrada
+    throttle = temp >= THROTTLE_TEMP
+    calor_total = float(calor_chassis.sum())
+    return {
+        "entrada": entrada,
+        "potencia_aplicada": potencia,
+        "util_pct": np.broadcast_to(res["util_pct"], (n, m)),
+        "rpm": np.broadcast_to(res["rpm"], (n, m)),
+        "temp_steady": temp,
+        "throttle": throttle,
+        "chassis": {
+            "rack": np.arange(n) // por_rack,
+            "posicao": posicao,
+            "entrada": entrada_chassis,
+            "saida": entrada_chassis + dt_chassis,
+            "calor_w": calor_chassis,
+            "temp_max": temp.max(axis=1),
+            "throttles": throttle.sum(axis=1),
+        },
+        "totais": {
+            "sockets": n * m,
+            "racks": -(-n // por_rack),
+            "throttles": int(throttle.sum()),
+            "temp_max": float(temp.max()),
+            "temp_media": float(temp.mean()),
+            "calor_w": calor_total,
+            "calor_btu_h": calor_total * W_BTU_H,
+        },
+    }
@@ -0,0 +1,124 @@
+# recomendador.py
+# Recomendação de cooler — PT-BR
+# Avalia todos os coolers do catálogo para um CPU e condição de uso numa única
+# chamada vetorizada e devolve:
+# - a fronteira de Pareto em (temperatura ↓, ruído ↓, durabilidade ↑) e as camadas
+#   seguintes (quão longe da fronteira cada cooler está);
+# - os k melhores que respeitam limites do usuário (°C máx., dB máx.).
+
+import numpy as np
+
+from desempenho import counted
+from motor import cpu_arrays, cooler_arrays, steady_state_batch, batch_args
+
+CRITERIOS = ("equilibrado", "temperatura", "ruido", "durabilidade")
+BLOCO_PARETO = 64       # candidatos promovidos à fronteira por rodada
+
+# ---------------------------
+# PARETO
+# ---------------------------
+def _domina(A, B):
+    """D[i, j] = A[i] domina B[j] (nenhum objetivo pior e pelo menos um melhor; todos minimizados)."""
+    menor_igual = np.ones((len(A), len(B)), dtype=bool)
+    menor = np.zeros((len(A), len(B)), dtype=bool)
+    for j in range(A.shape[1]):
+        menor_igual &= A[:, j, None] <= B[None, :, j]
+        menor |= A[:, j, None] < B[None, :, j]
+    return menor_igual & menor
+
+@counted
+def pareto_front(F):
+    """
+    Máscara dos pontos não dominados de F (n, m), todos os objetivos minimizados.
+    Em ordem lexicográfica um ponto só pode ser dominado por pontos anteriores. Assim,
+    os primeiros BLOCO_PARETO sobreviventes que não se dominam entre si já são da
+    fronteira, e tudo o que eles dominam sai do conjunto antes da próxima rodada.
+    O custo é O(n·|fronteira|) comparações vetorizadas, sem laço por ponto.
+    """
+    F = np.asarray(F, dtype=float)
+    ordem = np.lexsort(F.T[::-1])
+    Fo = F[ordem]
+    vivos = np.arange(len(F))
+    fronteira = []
+    while vivos.size:
+        cand, vivos = vivos[:BLOCO_PARETO], vivos[BLOCO_PARETO:]
+        novos = cand[~_domina(Fo[cand], Fo[cand]).any(axis=0)]
+        fronteira.append(novos)
+        if vivos.size:
+            vivos = vivos[~_domina(Fo[novos], Fo[vivos]).any(axis=0)]
+    mascara = np.zeros(len(F), dtype=bool)
+    if fronteira:
+        mascara[ordem[np.concatenate(fronteira)]] = True
+    return mascara
+
+@counted
+def pareto_ranks(F, max_frentes=None):
+    """Ordenação não dominada: 0 = fronteira de Pareto, 1 = próxima camada, ... (-1 = não classificado)."""
+    F = np.asarray(F, dtype=float)
+    ranks = np.full(len(F), -1, dtype=np.int32)
+    restantes = np.arange(len(F))
+    frente = 0
+    while restantes.size and (max_frentes is None or frente < max_frentes):
+        mask = pareto_front(F[restantes])
+        ranks[restantes[mask]] = frente
+        restantes = restantes[~mask]
+        frente += 1
+    return ranks
+
+# ---------------------------
+# RECOMENDAÇÃO
+# ---------------------------
+def score_coolers(cpu, coolers, params=None):
+    """Resultado de steady_state_batch para um CPU com cada cooler (arrays com shape (n_coolers,))."""
+    a = batch_args(cpu, params)
+    return steady_state_batch(cpu_arrays([cpu]), cooler_arrays(coolers), a["carga_pct"], a["profile"],
+                              a["freq_scale"], a["amb"], a["vent_factor"], a["permitir_pl2"])
+
+def top_k(res, k=5, max_temp=None, max_db=None, criterio="equilibrado"):
+    """
+    Índices dos k melhores coolers que respeitam os limites.
+    - criterio "equilibrado": soma das três métricas normalizadas (0–1) entre os candidatos viáveis;
+      os demais ordenam por uma métrica só (durabilidade desempata pela temperatura).
+    """
+    temp, ruido, dur = res["temp_steady"], res["ruido_db"], res["durabilidade_anos"]
+    viavel = np.ones(temp.shape, dtype=bool)
+    if max_temp is not None:
+        viavel &= temp <= max_temp
+    if max_db is not None:
+        viavel &= ruido <= max_db
+    idx = np.flatnonzero(viavel)
+    if idx.size == 0:
+        return idx
+
+    def norm(x):
+        faixa = x.max() - x.min()
+        return (x - x.min()) / faixa if faixa > 0 else np.zeros_like(x)
+
+    t, r, d = temp[idx], ruido[idx], dur[idx]
+    if criterio == "equilibrado":
+        ordem = np.lexsort((t, norm(t) + norm(r) + norm(-d)))
+    elif criterio == "temperatura":
+        ordem = np.lexsort((r, t))
+    elif criterio == "ruido":
+        ordem = np.lexsort((t, r))
+    elif criterio == "durabilidade":
+        ordem = np.lexsort((t, -d))
+    else:
+        raise ValueError(f"Critério desconhecido: {criterio} (use um de {CRITERIOS})")
+    return idx[ordem[:k]]
+
+@counted
+def recommend(cpu, coolers, params=None, k=5, max_temp=None, max_db=None, criterio="equilibrado"):
+    """
+    Recomendação completa para um CPU: métricas de todos os coolers, camada de Pareto de
+    cada um (0 = fronteira), máscara da fronteira e os índices do top-k sob os limites dados.
+    """
+    res = score_coolers(cpu, coolers, params)
+    F = np.column_stack([res["temp_steady"], res["ruido_db"], -res["durabilidade_anos"]])
+    camadas = pareto_ranks(F)
+    return {
+        "res": res,
+        "camadas": camadas,
+        "pareto": camadas == 0,
+        "top": top_k(res, k, max_temp, max_db, criterio),
+    }
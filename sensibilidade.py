@@ -0,0 +1,191 @@
+# sensibilidade.py
+# Análise de sensibilidade — PT-BR
+# Qual parâmetro pesa mais na temperatura steady em torno do ponto de operação atual:
+# - derivadas parciais em relação a ambiente, ventilação, carga, perfil e frequência,
+#   analíticas (regra da cadeia sobre cpu_power_model / cooling / r_total) e numéricas
+#   (diferença central) para conferência;
+# - faixas "um de cada vez": cada entrada varia sozinha (ambiente ±5 °C, carga ±20 pontos,
+#   frequência ±10 %, todas as ventilações, todos os perfis, todos os coolers) e as outras
+#   ficam no ponto atual — é o que o gráfico tornado mostra.
+# Todos os cenários perturbados vão numa única chamada de steady_state_batch.
+
+import numpy as np
+
+from motor import (
+    WORKLOAD_PROFILES, VENT_FACTORS, BASE_SAFETY_PCT,
+    batch_args, cpu_arrays, cooler_arrays, steady_state_batch,
+)
+from overclock import freq_limits
+
+ENTRADAS = ("amb", "vent_factor", "carga_pct", "profile", "freq_ghz", "cooler")
+ROTULOS = {
+    "amb": "Ambiente (°C)",
+    "vent_factor": "Ventilação (fator)",
+    "carga_pct": "Carga (% TDP)",
+    "profile": "Perfil (fator)",
+    "freq_ghz": "Frequência (GHz)",
+    "cooler": "Cooler",
+}
+# unidade de cada derivada parcial
+UNIDADES = {
+    "amb": "°C/°C",
+    "vent_factor": "°C por 1.0 de fator",
+    "carga_pct": "°C por ponto %",
+    "profile": "°C por 1.0 de fator",
+    "freq_ghz": "°C/GHz",
+}
+# semiamplitude das faixas contínuas e passo das diferenças centrais (grande o bastante para
+# não medir só os degraus de arredondamento da utilização e do RPM)
+FAIXAS = {"amb": 5.0, "carga_pct": 20.0, "freq_pct": 10.0}
+PASSOS = {"amb": 1.0, "vent_factor": 0.05, "carga_pct": 5.0, "profile": 0.05, "freq_ghz": 0.1}
+# limites dos controles da barra lateral
+AMB_MIN, AMB_MAX = 10.0, 45.0
+CARGA_MIN, CARGA_MAX = 10.0, 150.0
+
+# ---------------------------
+# DERIVADAS ANALÍTICAS
+# ---------------------------
+def temperature_gradient(cpu_cols, cooler_cols, carga_pct, profile, freq_scale, amb, vent_factor, permitir_pl2=True,
+                         safety_pct=BASE_SAFETY_PCT, res=None):
+    """
+    Derivadas parciais da temperatura steady (argumentos fazem broadcast, como em steady_state_batch).
+    - chaves: amb, vent_factor, carga_pct, profile, freq_scale, dT_dP (°C por W aplicado) e temp_steady;
+    - usa a forma contínua do modelo: os degraus do RPM (inteiro) e da utilização (0.1 %) são ignorados;
+    - com a potência presa no limite (PL1/PL2), carga, perfil e frequência têm derivada zero;
+    - res: resultado de steady_state_batch já calculado com esses mesmos argumentos (evita refazê-lo).
+    """
+    tdp = cpu_cols["tdp"]
+    if res is None:
+        res = steady_state_batch(cpu_cols, cooler_cols, carga_pct, profile, freq_scale, amb, vent_factor,
+                                 permitir_pl2, safety_pct)
+    p = res["potencia_aplicada"]
+
+    # potência: P = min(idle + dyn + leak, limite)
+    pm = res["potencia_modelo"]
+    livre = (pm > 0) & (pm < np.where(permitir_pl2, cpu_cols["pl2"], cpu_cols["pl1"]))
+    dyn_unit = tdp * 0.80 * np.power(freq_scale, 1.20)
+    dp_carga = np.where(livre, dyn_unit * profile / 100.0, 0.0)
+    dp_perfil = np.where(livre, dyn_unit * carga_pct / 100.0, 0.0)
+    dp_escala = np.where(livre, tdp * (carga_pct / 100.0) * 0.80 * profile * 1.20 * np.power(freq_scale, 0.20)
+                         + 0.02 * tdp * 0.15, 0.0)
+
+    # utilização: u = 100·P / (nv·(1 − dyn_pct)), dyn_pct = min(0.20, 0.15·P/nv)
+    nv = cooler_cols["nominal"] * vent_factor * (1.0 - safety_pct)
+    saturado = 0.15 * p / np.maximum(1.0, nv) >= 0.20
+    folga = nv - 0.15 * p
+    du_dp = np.where(saturado, 125.0 / nv, 100.0 * nv / folga ** 2)
+    du_dnv = np.where(saturado, -125.0 * p / nv ** 2, -100.0 * p / folga ** 2)
+
+    # RPM linear entre 15 % e 100 % de utilização; R_hs' = R_hs·(1500/rpm)^0.8
+    u = res["util_pct"]
+    drpm_du = np.where((u > 15) & (u < 100), (2200 - 600) / 85.0, 0.0)
+    dr_drpm = -0.8 * (res["r_total"] - cpu_cols["r_cs"]) / res["rpm"]
+    dt_du = p * dr_drpm * drpm_du
+
+    dt_dp = res["r_total"] + dt_du * du_dp
+    return {
+        "amb": np.ones_like(p),
+        "vent_factor": dt_du * du_dnv * cooler_cols["nominal"] * (1.0 - safety_pct),
+        "carga_pct": dt_dp * dp_carga,
+        "profile": dt_dp * dp_perfil,
+        "freq_scale": dt_dp * dp_escala,
+        "dT_dP": dt_dp,
+        "temp_steady": res["temp_steady"],
+    }
+
+# ---------------------------
+# ANÁLISE COMPLETA (um par CPU/cooler)
+# ---------------------------
+def sensitivity(cpu, cooler, coolers, params=None, faixas=None):
+    """
+    Sensibilidade da temperatura steady do par cpu/cooler em torno de `params` (chaves de DEFAULT_PARAMS).
+    - derivadas: entrada → {"analitica", "numerica", "elasticidade"} (elasticidade = dT/dx · x / (T − amb));
+    - faixas: uma linha por entrada (ordenadas pela amplitude), com valores/rótulos baixo e alto e a
+      temperatura em cada um; para ventilação, perfil e cooler, baixo/alto são as opções mais fria/quente;
+    - coolers: catálogo usado na faixa "Cooler".
+    """
+    a = batch_args(cpu, params)
+    f = dict(FAIXAS, **(faixas or {}))
+    cpu_cols = cpu_arrays([cpu])
+    base_freq = float(cpu_cols["freq_base"][0])
+    f_min, f_max = (float(x[0]) for x in freq_limits(cpu_cols))
+    ponto = {
+        "amb": float(a["amb"]),
+        "vent_factor": float(a["vent_factor"]),
+        "carga_pct": float(a["carga_pct"]),
+        "profile": float(a["profile"]),
+        "freq_ghz": float(a["freq_scale"]) * (base_freq if base_freq > 0 else 1.0),
+    }
+
+    # cenários: (grupo, rótulo, entradas alteradas, cooler do catálogo ou None)
+    cenarios = [("base", "", {}, None)]
+    for k, h in PASSOS.items():
+        cenarios += [("derivada", k, {k: ponto[k] - h}, None), ("derivada", k, {k: ponto[k] + h}, None)]
+    continuas = {
+        "amb": (max(AMB_MIN, ponto["amb"] - f["amb"]), min(AMB_MAX, ponto["amb"] + f["amb"])),
+        "carga_pct": (max(CARGA_MIN, ponto["carga_pct"] - f["carga_pct"]), min(CARGA_MAX, ponto["carga_pct"] + f["carga_pct"])),
+        "freq_ghz": (max(f_min, ponto["freq_ghz"] * (1 - f["freq_pct"] / 100.0)),
+                     min(f_max, ponto["freq_ghz"] * (1 + f["freq_pct"] / 100.0))),
+    }
+    for k, (lo, hi) in continuas.items():
+        cenarios += [(k, f"{lo:g}", {k: lo}, None), (k, f"{hi:g}", {k: hi}, None)]
+    cenarios += [("vent_factor", nome, {"vent_factor": v}, None) for nome, v in VENT_FACTORS.items()]
+    cenarios += [("profile", nome, {"profile": v}, None) for nome, v in WORKLOAD_PROFILES.items()]
+    todos = cooler_arrays(coolers)
+    nomes_coolers = coolers.modelos() if hasattr(coolers, "modelos") else [c["modelo"] for c in coolers]
+    cenarios += [("cooler", nome, {}, i) for i, nome in enumerate(nomes_coolers)]
+
+    # uma chamada em lote para todos os cenários
+    col = {k: np.array([c[2].get(k, v) for c in cenarios], dtype=float) for k, v in ponto.items()}
+    do_catalogo = np.array([c[3] is not None for c in cenarios])
+    idx = np.array([c[3] or 0 for c in cenarios], dtype=np.intp)
+    atual = cooler_arrays([cooler])
+    cooler_cols = {k: np.where(do_catalogo, todos[k][idx], atual[k][0]) for k in atual}
+    escala = col["freq_ghz"] / base_freq if base_freq > 0 else np.ones_like(col["freq_ghz"])
+    res = steady_state_batch(cpu_cols, cooler_cols, col["carga_pct"], col["profile"], escala,
+                             col["amb"], col["vent_factor"], a["permitir_pl2"])
+    temp = res["temp_steady"]
+    grupo = np.array([c[0] for c in cenarios])
+    rotulo = [c[1] for c in cenarios]
+    t_base = float(temp[0])
+
+    # derivadas (o cenário 0 é o ponto atual: reaproveita o resultado do lote)
+    grad = temperature_gradient(cpu_cols, atual, ponto["carga_pct"], ponto["profile"], float(escala[0]),
+                                ponto["amb"], ponto["vent_factor"], a["permitir_pl2"],
+                                res={k: v[:1] for k, v in res.items()})
+    grad["freq_ghz"] = grad["freq_scale"] / base_freq if base_freq > 0 else np.zeros_like(grad["freq_scale"])
+    derivadas = {}
+    t_deriv = temp[grupo == "derivada"].reshape(-1, 2)
+    for (k, h), (t_menos, t_mais) in zip(PASSOS.items(), t_deriv):
+        analitica = float(grad[k][0])
+        derivadas[k] = {
+            "analitica": analitica,
+            "numerica": float((t_mais - t_menos) / (2 * h)),
+            "elasticidade": analitica * ponto[k] / (t_base - ponto["amb"]) if t_base != ponto["amb"] else 0.0,
+        }
+
+    # faixas um de cada vez
+    linhas = []
+    for k in ENTRADAS:
+        sel = np.flatnonzero(grupo == k)
+        if k in continuas:
+            i_lo, i_hi = sel[0], sel[1]
+        else:
+            i_lo, i_hi = sel[np.argmin(temp[sel])], sel[np.argmax(temp[sel])]
+        linhas.append({
+            "entrada": k,
+            "baixo": rotulo[i_lo],
+            "alto": rotulo[i_hi],
+            "temp_baixo": float(temp[i_lo]),
+            "temp_alto": float(temp[i_hi]),
+            "amplitude": float(abs(temp[i_hi] - temp[i_lo])),
+        })
+    linhas.sort(key=lambda r: r["amplitude"], reverse=True)
+
+    return {
+        "ponto": ponto,
+        "temp_base": t_base,
+        "derivadas": derivadas,
+        "faixas": linhas,
+        "n_cenarios": len(cenarios),
+    }
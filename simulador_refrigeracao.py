@@ -2,252 +2,152 @@
 # Simulador único — PT-BR
 # Uso: pip install streamlit matplotlib numpy pandas
 # streamlit run simulador_refrigeracao_unico_ptbr.py
+#
+# Esta é apenas a camada de interface: o modelo térmico fica em motor.py e o
+# catálogo em catalogo.py (arquivos em dados/), ambos importáveis sem Streamlit.
+# pandas e matplotlib só são importados quando uma tabela/gráfico é exibido; as
+# imagens vêm de graficos.py (sem pyplot) e ficam em cache pelas entradas.
+# O bloco "Simular" tem ainda um segundo nível de cache em disco (cache_disco.py),
+# compartilhado entre sessões e reinícios do servidor.
+
+import os
+import time
 
 import streamlit as st
 import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from math import sqrt
+
+from motor import (
+    WORKLOAD_PROFILES, VENT_FACTORS, THROTTLE_TEMP, HOTSPOT_AMD_C,
+    simulate, summary_record, compatibility_matrix,
+)
+from catalogo import CPUS, COOLERS
+from acoplado import FAN_CURVE, FUGA_TERMICA, LIMITE_ITERACOES, parse_fan_curve, solve_coupled
+from overclock import MOTIVOS, oc_headroom_table
+from recomendador import CRITERIOS, recommend
+from graficos import (
+    BACKENDS, temp_power_curve, temp_power_png, power_capacity_png,
+    transient_png, histogram_png, heatmap_png, heatmap_chart, tornado_png, tornado_chart, contour_png,
+)
+from cache_disco import ARQUIVOS_MODELO, model_version, quantize_params, default_cache
+import desempenho
+from desempenho import span
 
 st.set_page_config(page_title="Simulador de Refrigeração — PT-BR", layout="wide")
-st.title("Simulador de Refrigeração de CPU (PT-BR)")
-st.markdown("Selecione **arquitetura → CPU**, cooler, condição do gabinete e a frequência desejada (para overclock). Explicações em português abaixo.")
 
-# ---------------------------
-# DADOS (CPUS e COOLERS: sua lista completa)
-# ---------------------------
-CPUS = [
-    {"modelo":"AMD Ryzen 5 1600X","tdp":95,"ano":2017,"socket":"AM4","frequencia_base":3.6,"frequencia_turbo":4.0,"arquitetura":"Zen","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 3600","tdp":65,"ano":2019,"socket":"AM4","frequencia_base":3.6,"frequencia_turbo":4.2,"arquitetura":"Zen 2","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 5600","tdp":65,"ano":2021,"socket":"AM4","frequencia_base":3.5,"frequencia_turbo":4.4,"arquitetura":"Zen 3","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 5600X","tdp":65,"ano":2020,"socket":"AM4","frequencia_base":3.7,"frequencia_turbo":4.6,"arquitetura":"Zen 3","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 5600X3D","tdp":105,"ano":2022,"socket":"AM4","frequencia_base":3.3,"frequencia_turbo":4.4,"arquitetura":"Zen 3 (3D)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 5500X3D","tdp":105,"ano":2024,"socket":"AM4","frequencia_base":3.0,"frequencia_turbo":4.0,"arquitetura":"Zen 3 (3D)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 7400F","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":3.7,"frequencia_turbo":4.7,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 7500F","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":3.7,"frequencia_turbo":5.0,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 7600","tdp":65,"ano":2022,"socket":"AM5","frequencia_base":3.8,"frequencia_turbo":5.1,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 7600X","tdp":105,"ano":2022,"socket":"AM5","frequencia_base":4.7,"frequencia_turbo":5.3,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 7600X3D","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":4.1,"frequencia_turbo":4.7,"arquitetura":"Zen 4 (3D)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 8400F","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":4.2,"frequencia_turbo":4.7,"arquitetura":"Zen 5","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 8500G","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":3.5,"frequencia_turbo":5.0,"arquitetura":"Zen 5 (G)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 8600G","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":4.3,"frequencia_turbo":5.0,"arquitetura":"Zen 5 (G)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 5 9600X","tdp":65,"ano":2024,"socket":"AM5","frequencia_base":3.9,"frequencia_turbo":5.4,"arquitetura":"Zen 5","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 7 7700","tdp":65,"ano":2023,"socket":"AM5","frequencia_base":3.8,"frequencia_turbo":5.3,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 7 7700X","tdp":105,"ano":2023,"socket":"AM5","frequencia_base":4.5,"frequencia_turbo":5.4,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 7 5800X","tdp":105,"ano":2020,"socket":"AM4","frequencia_base":3.8,"frequencia_turbo":4.7,"arquitetura":"Zen 3","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 7 5800X3D","tdp":105,"ano":2022,"socket":"AM4","frequencia_base":3.4,"frequencia_turbo":4.5,"arquitetura":"Zen 3 (3D)","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 9 5900X","tdp":105,"ano":2020,"socket":"AM4","frequencia_base":3.7,"frequencia_turbo":4.8,"arquitetura":"Zen 3","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 9 5950X","tdp":105,"ano":2020,"socket":"AM4","frequencia_base":3.4,"frequencia_turbo":4.9,"arquitetura":"Zen 3","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 9 7950X","tdp":170,"ano":2022,"socket":"AM5","frequencia_base":4.5,"frequencia_turbo":5.7,"arquitetura":"Zen 4","fabricante":"AMD"},
-    {"modelo":"AMD Ryzen 9 7950X3D","tdp":120,"ano":2023,"socket":"AM5","frequencia_base":4.2,"frequencia_turbo":5.7,"arquitetura":"Zen 4 (3D)","fabricante":"AMD"},
-    {"modelo":"Intel Core 2 Duo E8400","tdp":65,"ano":2008,"socket":"LGA775","frequencia_base":3.0,"frequencia_turbo":3.0,"arquitetura":"Core (65nm)","fabricante":"Intel"},
-    {"modelo":"Intel Core i3-530","tdp":73,"ano":2010,"socket":"LGA1156","frequencia_base":2.93,"frequencia_turbo":3.06,"arquitetura":"Clarksfield","fabricante":"Intel"},
-    {"modelo":"Intel Core i3-3240","tdp":55,"ano":2012,"socket":"LGA1155","frequencia_base":3.4,"frequencia_turbo":3.4,"arquitetura":"Ivy Bridge","fabricante":"Intel"},
-    {"modelo":"Intel Core i7-920","tdp":130,"ano":2008,"socket":"LGA1366","frequencia_base":2.66,"frequencia_turbo":2.93,"arquitetura":"Nehalem","fabricante":"Intel"},
-    {"modelo":"Intel Core i3-6100","tdp":51,"ano":2015,"socket":"LGA1151","frequencia_base":3.7,"frequencia_turbo":3.7,"arquitetura":"Skylake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-6600K","tdp":91,"ano":2015,"socket":"LGA1151","frequencia_base":3.5,"frequencia_turbo":3.9,"arquitetura":"Skylake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-8400","tdp":65,"ano":2018,"socket":"LGA1151","frequencia_base":2.8,"frequencia_turbo":4.0,"arquitetura":"Coffee Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-10400F","tdp":65,"ano":2020,"socket":"LGA1200","frequencia_base":2.9,"frequencia_turbo":4.3,"arquitetura":"Comet Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-10600K","tdp":125,"ano":2020,"socket":"LGA1200","frequencia_base":4.1,"frequencia_turbo":4.8,"arquitetura":"Comet Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-12400F","tdp":65,"ano":2022,"socket":"LGA1700","frequencia_base":2.5,"frequencia_turbo":4.4,"arquitetura":"Alder Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-13400F","tdp":65,"ano":2023,"socket":"LGA1700","frequencia_base":2.5,"frequencia_turbo":4.6,"arquitetura":"Raptor Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i5-14600K","tdp":180,"ano":2024,"socket":"LGA1700","frequencia_base":3.1,"frequencia_turbo":5.1,"arquitetura":"Raptor Lake Refresh","fabricante":"Intel"},
-    {"modelo":"Intel Core i7-11700K","tdp":125,"ano":2021,"socket":"LGA1200","frequencia_base":3.6,"frequencia_turbo":5.0,"arquitetura":"Rocket Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i7-12700K","tdp":190,"ano":2022,"socket":"LGA1700","frequencia_base":3.6,"frequencia_turbo":5.0,"arquitetura":"Alder Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i7-13700K","tdp":250,"ano":2023,"socket":"LGA1700","frequencia_base":3.4,"frequencia_turbo":5.4,"arquitetura":"Raptor Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i9-10900K","tdp":125,"ano":2020,"socket":"LGA1200","frequencia_base":3.7,"frequencia_turbo":5.3,"arquitetura":"Comet Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i9-12900K","tdp":240,"ano":2022,"socket":"LGA1700","frequencia_base":3.2,"frequencia_turbo":5.2,"arquitetura":"Alder Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i9-13900K","tdp":250,"ano":2023,"socket":"LGA1700","frequencia_base":3.0,"frequencia_turbo":5.8,"arquitetura":"Raptor Lake","fabricante":"Intel"},
-    {"modelo":"Intel Core i9-14900K","tdp":250,"ano":2024,"socket":"LGA1700","frequencia_base":3.2,"frequencia_turbo":6.0,"arquitetura":"Raptor Lake Refresh","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2666 v3","tdp":115,"ano":2014,"socket":"LGA2011-v3","frequencia_base":2.9,"frequencia_turbo":3.5,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2667 v3","tdp":135,"ano":2014,"socket":"LGA2011-v3","frequencia_base":3.2,"frequencia_turbo":3.6,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2667 v4","tdp":160,"ano":2016,"socket":"LGA2011-v3","frequencia_base":3.2,"frequencia_turbo":3.7,"arquitetura":"Broadwell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2680 v4","tdp":120,"ano":2016,"socket":"LGA2011-v3","frequencia_base":2.4,"frequencia_turbo":3.3,"arquitetura":"Broadwell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-1660 v3","tdp":140,"ano":2014,"socket":"LGA2011-v3","frequencia_base":3.0,"frequencia_turbo":3.7,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2680 v3","tdp":135,"ano":2014,"socket":"LGA2011-v3","frequencia_base":2.5,"frequencia_turbo":3.3,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2690 v3","tdp":135,"ano":2014,"socket":"LGA2011-v3","frequencia_base":2.6,"frequencia_turbo":3.5,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2670 v3","tdp":120,"ano":2014,"socket":"LGA2011-v3","frequencia_base":2.3,"frequencia_turbo":3.1,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"Intel Xeon E5-2699 v4","tdp":145,"ano":2016,"socket":"LGA2011-v3","frequencia_base":2.2,"frequencia_turbo":3.6,"arquitetura":"Broadwell-EP","fabricante":"Intel"},
-    # Novo: Intel Xeon E5-1630 (adicionado conforme pedido)
-    {"modelo":"Intel Xeon E5-1630 v3","tdp":140,"ano":2014,"socket":"LGA2011-v3","frequencia_base":3.7,"frequencia_turbo":3.7,"arquitetura":"Haswell-EP","fabricante":"Intel"},
-    {"modelo":"AMD FX-8350","tdp":125,"ano":2012,"socket":"AM3+","frequencia_base":4.0,"frequencia_turbo":4.2,"arquitetura":"Piledriver","fabricante":"AMD"},
-]
-
-COOLERS = [
-    {"modelo":"SuperFrame SuperFlow 450 (Air)","tipo":"Air","tdp_manufacturer":95,"ruido_db":25,"durabilidade_anos":4},
-    {"modelo":"Gamdias Boreas E1-410 (Air)","tipo":"Air","tdp_manufacturer":95,"ruido_db":28,"durabilidade_anos":4},
-    {"modelo":"TGT Glacier 120 (Air)","tipo":"Air","tdp_manufacturer":100,"ruido_db":36,"durabilidade_anos":3},
-    {"modelo":"DeepCool Gammaxx 400 (Air)","tipo":"Air","tdp_manufacturer":120,"ruido_db":38,"durabilidade_anos":4},
-    {"modelo":"Redragon TYR (Air)","tipo":"Air","tdp_manufacturer":130,"ruido_db":22,"durabilidade_anos":4},
-    {"modelo":"Cooler Master Hyper 212 (Air)","tipo":"Air","tdp_manufacturer":150,"ruido_db":35,"durabilidade_anos":5},
-    {"modelo":"DeepCool AK500S (Air)","tipo":"Air","tdp_manufacturer":150,"ruido_db":28,"durabilidade_anos":6},
-    {"modelo":"Thermalright TRUE Spirit 140 (Air)","tipo":"Air","tdp_manufacturer":200,"ruido_db":28,"durabilidade_anos":6},
-    {"modelo":"Arctic Freezer 34 (Air)","tipo":"Air","tdp_manufacturer":180,"ruido_db":28,"durabilidade_anos":5},
-    {"modelo":"DeepCool AK400 (Air)","tipo":"Air","tdp_manufacturer":220,"ruido_db":29,"durabilidade_anos":6},
-    {"modelo":"DeepCool Gammaxx AG400 (Air)","tipo":"Air","tdp_manufacturer":220,"ruido_db":28,"durabilidade_anos":4},
-    {"modelo":"GameMax Sigma 520 (Air)","tipo":"Air","tdp_manufacturer":220,"ruido_db":30,"durabilidade_anos":5},
-    {"modelo":"Rise Mode Storm 8 (Air)","tipo":"Air","tdp_manufacturer":280,"ruido_db":30,"durabilidade_anos":5},
-    {"modelo":"Be Quiet! Dark Rock Pro 4 (Air)","tipo":"Air","tdp_manufacturer":250,"ruido_db":24,"durabilidade_anos":7},
-    {"modelo":"Noctua NH-D15 (Air)","tipo":"Air","tdp_manufacturer":250,"ruido_db":24,"durabilidade_anos":8},
-    {"modelo":"DeepCool AK620 (Air)","tipo":"Air","tdp_manufacturer":260,"ruido_db":28,"durabilidade_anos":6},
-    {"modelo":"Rise Mode Black 240 (Water)","tipo":"AIO","tdp_manufacturer":250,"ruido_db":30,"durabilidade_anos":5},
-    {"modelo":"GameMax IceBurg 240 (Water)","tipo":"AIO","tdp_manufacturer":245,"ruido_db":31,"durabilidade_anos":6},
-    {"modelo":"Corsair H100i (AIO 240) (Water)","tipo":"AIO","tdp_manufacturer":300,"ruido_db":28,"durabilidade_anos":6},
-    {"modelo":"Arctic Liquid Freezer II 240","tipo":"AIO","tdp_manufacturer":320,"ruido_db":27,"durabilidade_anos":7},
-    {"modelo":"TGT Storm 240 (Water)","tipo":"AIO","tdp_manufacturer":280,"ruido_db":33,"durabilidade_anos":5},
-    {"modelo":"DeepCool LS720 (AIO 360) (Water)","tipo":"AIO","tdp_manufacturer":300,"ruido_db":32,"durabilidade_anos":7},
-    {"modelo":"Corsair H150i (AIO 360)","tipo":"AIO","tdp_manufacturer":350,"ruido_db":30,"durabilidade_anos":7},
-    {"modelo":"NZXT Kraken X63 (AIO 280)","tipo":"AIO","tdp_manufacturer":350,"ruido_db":29,"durabilidade_anos":7},
-    {"modelo":"DeepCool Castle 360EX (AIO 360)","tipo":"AIO","tdp_manufacturer":350,"ruido_db":31,"durabilidade_anos":7},
-    {"modelo":"Rise Mode Gamer Black 240 (AIO)","tipo":"AIO","tdp_manufacturer":220,"ruido_db":28,"durabilidade_anos":6},
-    {"modelo":"Pichau AIO 240 (Water)","tipo":"AIO","tdp_manufacturer":270,"ruido_db":34,"durabilidade_anos":5},
-    {"modelo":"Husky Hunter 240 (AIO)","tipo":"AIO","tdp_manufacturer":260,"ruido_db":33,"durabilidade_anos":5},
-
-    # NOVOS AIR COOLERS (adicionados conforme pedido)
-    {"modelo":"NX400 Montech (Air)","tipo":"Air","tdp_manufacturer":90,"ruido_db":30,"durabilidade_anos":3},
-    {"modelo":"Gamdias Boreas (Air)","tipo":"Air","tdp_manufacturer":95,"ruido_db":31,"durabilidade_anos":4},
-    {"modelo":"Boreas E2 410 (Air)","tipo":"Air","tdp_manufacturer":100,"ruido_db":31,"durabilidade_anos":4},
-    {"modelo":"Rise Mode Z2 Pro (Air)","tipo":"Air","tdp_manufacturer":110,"ruido_db":29,"durabilidade_anos":4},
-    {"modelo":"Gamemax Sigma 520 Digital N2 (Air)","tipo":"Air","tdp_manufacturer":130,"ruido_db":32,"durabilidade_anos":4},
-    {"modelo":"Rise Mode Winter Black (Air)","tipo":"Air","tdp_manufacturer":140,"ruido_db":30,"durabilidade_anos":5},
-    {"modelo":"Cooler Master Hyper 212 Spectrum V3 (Air)","tipo":"Air","tdp_manufacturer":150,"ruido_db":34,"durabilidade_anos":5},
-    {"modelo":"PCYES Frost Pulse Black (Air)","tipo":"Air","tdp_manufacturer":160,"ruido_db":33,"durabilidade_anos":5},
-    {"modelo":"Pichau Falcon (Air)","tipo":"Air","tdp_manufacturer":170,"ruido_db":34,"durabilidade_anos":5},
-    {"modelo":"Air Cooler Boreas E2-410 (Air)","tipo":"Air","tdp_manufacturer":100,"ruido_db":31,"durabilidade_anos":4},
-
-    # NOVOS WATER COOLERS (AIO)
-    {"modelo":"Water Cooler Gamer Rise Mode Black ARGB 120mm (AIO)","tipo":"AIO","tdp_manufacturer":180,"ruido_db":32,"durabilidade_anos":4},
-    {"modelo":"Water Cooler Tgt Spartel V3 Rainbow 120mm (AIO)","tipo":"AIO","tdp_manufacturer":170,"ruido_db":33,"durabilidade_anos":4},
-    {"modelo":"Water Cooler Pichau Aqua 240S (AIO)","tipo":"AIO","tdp_manufacturer":260,"ruido_db":34,"durabilidade_anos":5},
-    {"modelo":"Water Cooler Gamer Ninja Yuki ARGB 120mm (AIO)","tipo":"AIO","tdp_manufacturer":175,"ruido_db":31,"durabilidade_anos":4},
-    {"modelo":"Water Cooler Husky Icy Comet (AIO)","tipo":"AIO","tdp_manufacturer":200,"ruido_db":33,"durabilidade_anos":5},
-    {"modelo":"Water Cooler Husky Glacier (AIO)","tipo":"AIO","tdp_manufacturer":230,"ruido_db":33,"durabilidade_anos":5},
-    {"modelo":"Water Cooler PCYES Nix 2 120mm (AIO)","tipo":"AIO","tdp_manufacturer":165,"ruido_db":32,"durabilidade_anos":4},
-]
-
-# ajuste prático do nominal do cooler (eficiência prática)
-for c in COOLERS:
-    c["tdp_nominal"] = round(0.85 * c.get("tdp_manufacturer", 0.0), 1)
+# medição de desempenho deste rerun (ligada no painel "Desempenho", no fim da página)
+PERF_HISTORICO = 50         # reruns medidos guardados na sessão para exportação
+coletor_perf = None
+if st.session_state.get("perf_ativo"):
+    coletor_perf = desempenho.start(desempenho.Collector(
+        rotulo=f"rerun {len(st.session_state.get('perf_historico', ())) + 1}",
+        perfil=st.session_state.get("perf_cprofile", False),
+        memoria=st.session_state.get("perf_tracemalloc", False),
+    ))
 
-# ---------------------------
-# PERFIS e PARÂMETROS
-# ---------------------------
-BASE_SAFETY_PCT = 0.10
-WORKLOAD_PROFILES = {
-    "Idle / Leve": 0.15,
-    "Navegação / Escritório": 0.30,
-    "Jogos (típico)": 0.55,
-    "Bench sustentado (Cinebench)": 1.00,
-    "AVX/Prime (pesado)": 1.30
-}
+st.title("Simulador de Refrigeração de CPU (PT-BR)")
+st.markdown("Selecione **arquitetura → CPU**, cooler, condição do gabinete e a frequência desejada (para overclock). Explicações em português abaixo.")
 
 # ---------------------------
-# FUNÇÕES (explicadas)
+# CACHE (dados derivados do catálogo e resultados)
 # ---------------------------
-def avg_freq(cpu):
-    return (cpu.get("frequencia_base", 3.5) + cpu.get("frequencia_turbo", 3.5)) / 2.0
-
-def cpu_power_model(tdp, carga_pct, profile, freq_scale=1.0):
-    """
-    Modelo heurístico de potência:
-    - idle: fração do TDP
-    - dyn: parte dinâmica proporcional a carga, perfil e escala de frequência.
-      aqui aplicamos um expoente (>1) para refletir que overclock (freq+voltagem)
-      aumenta consumo mais que linearmente.
-    - leak: leakage aumenta com frequência/voltagem (simplesmente modelado).
-    """
-    idle = 0.10 * tdp
-    dyn = tdp * (carga_pct / 100.0) * (0.80 * profile) * (freq_scale ** 1.20)
-    leak = 0.02 * tdp * (1 + 0.15 * (freq_scale - 1.0))
-    return max(0.0, idle + dyn + leak)
-
-def compute_PLs(cpu):
-    t = cpu.get("tdp", 65)
-    y = cpu.get("ano", 2018)
-    if y >= 2022:
-        return round(t * 1.2, 1), round(t * 1.8, 1), 28.0
-    if y >= 2017:
-        return round(t * 1.05, 1), round(t * 1.4, 1), 20.0
-    return round(t * 1.0, 1), round(t * 1.2, 1), 10.0
-
-def derive_rth_heatsink(c):
-    nome = c.get("modelo", "").lower()
-    tipo = c.get("tipo", "air").lower()
-    if tipo == "aio":
-        if "360" in nome: return 0.07
-        if "280" in nome: return 0.09
-        if "240" in nome or "h100" in nome: return 0.11
-        return 0.10
-    premium = ["noctua", "dark rock", "true spirit", "ak620"]
-    if "hyper 212" in nome: return 0.16
-    if any(k in nome for k in premium): return 0.12
-    if any(k in nome for k in ["gammaxx", "superframe", "gamedias", "glacier", "tyr"]): return 0.18
-    return 0.18
-
-def cpu_r_cs(cpu):
-    fab = cpu.get("fabricante", "Intel").lower()
-    ano = cpu.get("ano", 2018)
-    if fab == "amd": return 0.25
-    if ano >= 2022: return 0.20
-    if ano >= 2015: return 0.22
-    return 0.30
-
-def fan_rpm(util):
-    idle, maxr = 600, 2200
-    u = max(0.0, min(100.0, util))
-    return idle if u <= 15 else int(idle + (maxr - idle) * ((u - 15) / 85.0))
-
-def r_total(cpu, cooler, rpm):
-    Rcs = cpu_r_cs(cpu)
-    Rhs = derive_rth_heatsink(cooler)
-    rpm_ref = 1500.0
-    if rpm <= 0: rpm = rpm_ref
-    Rhs_adj = Rhs * (rpm_ref / rpm) ** 0.8
-    return Rcs + Rhs_adj
-
-def estimate_noise(cooler, util):
-    base = cooler.get("ruido_db", 30)
-    return round(base * (0.6 + 0.4 * sqrt(min(1.0, util / 100.0))), 1)
-
-def estimate_durability(cooler, util):
-    b = cooler.get("durabilidade_anos", 5)
-    if util <= 80: return b
-    exc = (util - 80) / 20.0
-    return max(1, int(b * (1.0 - 0.5 * exc)))
+@st.cache_data
+def arquiteturas():
+    return CPUS.valores("arquitetura")
+
+@st.cache_data
+def cpu_options(arch):
+    """Modelos (valores do selectbox) e rótulos exibidos, filtrados por arquitetura."""
+    pos = None if arch == "(todas)" else CPUS.where("arquitetura", arch)
+    modelos = CPUS.modelos(pos)
+    anos = CPUS.colunas["ano"] if pos is None else CPUS.colunas["ano"][pos]
+    return modelos, {m: f'{m} — {a}' for m, a in zip(modelos, anos)}
+
+@st.cache_data
+def cooler_options(cooler_type):
+    """Coolers ordenados por capacidade prática (tdp_nominal), filtrados por tipo."""
+    pos = np.arange(len(COOLERS)) if cooler_type == "Todos" else COOLERS.where("tipo", cooler_type)
+    if pos.size == 0:
+        pos = np.arange(len(COOLERS))
+    pos = pos[np.argsort(COOLERS.colunas["nominal"][pos], kind="stable")]
+    modelos = COOLERS.modelos(pos)
+    return modelos, {m: f'{m} — {t}' for m, t in zip(modelos, COOLERS.colunas["tipo"][pos])}
+
+# versões do modelo (uma vez por rerun) usadas nas chaves do cache em disco e das superfícies
+# (gráficos dependem também de graficos.py)
+VERSAO_SIMULACAO = model_version(*ARQUIVOS_MODELO)
+VERSAO_GRAFICOS = model_version(*ARQUIVOS_MODELO, os.path.join(os.path.dirname(os.path.abspath(__file__)), "graficos.py"))
+
+@st.cache_data
+def cached_simulate(cpu_modelo, cooler_modelo, params):
+    return default_cache().get_or_compute(
+        "simular", VERSAO_SIMULACAO, [cpu_modelo, cooler_modelo, params],
+        lambda: simulate(CPUS.get(cpu_modelo), COOLERS.get(cooler_modelo), params),
+    )
+
+@st.cache_data(max_entries=256)
+def simulate_images(cpu_modelo, cooler_modelo, params):
+    """PNGs dos dois gráficos do bloco "Simular" (temperatura × potência e potência × capacidade)."""
+    def renderizar():
+        res = cached_simulate(cpu_modelo, cooler_modelo, params)
+        return (
+            temp_power_png(res["tdp_ref"], res["potencia_aplicada"], res["temp_steady"], res["r_total"],
+                           params["amb"], HOTSPOT_AMD_C if res["hotspot"] else 0.0),
+            power_capacity_png(res["potencia_aplicada"], res["cap_eff"]),
+        )
+    return default_cache().get_or_compute("simular: gráficos", VERSAO_GRAFICOS, [cpu_modelo, cooler_modelo, params], renderizar)
+
+@st.cache_data
+def matrix_table(ambientes, carga_pct, freq_scale, permitir_pl2):
+    """Matriz de compatibilidade completa em formato longo (DataFrame com MultiIndex)."""
+    import pandas as pd
+    matriz = compatibility_matrix(CPUS, COOLERS, ambientes=ambientes, carga_pct=carga_pct,
+                                  freq_scale=freq_scale, permitir_pl2=permitir_pl2)
+    eixos = matriz["eixos"]
+    idx = pd.MultiIndex.from_product(
+        [eixos["cpu"], eixos["cooler"], eixos["perfil"], eixos["ambiente"], eixos["ventilacao"]],
+        names=["cpu", "cooler", "perfil", "ambiente_C", "ventilacao"],
+    )
+    return pd.DataFrame({
+        "temp_steady_C": matriz["temp_steady"].ravel().round(1),
+        "util_pct": matriz["util_pct"].ravel(),
+        "rpm": matriz["rpm"].ravel().astype(int),
+        "ruido_db": matriz["ruido_db"].ravel(),
+        "throttle": matriz["throttle"].ravel(),
+    }, index=idx)
+
+@st.cache_data
+def headroom_table(carga_pct, perfil, amb, vent, temp_limite, permitir_pl2):
+    """Headroom de overclock de todo o catálogo, em formato longo (uma linha por par CPU/cooler)."""
+    import pandas as pd
+    r = oc_headroom_table(CPUS, COOLERS, carga_pct, perfil, amb, vent, temp_limite, permitir_pl2)
+    idx = pd.MultiIndex.from_product([r["eixos"]["cpu"], r["eixos"]["cooler"]], names=["cpu", "cooler"])
+    return pd.DataFrame({
+        "freq_max_GHz": r["freq_max_ghz"].ravel().round(3),
+        "headroom_GHz": r["headroom_ghz"].ravel().round(3),
+        "temp_C": r["temp_steady"].ravel().round(1),
+        "pot_aplicada_W": r["potencia_aplicada"].ravel().round(1),
+        "limitado_por": [MOTIVOS[k] for k in r["motivo"].ravel()],
+    }, index=idx)
 
 # ---------------------------
 # UI: seleção por ARQUITETURA então CPU
 # ---------------------------
-arqus = sorted({c["arquitetura"] for c in CPUS})
 st.sidebar.markdown("### Seleção rápida")
-arch = st.sidebar.selectbox("Arquitetura", ["(todas)"] + arqus, index=0)
-filtered = CPUS if arch == "(todas)" else [c for c in CPUS if c["arquitetura"] == arch]
-cpu_modelos = [f'{c["modelo"]} — {c["ano"]}' for c in filtered]
-cpu_choice = st.sidebar.selectbox("CPU (filtrada por arquitetura)", cpu_modelos)
-# map back
-cpu = next((filtered[i] for i, v in enumerate(cpu_modelos) if v == cpu_choice), filtered[0] if filtered else None)
-
-# filtro de tipo de cooler
-cooler_type = st.sidebar.selectbox("Tipo de cooler", ("Todos", "Air", "AIO"))
-
-# ordenar coolers por capacidade prática (tdp_nominal)
-coolers_sorted = sorted(COOLERS, key=lambda x: x.get("tdp_nominal", 0.0))
-if cooler_type == "Air":
-    coolers_display = [c for c in coolers_sorted if c.get("tipo", "Air").upper() == "AIR"]
-elif cooler_type == "AIO":
-    coolers_display = [c for c in coolers_sorted if c.get("tipo", "AIO").upper() == "AIO"]
-else:
-    coolers_display = coolers_sorted
-
-cooler_choice_label = [f'{c["modelo"]} — {c.get("tipo","Air")}' for c in coolers_display]
-if not cooler_choice_label:
-    cooler_choice_label = [f'{c["modelo"]} — {c.get("tipo","Air")}' for c in coolers_sorted]
-cooler_choice = st.sidebar.selectbox("Cooler (ordenado do pior ao melhor)", cooler_choice_label)
-cooler = next((c for c in coolers_display if f'{c["modelo"]} — {c.get("tipo","Air")}' == cooler_choice), coolers_sorted[0])
+with span("catálogo: filtros e seleção"):
+    arch = st.sidebar.selectbox("Arquitetura", ["(todas)"] + arquiteturas(), index=0)
+    cpu_modelos, cpu_labels = cpu_options(arch)
+    cpu_choice = st.sidebar.selectbox("CPU (filtrada por arquitetura)", cpu_modelos, format_func=cpu_labels.get)
+    cpu = CPUS.get(cpu_choice)
+
+    # filtro de tipo de cooler
+    cooler_type = st.sidebar.selectbox("Tipo de cooler", ("Todos", "Air", "AIO"))
+    cooler_modelos, cooler_labels = cooler_options(cooler_type)
+    cooler_choice = st.sidebar.selectbox("Cooler (ordenado do pior ao melhor)", cooler_modelos, format_func=cooler_labels.get)
+    cooler = COOLERS.get(cooler_choice)
 
 # condição do gabinete
-vent = st.sidebar.selectbox("Condição do gabinete", ("Bem ventilado", "Moderado", "Pouco ventilado"))
-vent_factor = 1.0 if vent == "Bem ventilado" else (0.92 if vent == "Moderado" else 0.85)
+vent = st.sidebar.selectbox("Condição do gabinete", tuple(VENT_FACTORS))
+vent_factor = VENT_FACTORS[vent]
 
 # parâmetros principais
 amb = st.sidebar.number_input("Temperatura ambiente (°C)", 10.0, 45.0, 25.0, 0.5)
@@ -290,6 +190,8 @@ st.sidebar.caption(f"Permitido: {min_freq_allowed:.2f} — {max_freq_allowed:.2f
 
 permitir_pl2 = st.sidebar.checkbox("Permitir burst PL2 (se aplicável)", value=True)
 mostrar_graf = st.sidebar.checkbox("Mostrar gráfico detalhado", value=True)
+backend_graf = st.sidebar.radio("Gráficos", BACKENDS, horizontal=True,
+                                help="matplotlib: imagem estática em cache • nativo: gráficos interativos leves do navegador")
 
 # legendas / explicações
 with st.expander("Legenda e como funciona (resumo)"):
@@ -309,109 +211,571 @@ if st.button("Simular"):
     if cpu is None or cooler is None:
         st.error("Selecione CPU e cooler válidos.")
     else:
-        tdp_ref = cpu["tdp"]
-        perfil_f = WORKLOAD_PROFILES.get(perfil, 1.0)
-
-        # base e turbo para exibir
-        base_freq = cpu.get("frequencia_base", 0.0)
-        turbo_freq = cpu.get("frequencia_turbo", base_freq)
-
-        # usamos a frequência definida pelo usuário (sem cap)
-        freq_used = float(freq_user)
-        # escala efetiva relativa à base (para o modelo)
-        freq_scale_for_calc = (freq_used / base_freq) if base_freq > 0 else 1.0
-
-        # potência/modelo usa o fator de frequência efetivo (com expoente >1 para OC)
-        potencia_modelo = cpu_power_model(tdp_ref, carga, perfil_f, freq_scale_for_calc)
-        PL1, PL2, TAU = compute_PLs(cpu)
-        potencia_aplicada = min(potencia_modelo, PL2 if permitir_pl2 else PL1)
-
-        # capacidade do cooler ajustada por ventilação e margem de segurança
-        nominal = cooler.get("tdp_nominal", round(0.85 * cooler.get("tdp_manufacturer", 0.0), 1))
-        nominal_v = nominal * vent_factor * (1.0 - BASE_SAFETY_PCT)
-
-        # dinâmica de redução: se power próxima do nominal, desempenho/prática cai
-        dyn_pct = min(0.20, 0.15 * (potencia_aplicada / max(1.0, nominal_v)))
-        cap_eff = nominal_v * (1.0 - dyn_pct)
-
-        util_pct = round((potencia_aplicada / max(1.0, cap_eff)) * 100.0, 1) if cap_eff > 0 else 999.9
-        rpm = fan_rpm(util_pct)
-        Rtot = r_total(cpu, cooler, rpm)
-
-        # temperatura steady (IHS aproximado)
-        temp_steady = amb + potencia_aplicada * Rtot
-
-        # hotspot AMD offset (simula Tj > IHS)
-        hotspot = cpu.get("fabricante", "Intel").lower() == "amd"
-        if hotspot:
-            temp_steady += 8.0
-
-        aviso_throttle = temp_steady >= 95.0
-        ruido = estimate_noise(cooler, util_pct)
-        dur = estimate_durability(cooler, util_pct)
+        # entradas quantizadas: a mesma chave no cache da sessão e no cache em disco
+        params = quantize_params({
+            "carga_pct": carga,
+            "perfil": perfil,
+            "freq_ghz": float(freq_user),
+            "amb": amb,
+            "vent": vent,
+            "permitir_pl2": permitir_pl2,
+        })
+        with span("simular: física"):
+            res = cached_simulate(cpu["modelo"], cooler["modelo"], params)
+        tdp_ref = res["tdp_ref"]
+        freq_used = res["freq_used"]
+        potencia_aplicada = res["potencia_aplicada"]
+        cap_eff = res["cap_eff"]
+        temp_steady = res["temp_steady"]
+        hotspot = res["hotspot"]
 
         # saída
         st.markdown("## Resultado")
         st.write(f"**CPU:** {cpu['modelo']} — TDP referência: {tdp_ref} W — arquitetura: {cpu.get('arquitetura')}")
-        st.write(f"**Frequência base:** {base_freq:.2f} GHz • **Frequência turbo (referência):** {turbo_freq:.2f} GHz")
-        oc_note = " (frequência definida manualmente — overclock possível)" if freq_used > turbo_freq else ""
-        st.write(f"**Frequência usada no cálculo:** {freq_used:.2f} GHz{oc_note} — escala efetiva: {freq_scale_for_calc:.2f}×")
-        st.write(f"**Perfil:** {perfil} (fator {perfil_f:.2f}) • Carga: {carga}%")
-        st.write(f"**Potência estimada (modelo):** {potencia_modelo:.1f} W")
-        st.write(f"**Potência aplicada (após PL):** {potencia_aplicada:.1f} W  (PL1={PL1} W, PL2={PL2} W)")
-        st.write(f"**Cooler:** {cooler['modelo']} — tipo: {cooler.get('tipo','Air')} — nominal ajustado: {nominal:.1f} W • ventilação: {vent}")
-        st.write(f"**Capacidade efetiva do cooler:** {cap_eff:.1f} W (redução dinâmica {dyn_pct*100:.1f}%)")
-        st.write(f"**Utilização da capacidade efetiva:** {util_pct}%")
-        st.write(f"**RPM estimado:** {rpm} RPM")
-        st.write(f"**Resistência térmica total (R_total):** {Rtot:.3f} °C/W (estimada)")
+        st.write(f"**Frequência base:** {res['base_freq']:.2f} GHz • **Frequência turbo (referência):** {res['turbo_freq']:.2f} GHz")
+        oc_note = " (frequência definida manualmente — overclock possível)" if freq_used > res["turbo_freq"] else ""
+        st.write(f"**Frequência usada no cálculo:** {freq_used:.2f} GHz{oc_note} — escala efetiva: {res['freq_scale']:.2f}×")
+        st.write(f"**Perfil:** {perfil} (fator {res['perfil_f']:.2f}) • Carga: {carga}%")
+        st.write(f"**Potência estimada (modelo):** {res['potencia_modelo']:.1f} W")
+        st.write(f"**Potência aplicada (após PL):** {potencia_aplicada:.1f} W  (PL1={res['PL1']} W, PL2={res['PL2']} W)")
+        st.write(f"**Cooler:** {cooler['modelo']} — tipo: {cooler.get('tipo','Air')} — nominal ajustado: {res['nominal']:.1f} W • ventilação: {vent}")
+        st.write(f"**Capacidade efetiva do cooler:** {cap_eff:.1f} W (redução dinâmica {res['dyn_pct']*100:.1f}%)")
+        st.write(f"**Utilização da capacidade efetiva:** {res['util_pct']}%")
+        st.write(f"**RPM estimado:** {res['rpm']} RPM")
+        st.write(f"**Resistência térmica total (R_total):** {res['r_total']:.3f} °C/W (estimada)")
         st.write(f"**Temperatura estimada (steady, IHS aprox.):** {temp_steady:.1f} °C (ambiente {amb} °C)")
         if hotspot:
             st.write("⚠️ Hotspot AMD aplicado internamente (simula Tj > IHS).")
-        if aviso_throttle:
-            st.error("Risco: Temperatura estimada >= 95°C — possível throttling.")
+        if res["throttle"]:
+            st.error(f"Risco: Temperatura estimada >= {THROTTLE_TEMP:.0f}°C — possível throttling.")
         else:
             st.success("Temperatura estimada dentro de limites operacionais.")
-        st.write(f"**Ruído estimado:** {ruido} dB • **Durabilidade estimada:** ~{dur} anos")
+        st.write(f"**Ruído estimado:** {res['ruido_db']} dB • **Durabilidade estimada:** ~{res['durabilidade_anos']} anos")
 
         # gráficos
         if mostrar_graf:
             cols = st.columns(2)
-            with cols[0]:
-                st.markdown("### Temperatura vs Potência aplicada")
-                pvals = np.linspace(0.2 * tdp_ref, max(tdp_ref * 1.6, potencia_aplicada * 1.2), 40)
-                temps = amb + pvals * Rtot + (8.0 if hotspot else 0.0)
-                fig, ax = plt.subplots(figsize=(6, 3))
-                ax.plot(pvals, temps, linewidth=2)
-                ax.scatter([potencia_aplicada], [temp_steady], color='red', zorder=6)
-                ax.set_xlabel("Potência (W)")
-                ax.set_ylabel("Temperatura estimada (°C)")
-                ax.grid(alpha=0.4, ls='--')
-                st.pyplot(fig)
-            with cols[1]:
-                st.markdown("### Potência aplicada × Capacidade efetiva")
-                fig2, ax2 = plt.subplots(figsize=(5, 3))
-                ax2.bar(["Power(W)", "Cap.Efetiva(W)"], [potencia_aplicada, cap_eff])
-                for i, v in enumerate([potencia_aplicada, cap_eff]):
-                    ax2.text(i, v + max(1, 0.02 * v), f"{v:.1f}", ha='center')
-                ax2.set_ylim(0, max(cap_eff, potencia_aplicada) * 1.3 if max(cap_eff, potencia_aplicada) > 0 else 1)
-                st.pyplot(fig2)
+            cols[0].markdown("### Temperatura vs Potência aplicada")
+            cols[1].markdown("### Potência aplicada × Capacidade efetiva")
+            with span(f"simular: gráficos ({backend_graf})"):
+                if backend_graf == "matplotlib":
+                    img_curva, img_barras = simulate_images(cpu["modelo"], cooler["modelo"], params)
+                    cols[0].image(img_curva)
+                    cols[1].image(img_barras)
+                else:
+                    import pandas as pd
+                    pvals, temps = temp_power_curve(tdp_ref, potencia_aplicada, res["r_total"], amb,
+                                                    HOTSPOT_AMD_C if hotspot else 0.0)
+                    cols[0].line_chart(pd.DataFrame({"Temperatura (°C)": temps}, index=pd.Index(pvals, name="Potência (W)")))
+                    cols[1].bar_chart(pd.Series([potencia_aplicada, cap_eff], index=["Power(W)", "Cap.Efetiva(W)"], name="W"))
 
         # tabela resumida
-        df = pd.DataFrame([{
-            "cpu": cpu['modelo'],
-            "arquitetura": cpu.get("arquitetura"),
-            "tdp_ref_W": tdp_ref,
-            "freq_base_GHz": base_freq,
-            "freq_turbo_GHz": turbo_freq,
-            "freq_usada_GHz": round(freq_used, 2),
-            "pot_modelo_W": round(potencia_modelo, 1),
-            "pot_aplicada_W": round(potencia_aplicada, 1),
-            "cap_eff_W": round(cap_eff, 1),
-            "temp_steady_C": round(temp_steady, 1),
-            "util_pct": util_pct
-        }])
-        st.markdown("### Dados resumidos")
-        st.dataframe(df)
+        with span("simular: tabela"):
+            import pandas as pd
+            df = pd.DataFrame([summary_record(cpu, res)])
+            st.markdown("### Dados resumidos")
+            st.dataframe(df)
+
+# ---------------------------
+# RESPOSTA INSTANTÂNEA (superfície pré-calculada)
+# ---------------------------
+@st.cache_data(max_entries=64)
+def surface_contour_image(cpu_modelo, cooler_modelo, perfil, permitir_pl2, amb, vent_factor, ponto, versao):
+    from superficies import shared_cache, surface_slice
+    sup = shared_cache().get(CPUS.get(cpu_modelo), COOLERS.get(cooler_modelo), perfil, permitir_pl2, versao)
+    return contour_png(sup["eixos"]["freq_scale"] * sup["base_freq"], sup["eixos"]["carga_pct"],
+                       surface_slice(sup, amb, vent_factor), THROTTLE_TEMP, ponto)
+
+with st.expander("Resposta instantânea (superfície pré-calculada — acompanha a barra lateral sem clicar)"):
+    st.markdown(
+        "Na primeira seleção do par CPU/cooler, a temperatura steady é calculada numa grade densa "
+        "frequência × carga × ambiente × ventilação; depois, cada mudança na barra lateral é respondida por "
+        "interpolação multilinear. As grades ficam em memória, compartilhadas entre sessões, e só são refeitas "
+        "quando o modelo muda."
+    )
+    if cpu is not None and cooler is not None:
+        from superficies import shared_cache, interpolate
+        with span("superfície: grade (cache compartilhado)"):
+            sup = shared_cache().get(cpu, cooler, perfil, permitir_pl2, VERSAO_SIMULACAO)
+        base_sup = sup["base_freq"] or 1.0
+        t0 = time.perf_counter()
+        with span("superfície: interpolação"):
+            temp_viva = float(interpolate(sup, float(freq_user) / base_sup, carga, amb, vent_factor))
+        dt_us = (time.perf_counter() - t0) * 1e6
+        scols = st.columns(3)
+        scols[0].metric("Temperatura steady (interpolada)", f"{temp_viva:.1f} °C")
+        scols[1].metric("Margem até o throttle", f"{THROTTLE_TEMP - temp_viva:.1f} °C")
+        scols[2].metric("Consulta", f"{dt_us:.0f} µs")
+        st.markdown(f"#### Contorno frequência × carga — ambiente {amb} °C, {vent}")
+        with span(f"superfície: contorno ({backend_graf})"):
+            if backend_graf == "matplotlib":
+                st.image(surface_contour_image(cpu["modelo"], cooler["modelo"], perfil, permitir_pl2, amb, vent_factor,
+                                               (float(freq_user), float(carga)), VERSAO_SIMULACAO))
+            else:
+                import pandas as pd
+                from superficies import surface_slice
+                corte_sup = pd.DataFrame(
+                    surface_slice(sup, amb, vent_factor).round(1),
+                    index=pd.Index((sup["eixos"]["freq_scale"] * base_sup).round(2), name="freq_GHz"),
+                    columns=pd.Index(sup["eixos"]["carga_pct"], name="carga_pct"),
+                ).stack().rename("temp_steady_C").reset_index()
+                st.altair_chart(heatmap_chart(corte_sup, x="freq_GHz", y="carga_pct"), width="stretch")
+        st.caption(f"Linha tracejada = {THROTTLE_TEMP:.0f} °C (throttle). Para o valor exato, use \"Simular\".")
+
+# ---------------------------
+# SENSIBILIDADE (derivadas + tornado)
+# ---------------------------
+@st.cache_data
+def sensitivity_tables(cpu_modelo, cooler_modelo, params):
+    """Temperatura base, tabela de derivadas parciais e tabela de faixas (ordenada para o tornado)."""
+    import pandas as pd
+    from sensibilidade import ROTULOS, UNIDADES, sensitivity
+    r = sensitivity(CPUS.get(cpu_modelo), COOLERS.get(cooler_modelo), COOLERS, params)
+    derivadas = pd.DataFrame([
+        {"entrada": ROTULOS[k], "valor_atual": round(r["ponto"][k], 3), "unidade": UNIDADES[k],
+         "dT_dx_analitica": round(d["analitica"], 4), "dT_dx_numerica": round(d["numerica"], 4),
+         "elasticidade": round(d["elasticidade"], 3)}
+        for k, d in r["derivadas"].items()
+    ])
+    faixas = pd.DataFrame([dict(f, entrada=ROTULOS[f["entrada"]]) for f in r["faixas"]]).round(2)
+    return r["temp_base"], derivadas, faixas
+
+@st.cache_data(max_entries=64)
+def sensitivity_image(cpu_modelo, cooler_modelo, params):
+    temp_base, _, faixas = sensitivity_tables(cpu_modelo, cooler_modelo, params)
+    return tornado_png(list(faixas["entrada"]), faixas["temp_baixo"], faixas["temp_alto"], temp_base,
+                       list(faixas["baixo"]), list(faixas["alto"]))
+
+with st.expander("Sensibilidade (qual parâmetro pesa mais na temperatura)"):
+    st.markdown(
+        "Em torno do ponto atual da barra lateral: **derivadas parciais** da temperatura steady (analíticas, "
+        "conferidas por diferença central) e **faixas um de cada vez** — cada entrada varia sozinha "
+        "(ambiente ±5 °C, carga ±20 pontos, frequência ±10 %, todas as ventilações, perfis e coolers). "
+        "**Elasticidade** = variação relativa do aquecimento (T − ambiente) por variação relativa da entrada."
+    )
+    if cpu is not None and cooler is not None:
+        params_sens = quantize_params({"carga_pct": carga, "perfil": perfil, "freq_ghz": float(freq_user),
+                                       "amb": amb, "vent": vent, "permitir_pl2": permitir_pl2})
+        with span("sensibilidade: cenários em lote"):
+            temp_base_sens, tab_deriv, tab_faixas = sensitivity_tables(cpu["modelo"], cooler["modelo"], params_sens)
+        st.markdown(f"#### Tornado — temperatura base {temp_base_sens:.1f} °C")
+        with span(f"sensibilidade: gráfico ({backend_graf})"):
+            if backend_graf == "matplotlib":
+                st.image(sensitivity_image(cpu["modelo"], cooler["modelo"], params_sens))
+            else:
+                st.altair_chart(tornado_chart(tab_faixas, temp_base_sens), width="stretch")
+        st.dataframe(tab_faixas, hide_index=True)
+        st.markdown("#### Derivadas parciais")
+        st.dataframe(tab_deriv, hide_index=True)
+
+# ---------------------------
+# SIMULAÇÃO TRANSIENTE (PL1/PL2/TAU)
+# ---------------------------
+@st.cache_data
+def cached_transient(cpu_modelo, cooler_modelo, workload, amb, vent_factor, freq_scale, permitir_pl2, dt):
+    from transiente import simulate_transient
+    r = simulate_transient([CPUS.get(cpu_modelo)], [COOLERS.get(cooler_modelo)], list(workload), amb=amb,
+                           vent_factor=vent_factor, freq_scale=freq_scale, permitir_pl2=permitir_pl2, dt=dt)
+    return {k: (v if k == "t" else v[0]) for k, v in r.items()}
+
+def transient_series(tr):
+    """Série reduzida para os gráficos (até ~2000 pontos)."""
+    passo = max(1, tr["t"].size // 2000)
+    return tr["t"][::passo], tr["temp"][::passo], tr["potencia"][::passo]
+
+@st.cache_data(max_entries=64)
+def transient_image(cpu_modelo, cooler_modelo, workload, amb, vent_factor, freq_scale, permitir_pl2, dt):
+    tr = cached_transient(cpu_modelo, cooler_modelo, workload, amb, vent_factor, freq_scale, permitir_pl2, dt)
+    return transient_png(*transient_series(tr), THROTTLE_TEMP)
+
+with st.expander("Simulação transiente (burst PL2 → PL1 ao longo do tempo)"):
+    st.markdown(
+        "Modela die → IHS → dissipador como uma rede RC e aplica o orçamento de potência por média móvel "
+        "(PL2 enquanto a média está abaixo de PL1, constante TAU). A carga é: ocioso → perfil/carga da barra lateral → ocioso."
+    )
+    tcols = st.columns(4)
+    t_antes = tcols[0].number_input("Ocioso antes (s)", 0.0, 3600.0, 10.0, 5.0)
+    t_carga = tcols[1].number_input("Duração da carga (s)", 1.0, 36000.0, 300.0, 10.0)
+    t_depois = tcols[2].number_input("Ocioso depois (s)", 0.0, 3600.0, 60.0, 5.0)
+    dt_trans = tcols[3].selectbox("Resolução (s)", (0.01, 0.1, 1.0), index=1)
+    if st.button("Simular transiente"):
+        if cpu is None or cooler is None:
+            st.error("Selecione CPU e cooler válidos.")
+        else:
+            base_freq = cpu.get("frequencia_base", 0.0)
+            escala = (float(freq_user) / base_freq) if base_freq > 0 else 1.0
+            workload = tuple(seg for seg in (
+                (t_antes, 10, "Idle / Leve"),
+                (t_carga, carga, perfil),
+                (t_depois, 10, "Idle / Leve"),
+            ) if seg[0] > 0)
+            with span("transiente: simulação"):
+                tr = cached_transient(cpu["modelo"], cooler["modelo"], workload, amb, vent_factor, escala, permitir_pl2, dt_trans)
+            st.write(f"**Temperatura máxima:** {tr['temp_max']:.1f} °C • **Tempo acima de {THROTTLE_TEMP:.0f} °C:** {tr['tempo_throttle_s']:.1f} s")
+
+            with span(f"transiente: gráfico ({backend_graf})"):
+                if backend_graf == "matplotlib":
+                    st.image(transient_image(cpu["modelo"], cooler["modelo"], workload, amb, vent_factor, escala, permitir_pl2, dt_trans))
+                else:
+                    import pandas as pd
+                    t, temp, pot = transient_series(tr)
+                    st.line_chart(pd.DataFrame({"Temperatura (°C)": temp, "Potência aplicada (W)": pot},
+                                               index=pd.Index(t, name="Tempo (s)")))
+
+# ---------------------------
+# SOLUÇÃO ACOPLADA (ventoinha por temperatura + leakage)
+# ---------------------------
+with st.expander("Solução acoplada (curva da ventoinha × temperatura × leakage)"):
+    st.markdown(
+        "Em vez de uma passada única (utilização → RPM → R_total → temperatura), resolve o laço completo: "
+        "a ventoinha responde à temperatura e o leakage cresce com ela. Informe a curva como `°C:RPM`."
+    )
+    curva_txt = st.text_input("Curva da ventoinha", ", ".join(f"{t:g}:{r:g}" for t, r in FAN_CURVE))
+    if st.button("Resolver acoplado"):
+        try:
+            curva = parse_fan_curve(curva_txt)
+        except ValueError as exc:
+            st.error(f"Curva inválida: {exc}")
+        else:
+            if cpu is None or cooler is None:
+                st.error("Selecione CPU e cooler válidos.")
+            else:
+                base_freq = cpu.get("frequencia_base", 0.0)
+                escala = (float(freq_user) / base_freq) if base_freq > 0 else 1.0
+                with span("acoplado: solver"):
+                    sol = solve_coupled(CPUS.arrays([CPUS.posicao[cpu["modelo"]]]),
+                                        COOLERS.arrays([COOLERS.posicao[cooler["modelo"]]]), carga, WORKLOAD_PROFILES[perfil],
+                                        escala, amb, vent_factor, permitir_pl2, curva=curva)
+                sol = {k: v[0] for k, v in sol.items()}
+                st.write(f"**Temperatura acoplada:** {sol['temp_steady']:.1f} °C • **RPM:** {sol['rpm']:.0f} • "
+                         f"**Potência:** {sol['potencia_aplicada']:.1f} W • **R_total:** {sol['r_total']:.3f} °C/W")
+                st.write(f"**Iterações:** {sol['iteracoes']} • **Convergiu:** {'sim' if sol['convergiu'] else 'não'}")
+                if sol["motivo"] == FUGA_TERMICA:
+                    st.error("Sem ponto de equilíbrio: fuga térmica (leakage cresce mais rápido que a dissipação).")
+                elif sol["motivo"] == LIMITE_ITERACOES:
+                    st.warning("O solver parou no limite de iterações sem convergir; a temperatura acima é a última "
+                               "estimativa (|ΔT| ainda acima da tolerância), não um ponto de equilíbrio.")
+                elif sol["throttle"]:
+                    st.error(f"Risco: Temperatura estimada >= {THROTTLE_TEMP:.0f}°C — possível throttling.")
+
+# ---------------------------
+# OVERCLOCK MÁXIMO ESTÁVEL (headroom)
+# ---------------------------
+with st.expander("Overclock máximo estável (headroom por CPU/cooler)"):
+    st.markdown(
+        "Frequência mais alta que mantém a temperatura steady abaixo do limite sem passar do limite de potência "
+        "(PL2, ou PL1 sem burst), com carga, perfil, ambiente e ventilação da barra lateral. "
+        "A faixa de busca é a mesma do controle manual de frequência."
+    )
+    temp_limite = st.number_input("Limite de temperatura (°C)", 60.0, 110.0, THROTTLE_TEMP, 1.0)
+    with span("overclock: bisseção em lote"):
+        tabela_oc = headroom_table(carga, perfil, amb, vent, temp_limite, permitir_pl2)
+    with span("overclock: tabelas"):
+        ocols = st.columns(2)
+        if cpu is not None:
+            ocols[0].markdown(f"#### {cpu['modelo']} com cada cooler")
+            ocols[0].dataframe(tabela_oc.xs(cpu["modelo"], level="cpu").sort_values("freq_max_GHz", ascending=False))
+        if cooler is not None:
+            ocols[1].markdown(f"#### {cooler['modelo']} com cada CPU")
+            ocols[1].dataframe(tabela_oc.xs(cooler["modelo"], level="cooler").sort_values("headroom_GHz", ascending=False))
+
+# ---------------------------
+# RECOMENDAÇÃO DE COOLER (Pareto)
+# ---------------------------
+@st.cache_data
+def recommendation_table(cpu_modelo, params, k, max_temp, max_db, criterio):
+    """Métricas de todos os coolers para o CPU, com camada de Pareto e posição no top-k."""
+    import pandas as pd
+    rec = recommend(CPUS.get(cpu_modelo), COOLERS, params, k, max_temp, max_db, criterio)
+    res = rec["res"]
+    posicao_top = np.full(len(COOLERS), np.nan)
+    posicao_top[rec["top"]] = np.arange(1, len(rec["top"]) + 1)
+    return pd.DataFrame({
+        "cooler": COOLERS.modelos(),
+        "tipo": COOLERS.colunas["tipo"],
+        "temp_steady_C": res["temp_steady"].round(1),
+        "ruido_db": res["ruido_db"],
+        "durabilidade_anos": res["durabilidade_anos"],
+        "util_pct": res["util_pct"],
+        "camada_pareto": rec["camadas"],
+        "top_k": posicao_top,
+    })
+
+with st.expander("Recomendação de cooler (Pareto: temperatura × ruído × durabilidade)"):
+    st.markdown(
+        "Avalia todos os coolers do catálogo para o CPU, perfil, carga, frequência, ambiente e gabinete da barra lateral. "
+        "**Pareto** = nenhum outro cooler é melhor em temperatura, ruído e durabilidade ao mesmo tempo. "
+        "**camada_pareto**: 0 = na fronteira, 1 = só dominado por coolers da fronteira, e assim por diante."
+    )
+    rcols = st.columns(4)
+    rec_max_temp = rcols[0].number_input("Temperatura máxima (°C)", 40.0, 110.0, THROTTLE_TEMP, 1.0)
+    rec_max_db = rcols[1].number_input("Ruído máximo (dB)", 15.0, 60.0, 40.0, 1.0)
+    rec_k = rcols[2].number_input("Quantidade (top-k)", 1, 20, 5, 1)
+    rec_criterio = rcols[3].selectbox("Critério", CRITERIOS)
+    if cpu is not None:
+        params_rec = {"carga_pct": carga, "perfil": perfil, "freq_ghz": float(freq_user),
+                      "amb": amb, "vent": vent, "permitir_pl2": permitir_pl2}
+        with span("recomendação: cálculo"):
+            tabela_rec = recommendation_table(cpu["modelo"], params_rec, int(rec_k), rec_max_temp, rec_max_db, rec_criterio)
+        with span("recomendação: tabelas"):
+            top = tabela_rec.dropna(subset=["top_k"]).sort_values("top_k")
+            st.markdown(f"#### Top {int(rec_k)} dentro dos limites")
+            if top.empty:
+                st.warning("Nenhum cooler atende aos limites informados.")
+            else:
+                st.dataframe(top.drop(columns=["top_k"]).reset_index(drop=True))
+            st.markdown("#### Fronteira de Pareto")
+            st.dataframe(tabela_rec[tabela_rec["camada_pareto"] == 0].drop(columns=["camada_pareto", "top_k"])
+                         .sort_values("temp_steady_C").reset_index(drop=True))
+            st.markdown("#### Todos os coolers por camada de Pareto")
+            st.dataframe(tabela_rec.drop(columns=["top_k"]).sort_values(["camada_pareto", "temp_steady_C"])
+                         .reset_index(drop=True))
+
+# ---------------------------
+# INCERTEZA (Monte Carlo)
+# ---------------------------
+@st.cache_data
+def cached_monte_carlo(cpu_modelo, cooler_modelo, params, n_amostras, processos, semente):
+    from incerteza import monte_carlo
+    r = monte_carlo(CPUS.get(cpu_modelo), COOLERS.get(cooler_modelo), params, n_amostras,
+                    semente=semente, processos=processos)
+    stats = r.pop("stats")
+    # histograma só na faixa ocupada, em faixas de 0.5 °C para o gráfico
+    ocupadas = np.flatnonzero(stats.contagens[1:-1])
+    ini, fim = (ocupadas[0], ocupadas[-1] + 1) if ocupadas.size else (0, 1)
+    ini, fim = ini - ini % 10, fim + (-fim) % 10
+    r["hist_bordas"] = stats.bordas[ini:fim + 1:10]
+    r["hist_contagens"] = stats.contagens[1:-1][ini:fim].reshape(-1, 10).sum(axis=1)
+    return r
+
+@st.cache_data(max_entries=64)
+def monte_carlo_image(cpu_modelo, cooler_modelo, params, n_amostras, processos, semente):
+    mc = cached_monte_carlo(cpu_modelo, cooler_modelo, params, n_amostras, processos, semente)
+    return histogram_png(mc["hist_bordas"], mc["hist_contagens"] / mc["n"] * 100, THROTTLE_TEMP)
+
+with st.expander("Incerteza (Monte Carlo das constantes do modelo)"):
+    st.markdown(
+        "As constantes heurísticas (derating do cooler, margem de segurança, ventilação, R_cs, R_hs, "
+        "hotspot AMD e ambiente) são sorteadas de distribuições em vez de fixas. "
+        "O resultado é uma faixa de temperaturas e a probabilidade de throttle para a configuração da barra lateral."
+    )
+    icols = st.columns(3)
+    mc_n = icols[0].selectbox("Amostras", (100_000, 1_000_000, 10_000_000), index=1, format_func=lambda n: f"{n:,}".replace(",", "."))
+    mc_proc = icols[1].number_input("Processos", 1, 32, 1, 1)
+    mc_semente = icols[2].number_input("Semente", 0, 2**31 - 1, 0, 1)
+    if st.button("Rodar Monte Carlo"):
+        if cpu is None or cooler is None:
+            st.error("Selecione CPU e cooler válidos.")
+        else:
+            params_mc = {"carga_pct": carga, "perfil": perfil, "freq_ghz": float(freq_user),
+                         "amb": amb, "vent": vent, "permitir_pl2": permitir_pl2}
+            with span("monte carlo: amostragem"):
+                mc = cached_monte_carlo(cpu["modelo"], cooler["modelo"], params_mc, int(mc_n), int(mc_proc), int(mc_semente))
+            st.write(f"**Média:** {mc['media']:.1f} °C • **Desvio:** {mc['desvio']:.2f} °C • "
+                     f"**Faixa:** {mc['min']:.1f} – {mc['max']:.1f} °C")
+            st.write(f"**Probabilidade de throttle (≥ {THROTTLE_TEMP:.0f} °C):** {mc['prob_throttle'] * 100:.2f}%")
+            st.table({f"P{p}": [f"{v:.1f} °C"] for p, v in mc["percentis"].items()})
+
+            with span(f"monte carlo: gráfico ({backend_graf})"):
+                if backend_graf == "matplotlib":
+                    st.image(monte_carlo_image(cpu["modelo"], cooler["modelo"], params_mc, int(mc_n), int(mc_proc), int(mc_semente)))
+                else:
+                    import pandas as pd
+                    centros = 0.5 * (mc["hist_bordas"][:-1] + mc["hist_bordas"][1:])
+                    st.bar_chart(pd.Series(mc["hist_contagens"] / mc["n"] * 100, index=pd.Index(centros.round(2), name="°C"),
+                                           name="Amostras (%)"))
+
+# ---------------------------
+# MATRIZ DE COMPATIBILIDADE (todas as combinações)
+# ---------------------------
+@st.cache_data(max_entries=64)
+def matrix_heatmap_image(ambientes, carga_pct, freq_scale, permitir_pl2, perfil, ambiente, vent):
+    """Mapa de calor CPU × cooler da temperatura steady para um perfil/ambiente/ventilação."""
+    corte = matrix_table(ambientes, carga_pct, freq_scale, permitir_pl2).xs(
+        (perfil, ambiente, vent), level=("perfil", "ambiente_C", "ventilacao"))["temp_steady_C"].unstack("cooler")
+    return heatmap_png(corte.to_numpy(), corte.index.tolist(), corte.columns.tolist())
+
+with st.expander("Matriz de compatibilidade CPU × cooler (catálogo completo)"):
+    st.markdown(
+        "Calcula todas as combinações de CPU, cooler, perfil, temperatura ambiente e ventilação "
+        "numa única passada vetorizada (carga e escala de frequência fixas)."
+    )
+    mcols = st.columns(4)
+    amb_min = mcols[0].number_input("Ambiente mínimo (°C)", 10.0, 45.0, 20.0, 1.0)
+    amb_max = mcols[1].number_input("Ambiente máximo (°C)", 10.0, 45.0, 35.0, 1.0)
+    amb_passo = mcols[2].number_input("Passo (°C)", 0.5, 10.0, 5.0, 0.5)
+    escala_matriz = mcols[3].number_input("Escala de frequência (× base)", 0.5, 2.0, 1.0, 0.05)
+    if st.button("Calcular matriz"):
+        ambientes = np.arange(amb_min, max(amb_min, amb_max) + amb_passo / 2, amb_passo)
+        with span("matriz: cálculo"):
+            tabela = matrix_table(tuple(ambientes.tolist()), carga, escala_matriz, permitir_pl2)
+        st.write(f"**Combinações avaliadas:** {len(tabela):,}".replace(",", "."))
+        st.markdown(f"#### Temperatura steady (°C) — perfil *{perfil}*, ventilação *{vent}*, ambiente {ambientes[0]:.1f} °C")
+        corte = tabela.xs((perfil, ambientes[0], vent), level=("perfil", "ambiente_C", "ventilacao"))
+        with span(f"matriz: mapa de calor ({backend_graf})"):
+            if backend_graf == "matplotlib":
+                st.image(matrix_heatmap_image(tuple(ambientes.tolist()), carga, escala_matriz, permitir_pl2,
+                                              perfil, ambientes[0], vent))
+            else:
+                st.altair_chart(heatmap_chart(corte["temp_steady_C"].reset_index()), width="stretch")
+        with span("matriz: tabelas e CSV"):
+            st.dataframe(corte["temp_steady_C"].unstack("cooler"))
+            st.markdown("#### Fração de combinações com throttle, por CPU")
+            st.dataframe(tabela["throttle"].groupby(level="cpu").mean().mul(100).round(1).rename("throttle_pct"))
+            st.download_button("Baixar matriz completa (CSV)", tabela.to_csv().encode("utf-8"),
+                               file_name="matriz_compatibilidade.csv", mime="text/csv")
+
+# ---------------------------
+# RACK / VÁRIOS NÓS (servidores)
+# ---------------------------
+RACKS_NO_MAPA = 40          # racks exibidos no mapa de calor (a tabela traz todos)
+
+@st.cache_data(max_entries=16)
+def rack_tables(cpu_modelo, cooler_modelo, config):
+    """Totais da fileira e tabela por chassis (temperatura máxima, throttles, entrada/saída de ar, calor)."""
+    import pandas as pd
+    from rack import simulate_rack
+    c = dict(config)
+    por_rack = c.pop("chassis_por_rack")
+    posicao = np.arange(c["n_chassis"]) % por_rack
+    c["vent_factor"] = c["vent_factor"] * (1.0 - c.pop("reducao_topo") * posicao / max(1, por_rack - 1))
+    r = simulate_rack(CPUS.get(cpu_modelo), COOLERS.get(cooler_modelo), chassis_por_rack=por_rack, **c)
+    ch = r["chassis"]
+    tabela = pd.DataFrame({
+        "rack": ch["rack"] + 1,
+        "posicao": ch["posicao"] + 1,
+        "ventilacao": c["vent_factor"].round(3),
+        "entrada_C": ch["entrada"].round(1),
+        "saida_C": ch["saida"].round(1),
+        "calor_W": ch["calor_w"].round(1),
+        "temp_max_C": ch["temp_max"].round(1),
+        "throttles": ch["throttles"],
+    })
+    return r["totais"], tabela
+
+@st.cache_data(max_entries=16)
+def rack_heatmap_image(cpu_modelo, cooler_modelo, config):
+    _, tabela = rack_tables(cpu_modelo, cooler_modelo, config)
+    mapa = tabela[tabela["rack"] <= RACKS_NO_MAPA].pivot(index="posicao", columns="rack", values="temp_max_C").iloc[::-1]
+    return heatmap_png(mapa.to_numpy(), [f"U{p}" for p in mapa.index], [f"R{r}" for r in mapa.columns],
+                       rotulo="Temperatura máxima do chassis (°C)")
+
+with st.expander("Rack / servidores (N chassis × M sockets com ar compartilhado)"):
+    st.markdown(
+        "Fileira de racks com o CPU e o cooler da barra lateral em todos os sockets (pensado para os Xeons E5 "
+        "dual-socket do catálogo). O ar do corredor frio (ambiente da barra lateral) aquece ao passar pelos "
+        "sockets a montante no mesmo chassis (**sombreamento**: 100 % = em série, 0 % = lado a lado) e parte do "
+        "ar quente de cada chassis volta para a entrada do chassis de cima (**recirculação**). "
+        "ΔT do ar = calor / (ρ·cp·vazão)."
+    )
+    kcols = st.columns(4)
+    rk_racks = kcols[0].number_input("Racks na fileira", 1, 500, 4, 1)
+    rk_por_rack = kcols[1].number_input("Chassis por rack", 1, 48, 20, 1)
+    rk_sockets = kcols[2].number_input("Sockets por chassis", 1, 8, 2, 1)
+    rk_fluxo = kcols[3].number_input("Vazão por chassis (CFM)", 10.0, 400.0, 80.0, 5.0)
+    kcols = st.columns(4)
+    rk_recirc = kcols[0].slider("Recirculação (%)", 0, 60, 10, 1)
+    rk_sombra = kcols[1].slider("Sombreamento (%)", 0, 100, 100, 5)
+    rk_extra = kcols[2].number_input("Calor extra por chassis (W)", 0.0, 1000.0, 100.0, 10.0,
+                                     help="Memória, fontes, discos e placas: aquece o ar de saída.")
+    rk_topo = kcols[3].slider("Ventilação pior no topo (%)", 0, 30, 0, 1,
+                              help="Redução linear do fator de ventilação do chassis de baixo até o do topo.")
+    if cpu is not None and cooler is not None:
+        config_rack = {
+            "n_chassis": int(rk_racks * rk_por_rack), "chassis_por_rack": int(rk_por_rack),
+            "sockets_por_chassis": int(rk_sockets), "carga_pct": float(carga), "perfil": perfil,
+            "freq_ghz": float(freq_user), "amb": float(amb), "vent_factor": float(vent_factor),
+            "fluxo_cfm": float(rk_fluxo), "recirculacao": rk_recirc / 100.0, "sombreamento": rk_sombra / 100.0,
+            "calor_extra_w": float(rk_extra), "reducao_topo": rk_topo / 100.0, "permitir_pl2": permitir_pl2,
+        }
+        with span("rack: cadeia de ar em lote"):
+            tot_rack, tabela_rack = rack_tables(cpu["modelo"], cooler["modelo"], config_rack)
+        tcols = st.columns(4)
+        tcols[0].metric("Sockets", f"{tot_rack['sockets']}")
+        tcols[1].metric("Sockets em throttle", f"{tot_rack['throttles']}")
+        tcols[2].metric("Temperatura máxima", f"{tot_rack['temp_max']:.1f} °C")
+        tcols[3].metric("Calor total", f"{tot_rack['calor_w'] / 1e3:.1f} kW",
+                        help=f"{tot_rack['calor_btu_h']:,.0f} BTU/h")
+        st.markdown("#### Temperatura máxima por chassis (posição no rack × rack)")
+        if rk_racks > RACKS_NO_MAPA:
+            st.caption(f"Mapa limitado aos primeiros {RACKS_NO_MAPA} racks; a tabela abaixo traz todos.")
+        with span(f"rack: mapa de calor ({backend_graf})"):
+            if backend_graf == "matplotlib":
+                st.image(rack_heatmap_image(cpu["modelo"], cooler["modelo"], config_rack))
+            else:
+                mapa_rack = tabela_rack[tabela_rack["rack"] <= RACKS_NO_MAPA].sort_values(
+                    ["posicao", "rack"], ascending=[False, True])
+                st.altair_chart(heatmap_chart(mapa_rack, x="rack", y="posicao", valor="temp_max_C"), width="stretch")
+        st.dataframe(tabela_rack, hide_index=True)
+
+# ---------------------------
+# DESEMPENHO (instrumentação)
+# ---------------------------
+if coletor_perf is not None:
+    desempenho.stop()
+    historico = st.session_state.setdefault("perf_historico", [])
+    historico.append(coletor_perf)
+    del historico[:-PERF_HISTORICO]
+    if os.environ.get("DESEMPENHO_LOG"):
+        desempenho.append_jsonl(os.environ["DESEMPENHO_LOG"], [coletor_perf])
+
+with st.expander("Desempenho (tempos por etapa, chamadas do modelo, perfil)"):
+    st.markdown(
+        "Mede cada rerun da página: tempo de cada etapa (filtros do catálogo, física, gráficos, tabelas), "
+        "quantas vezes cada função do modelo foi chamada e, opcionalmente, um perfil cProfile e o pico de memória. "
+        "Desligado, não há custo. Com a variável de ambiente `DESEMPENHO_LOG`, cada rerun medido também é "
+        "acrescentado a esse arquivo (JSON Lines)."
+    )
+    pcols = st.columns(3)
+    pcols[0].checkbox("Medir os próximos reruns", key="perf_ativo")
+    pcols[1].checkbox("cProfile", key="perf_cprofile")
+    pcols[2].checkbox("tracemalloc", key="perf_tracemalloc")
+    if coletor_perf is not None:
+        import pandas as pd
+        st.markdown(f"#### Etapas — {coletor_perf.rotulo} ({coletor_perf.total_ms():.1f} ms)")
+        st.dataframe(pd.DataFrame({
+            "etapa": ["\u2003" * s["nivel"] + s["nome"] for s in coletor_perf.spans],
+            "inicio_ms": [round(s["inicio_ms"], 2) for s in coletor_perf.spans],
+            "duracao_ms": [round(s["duracao_ms"], 2) for s in coletor_perf.spans],
+        }), hide_index=True)
+        if coletor_perf.contadores:
+            st.markdown("#### Chamadas do modelo")
+            st.dataframe(pd.Series(coletor_perf.contadores, name="chamadas").sort_values(ascending=False))
+        if coletor_perf.memoria:
+            st.markdown(f"#### Memória — pico {coletor_perf.memoria['pico_mb']:.1f} MB")
+            st.dataframe(pd.DataFrame(coletor_perf.memoria["maiores"], columns=["linha", "kB", "blocos"]), hide_index=True)
+        if coletor_perf.perfil:
+            st.markdown("#### cProfile (tempo acumulado)")
+            st.code(coletor_perf.perfil)
+    if st.session_state.get("perf_historico"):
+        historico = st.session_state["perf_historico"]
+        st.download_button(f"Exportar {len(historico)} reruns medidos (JSON Lines)",
+                           desempenho.to_jsonl(historico).encode("utf-8"),
+                           file_name="desempenho.jsonl", mime="application/x-ndjson")
+
+    # superfícies de resposta em memória (compartilhadas por todas as sessões deste processo)
+    from superficies import shared_cache
+    est_sup = shared_cache().stats()
+    st.caption(f"Superfícies de resposta em memória: {est_sup['grades']} grades, {est_sup['bytes'] / 1e6:.1f} de "
+               f"{est_sup['limite_bytes'] / 1e6:.0f} MB • acertos {est_sup['acertos']} • faltas {est_sup['faltas']} "
+               f"• despejos {est_sup['despejos']}")
+
+    # cache em disco (compartilhado por todas as sessões deste servidor)
+    cache = default_cache()
+    if cache.ativo:
+        import pandas as pd
+        if st.button("Limpar cache em disco"):
+            cache.clear()
+            st.cache_data.clear()
+        est = cache.stats()
+        st.markdown(f"#### Cache em disco — {est['entradas']} entradas, "
+                    f"{est['bytes'] / 1e6:.1f} de {est['limite_bytes'] / 1e6:.0f} MB")
+        if est["namespaces"]:
+            st.dataframe(pd.DataFrame.from_dict(est["namespaces"], orient="index"))
+        if est["erros"]:
+            st.warning(f"{est['erros']} operações do cache falharam neste processo (valores recalculados).")
+    else:
+        st.caption("Cache em disco desligado (SIMULADOR_CACHE_MB=0).")
 
 st.markdown("---")
 st.caption("Observação: O simulador usa heurísticas (R_cs, R_hs estimadas automaticamente). Para medições reais, use sensores e benchs controlados (HWiNFO, etc.).")
@@ -0,0 +1,148 @@
+# superficies.py
+# Superfícies de resposta pré-calculadas — PT-BR
+# Para um par CPU/cooler (e perfil / PL2), a temperatura steady é calculada uma vez
+# numa grade densa freq_scale × carga × ambiente × ventilação (uma chamada de
+# steady_state_batch) e depois consultada por interpolação multilinear, rápida o
+# bastante para acompanhar os controles da barra lateral ao vivo.
+# - a temperatura é linear no ambiente, então esse eixo é exato; carga e frequência
+#   têm grade fina para o erro de interpolação ficar em décimos de grau;
+# - consultas fora da grade são presas à borda (a grade cobre a faixa dos controles);
+# - as grades ficam num cache LRU do processo, compartilhado entre sessões e limitado
+#   em bytes; a chave inclui a versão do modelo, então só são refeitas quando o
+#   modelo (ou o catálogo) muda.
+
+import itertools
+import os
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+from motor import WORKLOAD_PROFILES, VENT_FACTORS, cpu_arrays, cooler_arrays, steady_state_batch
+from overclock import freq_limits
+from cache_disco import model_version
+
+# eixos da grade (na ordem do array)
+EIXOS = ("freq_scale", "carga_pct", "amb", "vent_factor")
+PONTOS_FREQ = 49
+CARGAS = np.arange(10.0, 150.0 + 1e-9, 2.5)
+AMBIENTES = np.arange(10.0, 45.0 + 1e-9, 5.0)
+VENTILACOES = np.array(sorted(VENT_FACTORS.values()))
+LIMITE_PADRAO_MB = float(os.environ.get("SIMULADOR_SUPERFICIES_MB", 64))
+
+# ---------------------------
+# GRADE E INTERPOLAÇÃO
+# ---------------------------
+def build_surface(cpu, cooler, perfil="Bench sustentado (Cinebench)", permitir_pl2=True):
+    """
+    Grade de temperatura steady de um par CPU/cooler.
+    - eixos: freq_scale (faixa do controle manual de frequência), carga_pct, amb e vent_factor;
+    - temp: array float32 com shape (freq, carga, ambiente, ventilação), somente leitura.
+    """
+    cpu_cols, cooler_cols = cpu_arrays([cpu]), cooler_arrays([cooler])
+    base = cpu_cols["freq_base"][0]
+    f_min, f_max = (float(x[0]) for x in freq_limits(cpu_cols))
+    escalas = np.linspace(f_min / base, f_max / base, PONTOS_FREQ) if base > 0 else np.array([1.0, 1.0 + 1e-9])
+    eixos = {"freq_scale": escalas, "carga_pct": CARGAS, "amb": AMBIENTES, "vent_factor": VENTILACOES}
+    res = steady_state_batch(
+        cpu_cols, cooler_cols,
+        CARGAS[None, :, None, None], WORKLOAD_PROFILES.get(perfil, 1.0), escalas[:, None, None, None],
+        AMBIENTES[None, None, :, None], VENTILACOES[None, None, None, :], permitir_pl2,
+    )
+    temp = np.broadcast_to(res["temp_steady"], tuple(len(eixos[k]) for k in EIXOS)).astype(np.float32)
+    temp.flags.writeable = False
+    for eixo in eixos.values():
+        eixo.flags.writeable = False
+    return {"eixos": eixos, "temp": temp, "base_freq": float(base)}
+
+def _celulas(eixo, x):
+    # índice da célula e peso do vizinho de cima (x preso à faixa do eixo)
+    x = np.clip(np.asarray(x, dtype=float), eixo[0], eixo[-1])
+    i = np.clip(np.searchsorted(eixo, x, side="right") - 1, 0, len(eixo) - 2)
+    return i, (x - eixo[i]) / (eixo[i + 1] - eixo[i])
+
+def interpolate(sup, freq_scale, carga_pct, amb, vent_factor):
+    """Temperatura interpolada (multilinear) nos pontos dados; os argumentos fazem broadcast."""
+    celulas = [_celulas(sup["eixos"][k], x) for k, x in zip(EIXOS, (freq_scale, carga_pct, amb, vent_factor))]
+    temp = sup["temp"]
+    total = 0.0
+    for canto in itertools.product((0, 1), repeat=len(EIXOS)):
+        peso = 1.0
+        for c, (_, w) in zip(canto, celulas):
+            peso = peso * (w if c else 1.0 - w)
+        total = total + peso * temp[tuple(i + c for c, (i, _) in zip(canto, celulas))]
+    return total
+
+def surface_slice(sup, amb, vent_factor):
+    """Corte freq_scale × carga da grade em (amb, vent_factor), para o gráfico de contorno."""
+    eixos = sup["eixos"]
+    return interpolate(sup, eixos["freq_scale"][:, None], eixos["carga_pct"][None, :], amb, vent_factor)
+
+# ---------------------------
+# CACHE COMPARTILHADO (LRU por bytes)
+# ---------------------------
+class SurfaceCache:
+    """
+    Grades por (CPU, cooler, perfil, PL2, versão do modelo), limitadas a `limite_mb` no total.
+    Duas sessões pedindo o mesmo par ao mesmo tempo esperam uma única construção.
+    - get(..., versao): a versão do modelo vem de quem chama (a UI calcula uma vez por rerun);
+      sem ela, model_version() é consultado a cada chamada.
+    """
+
+    def __init__(self, limite_mb=LIMITE_PADRAO_MB):
+        self.limite_bytes = int(limite_mb * 1e6)
+        self.bytes = 0
+        self.acertos = self.faltas = self.despejos = 0
+        self._grades = OrderedDict()
+        self._trava = threading.Lock()
+        self._construindo = {}
+
+    def get(self, cpu, cooler, perfil="Bench sustentado (Cinebench)", permitir_pl2=True, versao=None):
+        chave = (cpu["modelo"], cooler["modelo"], perfil, bool(permitir_pl2), versao or model_version())
+        with self._trava:
+            sup = self._grades.get(chave)
+            if sup is not None:
+                self._grades.move_to_end(chave)
+                self.acertos += 1
+                return sup
+            self.faltas += 1
+            trava_chave = self._construindo.setdefault(chave, threading.Lock())
+        with trava_chave:
+            with self._trava:
+                sup = self._grades.get(chave)
+            if sup is None:
+                sup = build_surface(cpu, cooler, perfil, permitir_pl2)
+                self._guardar(chave, sup)
+        with self._trava:
+            self._construindo.pop(chave, None)
+        return sup
+
+    def _guardar(self, chave, sup):
+        with self._trava:
+            self._grades[chave] = sup
+            self.bytes += sup["temp"].nbytes
+            # entradas de outras versões do modelo nunca mais serão pedidas
+            for antiga in [k for k in self._grades if k[-1] != chave[-1]]:
+                self.bytes -= self._grades.pop(antiga)["temp"].nbytes
+            while self.bytes > self.limite_bytes and len(self._grades) > 1:
+                _, despejada = self._grades.popitem(last=False)
+                self.bytes -= despejada["temp"].nbytes
+                self.despejos += 1
+
+    def clear(self):
+        """Descarta todas as grades (os contadores são zerados junto)."""
+        with self._trava:
+            self._grades.clear()
+            self.bytes = 0
+            self.acertos = self.faltas = self.despejos = 0
+
+    def stats(self):
+        with self._trava:
+            return {"grades": len(self._grades), "bytes": self.bytes, "limite_bytes": self.limite_bytes,
+                    "acertos": self.acertos, "faltas": self.faltas, "despejos": self.despejos}
+
+_compartilhado = SurfaceCache()
+
+def shared_cache():
+    """Cache do processo (todas as sessões Streamlit do servidor usam o mesmo)."""
+    return _compartilhado
@@ -0,0 +1,7 @@
+# conftest.py
+# Os módulos do simulador ficam na raiz do repositório (não há pacote instalável).
+
+import os
+import sys
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
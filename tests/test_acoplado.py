@@ -0,0 +1,74 @@
+# test_acoplado.py
+# Solver acoplado: raiz de g(T) = T, saída antecipada por cenário, motivos e curva da ventoinha.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from acoplado import (
+    CONVERGIU, FUGA_TERMICA, LIMITE_ITERACOES, FAN_CURVE, LEAK_TEMP_COEF, LEAK_T_REF, RPM_REF,
+    fan_curve_batch, parse_fan_curve, solve_coupled,
+)
+from motor import cpu_power_model_batch
+
+def g_direto(T, cpu_cols, cooler_cols, carga, profile, escala, amb, vent_factor, permitir_pl2, curva=FAN_CURVE):
+    """g(T) = amb + P(T)·R(T) + hotspot, escrito direto a partir das fórmulas do módulo."""
+    leak_ref = 0.02 * cpu_cols["tdp"] * (1 + 0.15 * (escala - 1.0))
+    bruta = cpu_power_model_batch(cpu_cols["tdp"], carga, profile, escala) - leak_ref \
+        + leak_ref * np.exp(LEAK_TEMP_COEF * (T - LEAK_T_REF))
+    P = np.clip(bruta, 0.0, cpu_cols["pl2"] if permitir_pl2 else cpu_cols["pl1"])
+    rpm = np.maximum(fan_curve_batch(T, curva)[0], 1.0)
+    R = cpu_cols["r_cs"] + cooler_cols["r_hs"] / vent_factor * (RPM_REF / rpm) ** 0.8
+    return amb + P * R + cpu_cols["hotspot"]
+
+def grade():
+    cpu_cols = {k: v[:, None, None] for k, v in CPUS.arrays().items()}
+    cooler_cols = {k: v[None, :, None] for k, v in COOLERS.arrays().items()}
+    carga = np.array([20.0, 80.0, 150.0])[None, None, :]
+    return cpu_cols, cooler_cols, carga
+
+@pytest.mark.parametrize("permitir_pl2", [True, False])
+def test_converged_scenarios_are_fixed_points(permitir_pl2):
+    cpu_cols, cooler_cols, carga = grade()
+    sol = solve_coupled(cpu_cols, cooler_cols, carga, 1.1, 1.2, 35.0, 0.8, permitir_pl2, tol=1e-4)
+    assert sol["convergiu"].all()
+    assert np.array_equal(sol["convergiu"], sol["motivo"] == CONVERGIU)
+    g = g_direto(sol["temp_steady"], cpu_cols, cooler_cols, carga, 1.1, 1.2, 35.0, 0.8, permitir_pl2)
+    np.testing.assert_allclose(g, sol["temp_steady"], atol=1e-3)
+
+def test_each_scenario_stops_on_its_own():
+    cpu_cols, cooler_cols, carga = grade()
+    sol = solve_coupled(cpu_cols, cooler_cols, carga, 1.0, 1.0, 25.0, 1.0)
+    # cenários fáceis saem em poucas iterações, os difíceis continuam no mesmo lote
+    assert sol["iteracoes"].min() < sol["iteracoes"].max()
+    assert sol["iteracoes"].shape == sol["temp_steady"].shape
+    um = solve_coupled(CPUS.arrays([3]), COOLERS.arrays([5]), 80.0, 1.0, 1.0, 25.0, 1.0)
+    assert um["iteracoes"][0] == sol["iteracoes"][3, 5, 1]
+    assert um["temp_steady"][0] == pytest.approx(sol["temp_steady"][3, 5, 1])
+
+def test_iteration_limit_is_not_runaway():
+    sol = solve_coupled(CPUS.arrays([0]), COOLERS.arrays([0]), 100.0, 1.0, 1.0, 25.0, 0.2, max_iter=1)
+    assert sol["motivo"][0] == LIMITE_ITERACOES and not sol["convergiu"][0] and sol["iteracoes"][0] == 1
+
+def test_runaway_needs_unbounded_power():
+    cpu_cols, cooler_cols = dict(CPUS.arrays([0])), dict(COOLERS.arrays([0]))
+    cpu_cols["tdp"] = np.array([1000.0])       # leakage grande o bastante para g' >= 1
+    livre = dict(cpu_cols, pl1=np.array([1e9]), pl2=np.array([1e9]))
+    sol = solve_coupled(livre, cooler_cols, 100.0, 1.0, 1.0, 25.0, 1.0, max_iter=200)
+    assert sol["motivo"][0] == FUGA_TERMICA and not sol["convergiu"][0]
+    # o mesmo cenário com a potência presa no PL2 tem raiz (mesmo que muito acima de 200 °C)
+    preso = dict(cpu_cols, pl1=np.array([1000.0]), pl2=np.array([1200.0]))
+    sol = solve_coupled(preso, cooler_cols, 100.0, 1.0, 1.0, 25.0, 1.0, max_iter=200)
+    assert sol["motivo"][0] == CONVERGIU and sol["temp_steady"][0] > 200.0
+    assert sol["potencia_aplicada"][0] == pytest.approx(1200.0)
+
+def test_parse_fan_curve():
+    assert parse_fan_curve("70:1600, 30:600,50:900") == ((30.0, 600.0), (50.0, 900.0), (70.0, 1600.0))
+    for texto in ("", "40:800", "40-800, 60:1200", "a:b, 60:1200"):
+        with pytest.raises(ValueError):
+            parse_fan_curve(texto)
+
+def test_fan_curve_slope():
+    rpm, drpm = fan_curve_batch(np.array([20.0, 40.0, 60.0, 90.0]))
+    np.testing.assert_allclose(rpm, [600.0, 750.0, 1250.0, 2200.0])
+    np.testing.assert_allclose(drpm, [0.0, 15.0, 35.0, 0.0])
@@ -0,0 +1,125 @@
+# test_cache_disco.py
+# Cache em disco: acertos/faltas, LRU por tamanho, versões do modelo e acesso concorrente.
+
+import os
+import sqlite3
+import threading
+import time
+from concurrent.futures import ProcessPoolExecutor
+
+import pytest
+
+import cache_disco
+from cache_disco import IDADE_VERSAO_ANTIGA_S, DiskCache, make_key, model_version, quantize_params
+
+VALOR = b"x" * 1000
+
+@pytest.fixture
+def caminho(tmp_path):
+    return str(tmp_path / "cache.sqlite")
+
+def test_hits_misses_and_compute_once(caminho):
+    c = DiskCache(caminho, limite_mb=1)
+    chamadas = []
+    for _ in range(5):
+        assert c.get_or_compute("sim", "v1", ["a", 1], lambda: chamadas.append(1) or {"t": 42.0}) == {"t": 42.0}
+    assert len(chamadas) == 1
+    ns = c.stats()["namespaces"]["sim"]
+    assert (ns["acertos"], ns["faltas"], ns["gravacoes"], ns["entradas"]) == (4, 1, 1, 1)
+    assert ns["taxa_acerto_pct"] == 80.0
+    # outra instância (outra sessão/processo) enxerga o mesmo banco
+    assert DiskCache(caminho, limite_mb=1).get("sim", "v1", ["a", 1]) == (True, {"t": 42.0})
+
+def test_size_bounded_lru_eviction(caminho):
+    c = DiskCache(caminho, limite_mb=0.01)      # 10 kB: cabem ~9 valores de 1 kB
+    for i in range(9):
+        c.put("x", "v", [i], VALOR)
+        time.sleep(0.002)
+    assert c.get("x", "v", [0])[0]              # 0 passa a ser o mais recente
+    for i in range(9, 14):
+        c.put("x", "v", [i], VALOR)
+        time.sleep(0.002)
+    s = c.stats()
+    assert s["bytes"] <= c.limite_bytes
+    assert c.get("x", "v", [0])[0] and c.get("x", "v", [13])[0]
+    assert not c.get("x", "v", [1])[0]         # o menos usado saiu
+    assert s["namespaces"]["x"]["despejos"] == 14 - s["entradas"]
+    # valor maior que o limite inteiro não é gravado
+    c.put("x", "v", ["grande"], b"y" * 20_000)
+    assert not c.get("x", "v", ["grande"])[0]
+
+def test_version_change_misses_but_keeps_recent_entries(caminho):
+    antiga, nova = DiskCache(caminho, limite_mb=1), DiskCache(caminho, limite_mb=1)
+    antiga.put("sim", "v1", ["a"], 1)
+    assert nova.get("sim", "v2", ["a"]) == (False, None)
+    nova.put("sim", "v2", ["a"], 2)
+    # o processo ainda na versão anterior não perde as suas entradas
+    assert antiga.get("sim", "v1", ["a"]) == (True, 1)
+    assert nova.get("sim", "v2", ["a"]) == (True, 2)
+
+def test_old_versions_age_out(caminho):
+    c = DiskCache(caminho, limite_mb=1)
+    c.put("sim", "v1", ["velha"], 1)
+    c.put("sim", "v1", ["recente"], 2)
+    c.put("outro", "v1", ["velha"], 3)
+    with sqlite3.connect(caminho) as con:
+        con.execute("UPDATE entradas SET acesso = ? WHERE chave IN (?, ?)",
+                    (time.time() - IDADE_VERSAO_ANTIGA_S - 10, make_key("sim", "v1", ["velha"]),
+                     make_key("outro", "v1", ["velha"])))
+    nova = DiskCache(caminho, limite_mb=1)
+    nova.put("sim", "v2", ["a"], 4)
+    assert not nova.get("sim", "v1", ["velha"])[0]
+    assert nova.get("sim", "v1", ["recente"]) == (True, 2)
+    assert nova.get("outro", "v1", ["velha"]) == (True, 3)    # só o namespace gravado é limpo
+
+def test_disabled_cache_always_computes(caminho):
+    c = DiskCache(caminho, limite_mb=0)
+    assert [c.get_or_compute("s", "v", [1], lambda: 5) for _ in range(2)] == [5, 5]
+    assert c.stats()["entradas"] == 0 and not os.path.exists(caminho)
+
+def test_concurrent_threads(caminho):
+    c = DiskCache(caminho, limite_mb=5)
+    erros = []
+
+    def sessao(k):
+        try:
+            for i in range(60):
+                assert c.get_or_compute("t", "v", [i % 10], lambda: i % 10) == i % 10
+        except Exception as exc:      # noqa: BLE001
+            erros.append(exc)
+
+    threads = [threading.Thread(target=sessao, args=(k,)) for k in range(8)]
+    for t in threads:
+        t.start()
+    for t in threads:
+        t.join()
+    assert erros == [] and c.erros == 0
+    ns = c.stats()["namespaces"]["t"]
+    assert ns["acertos"] + ns["faltas"] == 8 * 60 and ns["entradas"] == 10
+
+def _processo(caminho):
+    c = DiskCache(caminho, limite_mb=5)
+    for i in range(100):
+        assert c.get_or_compute("p", "v", [i % 20], lambda: i % 20) == i % 20
+    c.flush()
+    return c.erros
+
+def test_concurrent_processes(caminho):
+    with ProcessPoolExecutor(3) as pool:
+        assert list(pool.map(_processo, [caminho] * 3)) == [0, 0, 0]
+    ns = DiskCache(caminho, limite_mb=5).stats()["namespaces"]["p"]
+    assert ns["acertos"] + ns["faltas"] == 300 and ns["entradas"] == 20
+
+def test_model_version_follows_file_contents(tmp_path):
+    arquivo = tmp_path / "modelo.py"
+    arquivo.write_text("A = 1\n")
+    v1 = model_version(str(arquivo))
+    assert model_version(str(arquivo)) == v1
+    arquivo.write_text("A = 22\n")
+    assert model_version(str(arquivo)) != v1
+    assert model_version() == model_version(*cache_disco.ARQUIVOS_MODELO)
+
+def test_quantize_params():
+    p = quantize_params({"carga_pct": 99.6, "freq_ghz": 4.499999999, "amb": 25.04, "vent": "Moderado"})
+    assert p == {"carga_pct": 100.0, "freq_ghz": 4.5, "amb": 25.0, "vent": "Moderado"}
+    assert quantize_params({"freq_ghz": None}) == {"freq_ghz": None}
@@ -0,0 +1,108 @@
+# test_catalogo.py
+# Catálogo colunar: mesmo resultado lendo CSV, JSON, JSON Lines ou Parquet; colunas
+# compartilhadas somente leitura; índices de where()/subset() × varredura dos registros.
+
+import csv
+import json
+import os
+
+import numpy as np
+import pytest
+
+from catalogo import (
+    CPUS, COOLERS, CPU_CAMPOS, COOLER_CAMPOS, CPU_INDICES, COOLER_INDICES, DADOS_DIR,
+    load_cpus, load_coolers, read_records,
+)
+from motor import cpu_arrays, cooler_arrays
+
+CARREGAR = {"cpus": (load_cpus, CPU_CAMPOS), "coolers": (load_coolers, COOLER_CAMPOS)}
+
+def converter(nome, ext, pasta):
+    """Grava dados/<nome>.csv no formato `ext` (valores tipados, como um exportador faria)."""
+    _, campos = CARREGAR[nome]
+    registros = read_records(os.path.join(DADOS_DIR, f"{nome}.csv"), campos)
+    destino = os.path.join(pasta, f"{nome}{ext}")
+    if ext == ".json":
+        with open(destino, "w", encoding="utf-8") as f:
+            json.dump(registros, f, ensure_ascii=False)
+    elif ext == ".jsonl":
+        with open(destino, "w", encoding="utf-8") as f:
+            f.writelines(json.dumps(r, ensure_ascii=False) + "\n" for r in registros)
+    else:
+        import pandas as pd
+        pd.read_csv(os.path.join(DADOS_DIR, f"{nome}.csv")).to_parquet(destino)
+    return destino
+
+@pytest.mark.parametrize("ext", [".json", ".jsonl", ".parquet"])
+@pytest.mark.parametrize("nome", list(CARREGAR))
+def test_same_catalog_from_every_format(nome, ext, tmp_path):
+    carregar, _ = CARREGAR[nome]
+    csv_ = carregar()
+    outro = carregar(converter(nome, ext, str(tmp_path)))
+    assert outro.registros == csv_.registros
+    for r_csv, r_outro in zip(csv_.registros, outro.registros):
+        assert [type(v) for v in r_outro.values()] == [type(v) for v in r_csv.values()]
+    assert outro.arrays().keys() == csv_.arrays().keys()
+    for k, v in csv_.arrays().items():
+        assert np.array_equal(outro.arrays()[k], v) and outro.arrays()[k].dtype == v.dtype
+    assert {c: {v: ix.tolist() for v, ix in g.items()} for c, g in outro.indices.items()} == \
+           {c: {v: ix.tolist() for v, ix in g.items()} for c, g in csv_.indices.items()}
+
+def test_missing_fields_use_model_defaults(tmp_path):
+    caminho = tmp_path / "coolers.csv"
+    with open(caminho, "w", newline="", encoding="utf-8") as f:
+        w = csv.writer(f)
+        w.writerow(["modelo", "tipo", "tdp_manufacturer", "ruido_db", "durabilidade_anos"])
+        w.writerow(["Sem ruído", "Air", "150", "", "6"])
+    cat = load_coolers(str(caminho))
+    assert "ruido_db" not in cat[0]
+    assert cat.arrays()["ruido_db"][0] == cooler_arrays([cat[0]])["ruido_db"][0] == 30.0
+    with pytest.raises(ValueError, match="não suportado"):
+        read_records(str(tmp_path / "coolers.xlsx"), COOLER_CAMPOS)
+
+def test_shared_columns_are_read_only():
+    for cat, referencia in ((CPUS, cpu_arrays(list(CPUS))), (COOLERS, cooler_arrays(list(COOLERS)))):
+        cols = cat.arrays()
+        for k, v in cols.items():
+            assert not v.flags.writeable
+            with pytest.raises(ValueError):
+                v[0] = v[0]
+            assert np.array_equal(v, referencia[k])
+        for v in cat.colunas.values():
+            assert not v.flags.writeable
+        # trocar uma chave do dicionário devolvido não muda o catálogo
+        cols["tdp" if cat is CPUS else "nominal"] = None
+        assert cat.arrays()["tdp" if cat is CPUS else "nominal"] is not None
+        # com posições, cópias que quem chama pode alterar à vontade
+        for v in cat.arrays([2, 0]).values():
+            v[...] = 0
+        for k, v in cat.arrays().items():
+            assert np.array_equal(v, referencia[k])
+        for campo in cat.indices:
+            for valor in cat.valores(campo):
+                assert not cat.where(campo, valor).flags.writeable
+
+@pytest.mark.parametrize("cat, campos", [(CPUS, CPU_INDICES), (COOLERS, COOLER_INDICES)])
+def test_where_and_subset_indices(cat, campos):
+    for campo in campos:
+        valores = {r.get(campo) for r in cat}
+        assert cat.valores(campo) == sorted(v for v in valores if v is not None)
+        for valor in valores:
+            assert cat.where(campo, valor).tolist() == [i for i, r in enumerate(cat) if r.get(campo) == valor]
+        assert cat.where(campo, "não existe").size == 0
+
+    rng = np.random.default_rng(2)
+    pos = rng.choice(len(cat), size=len(cat) // 3, replace=False)
+    sub = cat.subset(pos)
+    assert len(sub) == pos.size and sub.registros == [cat[i] for i in pos]
+    assert sub.modelos() == cat.modelos(pos)
+    for k, v in cat.arrays(pos).items():
+        assert np.array_equal(sub.arrays()[k], v)
+    for i, r in enumerate(sub):
+        assert sub.posicao[r["modelo"]] == i and sub.get(r["modelo"]) is r
+    # índices refeitos com as posições do subconjunto
+    for campo in campos:
+        for valor in {r.get(campo) for r in sub}:
+            assert sub.where(campo, valor).tolist() == [i for i, r in enumerate(sub) if r.get(campo) == valor]
+            assert sorted(pos[sub.where(campo, valor)]) == sorted(set(cat.where(campo, valor)) & set(pos))
+    assert sub.get(next(m for m in cat.modelos() if m not in set(sub.modelos()))) is None
@@ -0,0 +1,87 @@
+# test_desempenho.py
+# Contadores de chamadas: só a thread que mede conta, nenhuma referência de módulo é
+# trocada, e reruns interrompidos (sem stop()) não deixam a contagem ligada.
+
+import gc
+import sys
+import threading
+import tracemalloc
+import types
+
+import desempenho
+import motor
+from catalogo import CPUS, COOLERS
+from desempenho import Collector, measure, span, start, stop
+
+def referencias():
+    """(módulo, nome) → objeto, para tudo o que os módulos carregados expõem."""
+    return {(m.__name__, k): id(v) for m in list(sys.modules.values()) if isinstance(m, types.ModuleType)
+            for k, v in list(vars(m).items()) if callable(v)}
+
+def test_counts_only_in_the_measuring_thread():
+    outras = []
+
+    def outra_sessao(pronto, pode_sair):
+        pronto.set()
+        for _ in range(10):
+            motor.simulate(CPUS[1], COOLERS[1])
+        outras.append(desempenho.current())
+        pode_sair.wait()
+
+    pronto, pode_sair = threading.Event(), threading.Event()
+    with measure(Collector("a")) as c:
+        t = threading.Thread(target=outra_sessao, args=(pronto, pode_sair))
+        t.start()
+        pronto.wait()
+        with span("simular"):
+            for _ in range(3):
+                motor.simulate(CPUS[0], COOLERS[0])
+        pode_sair.set()
+        t.join()
+    assert c.contadores == {"simulate": 3}
+    assert outras == [None]
+    assert [s["nome"] for s in c.spans] == ["rerun", "simular"]
+
+def test_start_stop_leaves_module_references_alone():
+    antes = referencias()
+    original = motor.simulate
+    c = start(Collector("b"))
+    assert desempenho._ligado
+    # referência tomada depois do start() (import tardio) também conta
+    tardio = types.ModuleType("tardio")
+    exec("from motor import simulate", tardio.__dict__)
+    tardio.simulate(CPUS[0], COOLERS[0])
+    original(CPUS[0], COOLERS[0])
+    assert stop() is c
+    assert c.contadores["simulate"] == 2
+    assert motor.simulate is original and tardio.simulate is original
+    assert referencias() == antes
+    assert not desempenho._ligado and desempenho._ativos == 0
+    # desligado, nada é contado
+    motor.simulate(CPUS[0], COOLERS[0])
+    assert c.contadores["simulate"] == 2
+
+def test_interrupted_rerun_does_not_leak():
+    # rerun que termina sem stop() (st.stop(), RerunException): a thread do script morre
+    coletores = []
+
+    def rerun_interrompido():
+        coletores.append(start(Collector("interrompido", memoria=True)))
+        motor.simulate(CPUS[0], COOLERS[0])
+
+    t = threading.Thread(target=rerun_interrompido)
+    t.start()
+    t.join()
+    del t
+    gc.collect()
+    assert coletores[0].contadores["simulate"] == 1
+    assert not desempenho._ligado and desempenho._ativos == 0
+    assert not tracemalloc.is_tracing()
+
+    # na mesma thread, o próximo start() encerra o anterior
+    start(Collector("1"))
+    segundo = start(Collector("2"))
+    assert desempenho._ativos == 1
+    assert stop() is segundo
+    assert not desempenho._ligado and desempenho._ativos == 0
+    assert stop() is None
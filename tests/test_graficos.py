@@ -0,0 +1,92 @@
+# test_graficos.py
+# Gráficos PNG: nenhuma figura fica no gerenciador do pyplot, a legenda do transiente
+# tem as duas séries, e as imagens cacheadas pela interface são chaveadas por valores simples.
+
+import functools
+import os
+
+import matplotlib
+matplotlib.use("Agg")
+import matplotlib.pyplot as plt
+import numpy as np
+import pytest
+
+import graficos
+from graficos import (
+    contour_png, heatmap_png, histogram_png, power_capacity_png, temp_power_png, tornado_png, transient_png,
+)
+
+PNG = b"\x89PNG\r\n\x1a\n"
+t = np.linspace(0.0, 60.0, 500)
+RENDERIZACOES = {
+    "temp_power": lambda: temp_power_png(125.0, 180.0, 88.0, 0.31, 25.0, 8.0),
+    "power_capacity": lambda: power_capacity_png(180.0, 210.0),
+    "transient": lambda: transient_png(t, 40 + 50 * (1 - np.exp(-t / 8)), np.where(t < 28, 250.0, 180.0), 95.0),
+    "histogram": lambda: histogram_png(np.linspace(60, 100, 41), np.full(40, 2.5), 95.0),
+    "heatmap": lambda: heatmap_png(np.arange(12.0).reshape(3, 4), ["a", "b", "c"], ["w", "x", "y", "z"]),
+    "tornado": lambda: tornado_png(["amb", "carga"], [70.0, 72.0], [80.0, 85.0], 76.0, ["20", "80"], ["30", "120"]),
+    "contour": lambda: contour_png(np.linspace(3, 6, 10), np.linspace(10, 150, 12),
+                                   np.add.outer(np.linspace(50, 90, 10), np.linspace(0, 30, 12)), 95.0, (4.5, 100.0)),
+}
+
+@pytest.mark.parametrize("nome", list(RENDERIZACOES))
+def test_no_figures_left_in_pyplot(nome):
+    plt.close("all")
+    png = RENDERIZACOES[nome]()
+    assert png.startswith(PNG)
+    assert plt.get_fignums() == []
+
+def test_transient_legend_has_both_series(monkeypatch):
+    figuras = []
+    original = graficos._png
+
+    def guardando(fig):
+        figuras.append(fig)
+        return original(fig)
+
+    monkeypatch.setattr(graficos, "_png", guardando)
+    RENDERIZACOES["transient"]()
+    legenda = figuras[0].axes[0].get_legend()
+    assert legenda is not None
+    assert [x.get_text() for x in legenda.get_texts()] == ["Temperatura (°C)", "Potência (W)"]
+
+def simples(v):
+    if isinstance(v, (tuple, list)):
+        return all(simples(x) for x in v)
+    if isinstance(v, dict):
+        return all(type(k) is str and simples(x) for k, x in v.items())
+    return v is None or type(v) in (str, int, float, bool)
+
+def test_image_cache_keys_are_plain_values(monkeypatch, tmp_path):
+    # espiona o st.cache_data das funções *_image(s) da interface num rerun com "Simular" clicado
+    import streamlit as st
+    from streamlit.testing.v1 import AppTest
+
+    import cache_disco
+    monkeypatch.setattr(cache_disco, "_padrao", cache_disco.DiskCache(str(tmp_path / "cache.sqlite")))
+    chamadas = []
+    real = st.cache_data
+
+    def espiao(fn=None, **opcoes):
+        if fn is None:
+            return lambda f: espiao(f, **opcoes)
+        cacheada = real(fn, **opcoes)
+        if not fn.__name__.endswith(("_image", "_images")):
+            return cacheada
+
+        @functools.wraps(fn)
+        def chamando(*args, **kwargs):
+            chamadas.append((fn.__name__, args, kwargs))
+            return cacheada(*args, **kwargs)
+        return chamando
+
+    espiao.clear = real.clear
+    monkeypatch.setattr(st, "cache_data", espiao)
+    script = os.path.join(os.path.dirname(os.path.abspath(graficos.__file__)), "simulador_refrigeracao.py")
+    at = AppTest.from_file(script, default_timeout=120)
+    at.run()
+    next(b for b in at.button if b.label == "Simular").click().run()
+    assert not at.exception
+    assert {"simulate_images", "surface_contour_image"} <= {nome for nome, _, _ in chamadas}
+    for nome, args, kwargs in chamadas:
+        assert simples(list(args)) and simples(kwargs), (nome, [type(a) for a in args])
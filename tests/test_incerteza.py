@@ -0,0 +1,62 @@
+# test_incerteza.py
+# Monte Carlo: mesmo resultado com qualquer número de processos, e percentis do
+# histograma em fluxo × percentis exatos das amostras.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from incerteza import HIST_FAIXA, PERCENTIS, StreamingStats, monte_carlo, sample_temperatures
+
+CPU = next(c for c in CPUS if c.get("fabricante") == "AMD")     # AMD: hotspot também é sorteado
+COOLER = COOLERS[len(COOLERS) // 2]
+PARAMS = {"carga_pct": 110, "amb": 30.0}
+N, BLOCO, SEMENTE = 45_000, 7_000, 1234     # último bloco incompleto de propósito
+
+def amostras_exatas():
+    """Todas as temperaturas, refazendo os blocos com as mesmas sementes de monte_carlo."""
+    n_blocos = -(-N // BLOCO)
+    sementes = np.random.SeedSequence(SEMENTE).spawn(n_blocos)
+    tamanhos = [BLOCO] * (n_blocos - 1) + [N - BLOCO * (n_blocos - 1)]
+    return np.concatenate([sample_temperatures(CPU, COOLER, PARAMS, n, np.random.default_rng(s))
+                           for n, s in zip(tamanhos, sementes)])
+
+def confere_quantil(x, q, v):
+    """v é um quantil q de x a menos de uma faixa do histograma: q·n amostras ficam até v ± HIST_FAIXA."""
+    assert np.sum(x < v - HIST_FAIXA) <= q * x.size <= np.sum(x <= v + HIST_FAIXA), (q, v)
+
+@pytest.fixture(scope="module")
+def serial():
+    return monte_carlo(CPU, COOLER, PARAMS, N, semente=SEMENTE, tamanho_bloco=BLOCO, processos=1)
+
+@pytest.mark.parametrize("processos", [2, 3])
+def test_same_result_for_any_process_count(serial, processos):
+    r = monte_carlo(CPU, COOLER, PARAMS, N, semente=SEMENTE, tamanho_bloco=BLOCO, processos=processos)
+    assert np.array_equal(r["stats"].contagens, serial["stats"].contagens)
+    for k in ("n", "min", "max", "prob_throttle", "percentis"):
+        assert r[k] == serial[k]
+    # a ordem de combinação dos blocos muda só o arredondamento da média e do desvio
+    assert r["media"] == pytest.approx(serial["media"], rel=1e-12)
+    assert r["desvio"] == pytest.approx(serial["desvio"], rel=1e-9)
+
+def test_statistics_match_exact_samples(serial):
+    x = amostras_exatas()
+    assert serial["n"] == x.size
+    assert serial["media"] == pytest.approx(x.mean(), rel=1e-12)
+    assert serial["desvio"] == pytest.approx(x.std(ddof=1), rel=1e-9)
+    assert (serial["min"], serial["max"]) == (x.min(), x.max())
+    assert serial["prob_throttle"] == pytest.approx(np.mean(x >= 95.0))
+    for p in PERCENTIS:
+        confere_quantil(x, p / 100.0, serial["percentis"][p])
+
+@pytest.mark.parametrize("semente", range(3))
+def test_streaming_quantiles_across_blocks(semente):
+    rng = np.random.default_rng(semente)
+    blocos = [rng.normal(70.0, 12.0, int(n)) for n in rng.integers(1, 5_000, 12)]
+    stats = StreamingStats()
+    for b in blocos:
+        stats.update(b)
+    x = np.concatenate(blocos)
+    for q in (0.001, 0.01, 0.25, 0.5, 0.9, 0.999):
+        confere_quantil(x, q, stats.quantile(q))
+    assert stats.quantile(0.0) == x.min() and stats.quantile(1.0) == x.max()
@@ -0,0 +1,101 @@
+# test_lote.py
+# CLI de lote (lote.main) × simulate()/summary_record, nos três formatos de saída.
+
+import json
+
+import numpy as np
+import pandas as pd
+import pytest
+
+import lote
+from catalogo import CPUS, COOLERS
+from motor import WORKLOAD_PROFILES, VENT_FACTORS, SUMMARY_COLUMNS, simulate, summary_record
+
+def cenarios(n, semente=0):
+    rng = np.random.default_rng(semente)
+    linhas = []
+    for _ in range(n):
+        cpu = CPUS[int(rng.integers(len(CPUS)))]
+        linha = {"cpu": cpu["modelo"], "cooler": COOLERS[int(rng.integers(len(COOLERS)))]["modelo"],
+                 "carga_pct": int(rng.integers(10, 151)), "perfil": str(rng.choice(list(WORKLOAD_PROFILES))),
+                 "amb": round(float(rng.uniform(10, 45)), 1), "vent": str(rng.choice(list(VENT_FACTORS))),
+                 "permitir_pl2": bool(rng.integers(2))}
+        if rng.random() < 0.5:      # metade com frequência manual, metade no turbo (coluna vazia)
+            linha["freq_ghz"] = round(float(rng.uniform(0.9, 1.4) * (cpu.get("frequencia_base") or 3.0)), 2)
+        linhas.append(linha)
+    return linhas
+
+def esperado(linhas):
+    saida = []
+    for linha in linhas:
+        cpu = CPUS.get(linha["cpu"])
+        params = {k: v for k, v in linha.items() if k not in ("cpu", "cooler")}
+        saida.append(summary_record(cpu, simulate(cpu, COOLERS.get(linha["cooler"]), params)))
+    return pd.DataFrame(saida, columns=list(SUMMARY_COLUMNS))
+
+def ler(caminho, formato):
+    if formato == "csv":
+        return pd.read_csv(caminho)
+    if formato == "jsonl":
+        return pd.read_json(caminho, lines=True)
+    return pd.read_parquet(caminho)
+
+def confere(obtido, linhas):
+    exp = esperado(linhas)
+    assert list(obtido.columns[-len(SUMMARY_COLUMNS):]) == list(SUMMARY_COLUMNS)
+    assert len(obtido) == len(exp)
+    for c in SUMMARY_COLUMNS:
+        if not pd.api.types.is_numeric_dtype(exp[c]):
+            assert obtido[c].astype(str).tolist() == exp[c].astype(str).tolist(), c
+        else:
+            np.testing.assert_allclose(obtido[c].to_numpy(float), exp[c].to_numpy(float), rtol=0, atol=1e-9, err_msg=c)
+
+@pytest.mark.parametrize("formato", ["csv", "jsonl", "parquet"])
+@pytest.mark.parametrize("processos", [1, 2])
+def test_cli_matches_simulate(tmp_path, formato, processos):
+    linhas = cenarios(300)
+    pd.DataFrame(linhas).to_csv(tmp_path / "cenarios.csv", index=False)
+    saida = tmp_path / f"resultados.{formato}"
+    assert lote.main([str(tmp_path / "cenarios.csv"), "-o", str(saida), "--bloco", "64",
+                      "--processos", str(processos)]) == 0
+    confere(ler(saida, formato), linhas)
+
+def test_all_rejected_first_chunk_parquet(tmp_path):
+    # o primeiro bloco só tem linhas rejeitadas: o esquema do Parquet não pode sair com colunas nulas
+    linhas = [{"cpu": "CPU inexistente", "cooler": COOLERS[0]["modelo"]},
+              {"cpu": CPUS[0]["modelo"], "cooler": "cooler inexistente"}] + cenarios(9, semente=1)
+    entrada = tmp_path / "cenarios.jsonl"
+    entrada.write_text("".join(json.dumps(l, ensure_ascii=False) + "\n" for l in linhas), encoding="utf-8")
+    saida = tmp_path / "resultados.bin"
+    assert lote.main([str(entrada), "-o", str(saida), "--formato", "parquet", "--bloco", "2"]) == 0
+
+    import pyarrow.parquet as pq
+    esquema = pq.read_schema(saida)
+    tipos = {c: str(esquema.field(c).type) for c in SUMMARY_COLUMNS}
+    assert tipos["cpu"] == "string" and tipos["tdp_ref_W"] == "int64" and tipos["temp_steady_C"] == "double"
+    confere(pd.read_parquet(saida), linhas[2:])
+
+def test_only_rejected_rows_still_write_output(tmp_path):
+    entrada = tmp_path / "cenarios.csv"
+    pd.DataFrame([{"cpu": "nenhum", "cooler": "nenhum"}]).to_csv(entrada, index=False)
+    for formato in ("parquet", "csv"):
+        saida = tmp_path / f"vazio.{formato}"
+        assert lote.main([str(entrada), "-o", str(saida)]) == 0
+        vazio = ler(saida, formato)
+        assert list(vazio.columns) == list(SUMMARY_COLUMNS) and len(vazio) == 0
+
+def test_input_columns_are_echoed(tmp_path):
+    linhas = cenarios(20, semente=2)
+    pd.DataFrame(linhas).to_csv(tmp_path / "cenarios.csv", index=False)
+    saida = tmp_path / "resultados.parquet"
+    assert lote.main([str(tmp_path / "cenarios.csv"), "-o", str(saida), "--com-entrada", "--bloco", "7"]) == 0
+    df = pd.read_parquet(saida)
+    assert list(df.columns) == lote.output_columns(com_entrada=True)
+    assert df["entrada_cooler"].tolist() == [l["cooler"] for l in linhas]
+    assert df["entrada_permitir_pl2"].tolist() == [l["permitir_pl2"] for l in linhas]
+    confere(df, linhas)
+
+def test_bad_output_extension_is_an_error(tmp_path):
+    entrada = tmp_path / "cenarios.csv"
+    pd.DataFrame(cenarios(2)).to_csv(entrada, index=False)
+    assert lote.main([str(entrada), "-o", str(tmp_path / "saida.xyz")]) == 2
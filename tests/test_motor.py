@@ -0,0 +1,104 @@
+# test_motor.py
+# Motor vetorizado × fórmulas escalares originais (o antigo bloco "Simular").
+
+from math import sqrt
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from motor import (
+    WORKLOAD_PROFILES, VENT_FACTORS, BASE_SAFETY_PCT, HOTSPOT_AMD_C, THROTTLE_TEMP,
+    simulate, compatibility_matrix, compute_PLs, cpu_r_cs, derive_rth_heatsink,
+)
+
+def referencia(cpu, cooler, carga, perfil, freq_ghz, amb, vent, permitir_pl2):
+    """O bloco "Simular" da versão de um arquivo só, passo a passo, em Python puro."""
+    base = cpu.get("frequencia_base", 0.0)
+    escala = freq_ghz / base if base > 0 else 1.0
+    tdp, prof = cpu["tdp"], WORKLOAD_PROFILES[perfil]
+    potencia_modelo = max(0.0, 0.10 * tdp + tdp * (carga / 100.0) * (0.80 * prof) * escala ** 1.20
+                          + 0.02 * tdp * (1 + 0.15 * (escala - 1.0)))
+    pl1, pl2, _ = compute_PLs(cpu)
+    aplicada = min(potencia_modelo, pl2 if permitir_pl2 else pl1)
+    nominal_v = cooler["tdp_nominal"] * VENT_FACTORS[vent] * (1.0 - BASE_SAFETY_PCT)
+    dyn_pct = min(0.20, 0.15 * (aplicada / max(1.0, nominal_v)))
+    cap_eff = nominal_v * (1.0 - dyn_pct)
+    util = round(aplicada / max(1.0, cap_eff) * 100.0, 1) if cap_eff > 0 else 999.9
+    u = max(0.0, min(100.0, util))
+    rpm = 600 if u <= 15 else int(600 + 1600 * ((u - 15) / 85.0))
+    r_tot = cpu_r_cs(cpu) + derive_rth_heatsink(cooler) * (1500.0 / rpm) ** 0.8
+    temp = amb + aplicada * r_tot + (HOTSPOT_AMD_C if cpu.get("fabricante", "Intel").lower() == "amd" else 0.0)
+    b = cooler.get("durabilidade_anos", 5)
+    return {
+        "potencia_modelo": potencia_modelo,
+        "potencia_aplicada": aplicada,
+        "cap_eff": cap_eff,
+        "util_pct": util,
+        "rpm": rpm,
+        "r_total": r_tot,
+        "temp_steady": temp,
+        "throttle": temp >= THROTTLE_TEMP,
+        "ruido_db": round(cooler.get("ruido_db", 30) * (0.6 + 0.4 * sqrt(min(1.0, util / 100.0))), 1),
+        "durabilidade_anos": b if util <= 80 else max(1, int(b * (1.0 - 0.5 * (util - 80) / 20.0))),
+    }
+
+def cenarios(n, semente=0):
+    rng = np.random.default_rng(semente)
+    for _ in range(n):
+        cpu = CPUS[int(rng.integers(len(CPUS)))]
+        cooler = COOLERS[int(rng.integers(len(COOLERS)))]
+        base = cpu.get("frequencia_base", 0.0) or 3.0
+        yield cpu, cooler, {
+            "carga_pct": float(rng.integers(10, 151)),
+            "perfil": str(rng.choice(list(WORKLOAD_PROFILES))),
+            "freq_ghz": round(float(rng.uniform(0.8, 1.5) * base), 2),
+            "amb": round(float(rng.uniform(10, 45)), 1),
+            "vent": str(rng.choice(list(VENT_FACTORS))),
+            "permitir_pl2": bool(rng.integers(2)),
+        }
+
+@pytest.mark.parametrize("semente", range(4))
+def test_simulate_matches_scalar_reference(semente):
+    for cpu, cooler, p in cenarios(250, semente):
+        esperado = referencia(cpu, cooler, p["carga_pct"], p["perfil"], p["freq_ghz"], p["amb"], p["vent"],
+                              p["permitir_pl2"])
+        res = simulate(cpu, cooler, p)
+        for k, v in esperado.items():
+            assert res[k] == pytest.approx(v, rel=1e-12, abs=1e-12), (cpu["modelo"], cooler["modelo"], p, k)
+        assert isinstance(res["rpm"], int) and isinstance(res["durabilidade_anos"], int)
+
+def test_compatibility_matrix_matches_simulate():
+    cpus, coolers = CPUS.subset(np.arange(0, len(CPUS), 3)), COOLERS.subset(np.arange(0, len(COOLERS), 2))
+    ambientes = (18.0, 31.5)
+    m = compatibility_matrix(cpus, coolers, ambientes=ambientes, carga_pct=80.0, permitir_pl2=False)
+    for i, cpu in enumerate(cpus):
+        freq = cpu.get("frequencia_base", 0.0)
+        for j, cooler in enumerate(coolers):
+            for k, perfil in enumerate(WORKLOAD_PROFILES):
+                for a, amb in enumerate(ambientes):
+                    for v, vent in enumerate(VENT_FACTORS):
+                        res = simulate(cpu, cooler, {"carga_pct": 80.0, "perfil": perfil, "freq_ghz": freq or None,
+                                                     "amb": amb, "vent": vent, "permitir_pl2": False})
+                        for chave in ("temp_steady", "util_pct", "rpm", "ruido_db", "throttle"):
+                            assert m[chave][i, j, k, a, v] == pytest.approx(res[chave], rel=1e-12)
+
+def test_scalar_helpers_match_batch():
+    from motor import (
+        cpu_power_model, fan_rpm, r_total, estimate_noise, estimate_durability,
+        cpu_power_model_batch, fan_rpm_batch, r_total_batch, estimate_noise_batch, estimate_durability_batch,
+    )
+    rng = np.random.default_rng(11)
+    utils = np.concatenate([rng.uniform(0, 160, 2000).round(1), [0.0, 15.0, 80.0, 100.0, 999.9]])
+    cooler = COOLERS[3]
+    for u in utils.tolist():
+        assert fan_rpm(u) == fan_rpm_batch(u)
+        assert estimate_noise(cooler, u) == estimate_noise_batch(cooler["ruido_db"], u)
+        assert estimate_durability(cooler, u) == estimate_durability_batch(cooler["durabilidade_anos"], u)
+    for cpu in CPUS:
+        for rpm in (0, 600, 1500, 2200):
+            assert r_total(cpu, cooler, rpm) == pytest.approx(
+                r_total_batch(cpu_r_cs(cpu), derive_rth_heatsink(cooler), rpm), rel=1e-14)
+        for carga, prof, escala in rng.uniform([10, 0.3, 0.8], [150, 1.3, 1.6], (20, 3)).tolist():
+            assert cpu_power_model(cpu["tdp"], carga, prof, escala) == pytest.approx(
+                cpu_power_model_batch(cpu["tdp"], carga, prof, escala), rel=1e-14)
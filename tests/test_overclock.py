@@ -0,0 +1,50 @@
+# test_overclock.py
+# Bisseção em lote da frequência máxima estável × busca exaustiva numa grade fina.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from motor import steady_state_batch
+from overclock import MOTIVO_FAIXA, MOTIVO_NENHUMA, freq_limits, max_stable_frequency
+
+PONTOS = 4001
+TOL_GHZ = 0.001
+
+@pytest.mark.parametrize("carga, amb, vent_factor, permitir_pl2, temp_limite", [
+    (100, 25.0, 1.0, True, 95.0),
+    (60, 35.0, 0.7, False, 90.0),
+    (140, 15.0, 1.2, True, 90.0),
+    (100, 40.0, 0.6, True, 80.0),
+])
+def test_bisection_matches_brute_force(carga, amb, vent_factor, permitir_pl2, temp_limite):
+    cpu_cols = {k: v[:, None] for k, v in CPUS.arrays().items()}
+    cooler_cols = {k: v[None, :] for k, v in COOLERS.arrays().items()}
+    r = max_stable_frequency(cpu_cols, cooler_cols, carga, 1.0, amb, vent_factor, temp_limite, permitir_pl2,
+                             tol_ghz=TOL_GHZ)
+
+    # todas as frequências da grade, para todos os pares, numa chamada só (eixo extra no fim)
+    f_min, f_max = freq_limits(cpu_cols)
+    grade = f_min[..., None] + (f_max - f_min)[..., None] * np.linspace(0.0, 1.0, PONTOS)
+    res = steady_state_batch({k: v[..., None] for k, v in cpu_cols.items()},
+                             {k: v[..., None] for k, v in cooler_cols.items()},
+                             carga, 1.0, grade / cpu_cols["freq_base"][..., None], amb, vent_factor, permitir_pl2)
+    limite = (cpu_cols["pl2"] if permitir_pl2 else cpu_cols["pl1"])[..., None]
+    ok = (res["temp_steady"] < temp_limite) & (res["potencia_modelo"] <= limite)
+
+    # busca exaustiva: último ponto antes da primeira frequência instável
+    falha = np.argmin(ok, axis=-1)
+    todos_ok, nenhum_ok = ok.all(axis=-1), ~ok[..., 0]
+    exaustiva = np.take_along_axis(grade, np.maximum(falha - 1, 0)[..., None], axis=-1)[..., 0]
+    exaustiva = np.where(todos_ok, f_max, np.where(nenhum_ok, np.nan, exaustiva))
+
+    # perto do limite a temperatura tem degraus minúsculos (utilização arredondada a 0.1 %, RPM inteiro),
+    # então a fronteira pode se deslocar um pouco além de tol_ghz + passo da grade
+    tolerancia = np.broadcast_to(3 * TOL_GHZ + (f_max - f_min) / (PONTOS - 1), ok.shape[:-1])
+    assert np.array_equal(np.isnan(r["freq_max_ghz"]), nenhum_ok)
+    assert np.all(r["motivo"][nenhum_ok] == MOTIVO_NENHUMA)
+    assert np.all(r["motivo"][todos_ok] == MOTIVO_FAIXA)
+    achou = ~nenhum_ok
+    assert np.all(np.abs(r["freq_max_ghz"] - exaustiva)[achou] <= tolerancia[achou])
+    # e a frequência devolvida é de fato estável
+    assert np.all(r["temp_steady"][achou] < temp_limite)
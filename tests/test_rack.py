@@ -0,0 +1,112 @@
+# test_rack.py
+# simulate_rack × um laço socket a socket com simulate(): cadeia de ar entre chassis
+# (recirculação) e dentro do chassis (pré-aquecimento), broadcast por chassis e totais.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from motor import VENT_FACTORS, THROTTLE_TEMP, simulate
+from rack import CFM_M3S, CP_AR, RHO_AR, W_BTU_H, air_rise, simulate_rack
+
+CPU = next(c for c in CPUS if c.get("fabricante") == "AMD")     # AMD: hotspot entra na temperatura
+COOLER = COOLERS[len(COOLERS) // 2]
+PERFIL = "Jogos (típico)"
+VENTS = list(VENT_FACTORS)
+
+def forca_bruta(n, m, por_rack, carga, vent, fluxo, extra, amb, recirculacao, sombreamento, freq_ghz=None):
+    """Rack chassis a chassis, socket a socket, com a temperatura de entrada como ambiente de simulate()."""
+    carga = np.broadcast_to(np.asarray(carga, dtype=float).reshape((n, -1) if np.ndim(carga) == 1 else np.shape(carga)), (n, m))
+    vent = [vent] * n if isinstance(vent, str) else vent
+    fluxo, extra = np.broadcast_to(fluxo, (n,)), np.broadcast_to(extra, (n,))
+    temp, entrada, potencia = np.zeros((n, m)), np.zeros((n, m)), np.zeros((n, m))
+    saida_anterior = None
+    for i in range(n):
+        vazao_kg_s = RHO_AR * float(fluxo[i]) * CFM_M3S
+        if i % por_rack == 0:
+            entrada_chassis = amb
+        else:
+            entrada_chassis = amb + recirculacao * (saida_anterior - amb)
+        acumulado = 0.0
+        for j in range(m):
+            entrada[i, j] = entrada_chassis + sombreamento * acumulado / (vazao_kg_s * CP_AR)
+            r = simulate(CPU, COOLER, {"carga_pct": float(carga[i, j]), "perfil": PERFIL, "freq_ghz": freq_ghz,
+                                       "amb": entrada[i, j], "vent": vent[i], "permitir_pl2": True})
+            temp[i, j], potencia[i, j] = r["temp_steady"], r["potencia_aplicada"]
+            acumulado += r["potencia_aplicada"]
+        saida_anterior = entrada_chassis + (acumulado + float(extra[i])) / (vazao_kg_s * CP_AR)
+    return temp, entrada, potencia
+
+def confere(r, esperado):
+    temp, entrada, potencia = esperado
+    np.testing.assert_allclose(r["potencia_aplicada"], potencia, rtol=1e-12)
+    np.testing.assert_allclose(r["entrada"], entrada, rtol=1e-12)
+    np.testing.assert_allclose(r["temp_steady"], temp, rtol=1e-12)
+    assert np.array_equal(r["throttle"], temp >= THROTTLE_TEMP)
+
+@pytest.mark.parametrize("por_rack", [None, 1, 3, 4])
+@pytest.mark.parametrize("recirculacao, sombreamento", [(0.0, 0.0), (0.35, 1.0), (1.0, 0.4)])
+def test_matches_brute_force(por_rack, recirculacao, sombreamento):
+    n, m = 7, 3
+    rng = np.random.default_rng(5)
+    vent_nomes = [VENTS[k] for k in rng.integers(len(VENTS), size=n)]
+    vent = np.array([VENT_FACTORS[v] for v in vent_nomes])
+    fluxo = rng.uniform(40, 160, n)
+    extra = rng.uniform(0, 150, n)
+    carga = rng.uniform(20, 140, (n, m))
+    r = simulate_rack(CPU, COOLER, n, m, por_rack, carga, PERFIL, amb=24.0, vent_factor=vent, fluxo_cfm=fluxo,
+                      recirculacao=recirculacao, sombreamento=sombreamento, calor_extra_w=extra)
+    confere(r, forca_bruta(n, m, por_rack or n, carga, vent_nomes, fluxo, extra, 24.0, recirculacao, sombreamento))
+
+def test_chain_recurrence():
+    # dentro de um rack, cada chassis recebe r·(saída do de baixo − amb) a mais na entrada
+    r = simulate_rack(CPU, COOLER, 6, 2, chassis_por_rack=3, amb=20.0, fluxo_cfm=80.0, recirculacao=0.5,
+                      sombreamento=1.0, calor_extra_w=60.0)
+    ch = r["chassis"]
+    assert np.array_equal(ch["rack"], [0, 0, 0, 1, 1, 1]) and np.array_equal(ch["posicao"], [0, 1, 2, 0, 1, 2])
+    for i in range(6):
+        esperado = 20.0 if ch["posicao"][i] == 0 else 20.0 + 0.5 * (ch["saida"][i - 1] - 20.0)
+        assert ch["entrada"][i] == pytest.approx(esperado, rel=1e-12)
+        assert ch["saida"][i] - ch["entrada"][i] == pytest.approx(float(air_rise(ch["calor_w"][i], 80.0)), rel=1e-12)
+    # dentro do chassis: o segundo socket respira o calor do primeiro
+    assert np.allclose(r["entrada"][:, 1] - r["entrada"][:, 0], air_rise(r["potencia_aplicada"][:, 0], 80.0))
+    assert np.allclose(r["entrada"][:, 0], ch["entrada"])
+    # sem recirculação nem sombreamento todos respiram o corredor frio
+    r0 = simulate_rack(CPU, COOLER, 6, 2, chassis_por_rack=3, amb=20.0, sombreamento=0.0, calor_extra_w=60.0)
+    assert np.all(r0["entrada"] == 20.0)
+
+def test_per_chassis_broadcasting():
+    n, m = 4, 2
+    vent_nomes = ["Bem ventilado", "Pouco ventilado", "Moderado", "Pouco ventilado"]
+    vent = np.array([VENT_FACTORS[v] for v in vent_nomes])
+    fluxo = np.array([60.0, 90.0, 120.0, 150.0])
+    r = simulate_rack(CPU, COOLER, n, m, carga_pct=110, perfil=PERFIL, vent_factor=vent, fluxo_cfm=fluxo,
+                      recirculacao=0.3, sombreamento=0.7)
+    confere(r, forca_bruta(n, m, n, 110, vent_nomes, fluxo, 0.0, 22.0, 0.3, 0.7))
+    # mesma carga: chassis com a mesma ventilação têm a mesma utilização
+    assert r["util_pct"][1, 0] == r["util_pct"][3, 1]
+    assert r["util_pct"][0, 0] < r["util_pct"][2, 0] < r["util_pct"][1, 0]
+
+@pytest.mark.parametrize("forma", ["escalar", "por_chassis", "por_socket"])
+def test_load_shapes(forma):
+    n, m = 5, 4
+    carga = {"escalar": 95.0, "por_chassis": np.linspace(30, 150, n), "por_socket": np.linspace(10, 150, n * m).reshape(n, m)}[forma]
+    r = simulate_rack(CPU, COOLER, n, m, carga_pct=carga, perfil=PERFIL, freq_ghz=4.0, recirculacao=0.2, sombreamento=0.5)
+    assert r["temp_steady"].shape == r["entrada"].shape == r["potencia_aplicada"].shape == (n, m)
+    confere(r, forca_bruta(n, m, n, carga, "Bem ventilado", 100.0, 0.0, 22.0, 0.2, 0.5, freq_ghz=4.0))
+    if forma == "por_chassis":
+        assert np.all(r["potencia_aplicada"] == r["potencia_aplicada"][:, :1])
+
+def test_totals():
+    n, m, por_rack = 7, 2, 3
+    extra = np.arange(n) * 10.0
+    r = simulate_rack(CPU, COOLER, n, m, por_rack, carga_pct=np.linspace(40, 150, n), amb=30.0, fluxo_cfm=50.0,
+                      recirculacao=0.8, calor_extra_w=extra)
+    t, ch = r["totais"], r["chassis"]
+    assert t["sockets"] == n * m and t["racks"] == 3
+    assert t["calor_w"] == pytest.approx(r["potencia_aplicada"].sum() + extra.sum())
+    assert np.allclose(ch["calor_w"], r["potencia_aplicada"].sum(axis=1) + extra)
+    assert t["calor_btu_h"] == pytest.approx(t["calor_w"] * W_BTU_H)
+    assert t["temp_max"] == r["temp_steady"].max() and t["temp_media"] == pytest.approx(r["temp_steady"].mean())
+    assert t["throttles"] == int(r["throttle"].sum()) == int(ch["throttles"].sum())
+    assert np.array_equal(ch["temp_max"], r["temp_steady"].max(axis=1))
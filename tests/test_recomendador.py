@@ -0,0 +1,52 @@
+# test_recomendador.py
+# Fronteira e camadas de Pareto × verificação de dominância par a par.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from recomendador import BLOCO_PARETO, pareto_front, pareto_ranks, recommend
+
+def dominado(F, i, candidatos):
+    """F[i] é dominado por algum F[j] (j em candidatos): nenhum objetivo pior e pelo menos um melhor."""
+    return any(np.all(F[j] <= F[i]) and np.any(F[j] < F[i]) for j in candidatos if j != i)
+
+def fronteira_exaustiva(F):
+    return np.array([not dominado(F, i, range(len(F))) for i in range(len(F))], dtype=bool)
+
+@pytest.mark.parametrize("n, m, niveis, semente", [
+    (1, 3, None, 0),
+    (50, 2, None, 1),
+    (300, 3, None, 2),
+    (300, 3, 6, 3),                 # muitos empates e pontos repetidos
+    (4 * BLOCO_PARETO + 7, 4, None, 4),
+    (500, 2, 40, 5),
+])
+def test_pareto_front_matches_brute_force(n, m, niveis, semente):
+    rng = np.random.default_rng(semente)
+    F = rng.integers(0, niveis, (n, m)).astype(float) if niveis else rng.normal(size=(n, m))
+    assert np.array_equal(pareto_front(F), fronteira_exaustiva(F))
+
+def test_pareto_front_on_anticorrelated_objectives():
+    # todos os pontos numa curva decrescente: ninguém domina ninguém (fronteira maior que BLOCO_PARETO)
+    x = np.linspace(0.0, 1.0, 3 * BLOCO_PARETO)
+    assert pareto_front(np.column_stack([x, 1.0 - x])).all()
+
+def test_pareto_ranks_match_brute_force():
+    rng = np.random.default_rng(7)
+    F = rng.integers(0, 8, (200, 3)).astype(float)
+    ranks = pareto_ranks(F)
+    restantes, camada = list(range(len(F))), 0
+    while restantes:
+        frente = [i for i in restantes if not dominado(F, i, restantes)]
+        assert set(np.flatnonzero(ranks == camada)) == set(frente)
+        restantes = [i for i in restantes if i not in frente]
+        camada += 1
+    assert pareto_ranks(F, max_frentes=1).tolist() == np.where(ranks == 0, 0, -1).tolist()
+
+def test_recommend_front_is_layer_zero():
+    rec = recommend(CPUS[0], COOLERS)
+    res = rec["res"]
+    F = np.column_stack([res["temp_steady"], res["ruido_db"], -res["durabilidade_anos"]])
+    assert np.array_equal(rec["pareto"], fronteira_exaustiva(F))
+    assert np.array_equal(rec["pareto"], rec["camadas"] == 0)
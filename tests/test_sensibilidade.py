@@ -0,0 +1,105 @@
+# test_sensibilidade.py
+# Derivadas analíticas × diferenças centrais, uma chamada de steady_state_batch por
+# análise e a ordem das faixas do gráfico tornado.
+
+import numpy as np
+import pytest
+
+import sensibilidade
+from catalogo import CPUS, COOLERS
+from motor import DEFAULT_PARAMS, WORKLOAD_PROFILES, cpu_arrays, cooler_arrays, simulate, steady_state_batch
+from sensibilidade import ENTRADAS, FAIXAS, temperature_gradient, sensitivity
+
+N = 4000
+PASSOS = {"carga_pct": 5.0, "profile": 0.05, "freq_scale": 0.05, "amb": 1.0, "vent_factor": 0.05}
+
+def regime(res, cpu_cols, pl2):
+    """Trechos do modelo: potência livre, RPM na rampa e redução dinâmica saturada."""
+    livre = res["potencia_modelo"] < np.where(pl2, cpu_cols["pl2"], cpu_cols["pl1"])
+    rampa = (res["util_pct"] > 15) & (res["util_pct"] < 100)
+    return livre, rampa, res["dyn_pct"] >= 0.20
+
+def test_gradient_matches_central_differences():
+    rng = np.random.default_rng(7)
+    ic, ik = rng.integers(len(CPUS), size=N), rng.integers(len(COOLERS), size=N)
+    cpu_cols = {k: v[ic] for k, v in cpu_arrays(CPUS).items()}
+    cooler_cols = {k: v[ik] for k, v in cooler_arrays(COOLERS).items()}
+    x = {"carga_pct": rng.uniform(10, 150, N), "profile": rng.uniform(0.4, 1.2, N), "freq_scale": rng.uniform(0.8, 1.3, N),
+         "amb": rng.uniform(10, 45, N), "vent_factor": rng.uniform(0.6, 1.1, N)}
+    pl2 = rng.random(N) < 0.5
+
+    def rodar(**troca):
+        y = dict(x, **troca)
+        return steady_state_batch(cpu_cols, cooler_cols, y["carga_pct"], y["profile"], y["freq_scale"],
+                                  y["amb"], y["vent_factor"], pl2)
+
+    base = rodar()
+    grad = temperature_gradient(cpu_cols, cooler_cols, x["carga_pct"], x["profile"], x["freq_scale"],
+                                x["amb"], x["vent_factor"], pl2)
+    assert np.array_equal(grad["temp_steady"], base["temp_steady"])
+
+    # só cenários com potência livre, RPM na rampa e sem trocar de trecho dentro de ±h
+    livre, rampa, saturado = regime(base, cpu_cols, pl2)
+    ok = livre & rampa
+    vizinhos = {}
+    for k, h in PASSOS.items():
+        vizinhos[k] = (rodar(**{k: x[k] - h}), rodar(**{k: x[k] + h}))
+        for r in vizinhos[k]:
+            for a, b in zip(regime(r, cpu_cols, pl2), (livre, rampa, saturado)):
+                ok &= a == b
+    assert ok.sum() > N // 4
+
+    # degraus: utilização em 0.1 % (≈ 1.9 RPM) e RPM inteiro (1 RPM) → ±2 RPM por avaliação
+    p = base["potencia_aplicada"]
+    dr_drpm = 0.8 * (base["r_total"] - cpu_cols["r_cs"]) / base["rpm"]
+    for k, h in PASSOS.items():
+        menos, mais = vizinhos[k]
+        numerica = (mais["temp_steady"] - menos["temp_steady"]) / (2 * h)
+        degraus = 2.0 * p * dr_drpm / h
+        erro = np.abs(numerica - grad[k]) - degraus - 0.02 * np.abs(grad[k])
+        assert np.all(erro[ok] <= 1e-9), (k, erro[ok].max())
+
+def test_gradient_is_zero_when_power_is_clamped():
+    cpu_cols = cpu_arrays([max(CPUS, key=lambda c: c["tdp"])])
+    cooler_cols = cooler_arrays([COOLERS[0]])
+    res = steady_state_batch(cpu_cols, cooler_cols, 150.0, 1.2, 1.3, 25.0, 1.0, False)
+    assert res["potencia_aplicada"][0] < res["potencia_modelo"][0]
+    grad = temperature_gradient(cpu_cols, cooler_cols, 150.0, 1.2, 1.3, 25.0, 1.0, False)
+    for k in ("carga_pct", "profile", "freq_scale"):
+        assert grad[k][0] == 0.0
+
+def test_sensitivity_uses_a_single_batch_call(monkeypatch):
+    chamadas = []
+
+    def contando(*args, **kwargs):
+        res = steady_state_batch(*args, **kwargs)
+        chamadas.append(res["temp_steady"].shape)
+        return res
+
+    monkeypatch.setattr(sensibilidade, "steady_state_batch", contando)
+    r = sensitivity(CPUS[0], COOLERS[0], COOLERS)
+    assert chamadas == [(r["n_cenarios"],)]
+
+@pytest.mark.parametrize("i_cpu", [0, len(CPUS) // 2, len(CPUS) - 1])
+def test_tornado_rows(i_cpu):
+    cpu, cooler = CPUS[i_cpu], COOLERS[len(COOLERS) // 3]
+    params = dict(DEFAULT_PARAMS, carga_pct=90, amb=28.0)
+    r = sensitivity(cpu, cooler, COOLERS, params)
+    linhas = r["faixas"]
+    assert sorted(l["entrada"] for l in linhas) == sorted(ENTRADAS)
+    amplitudes = [l["amplitude"] for l in linhas]
+    assert amplitudes == sorted(amplitudes, reverse=True)
+    assert r["temp_base"] == pytest.approx(simulate(cpu, cooler, params)["temp_steady"], abs=1e-9)
+
+    por_entrada = {l["entrada"]: l for l in linhas}
+    for l in linhas:
+        assert l["amplitude"] == pytest.approx(abs(l["temp_alto"] - l["temp_baixo"]))
+    # ambiente entra linear: ±FAIXAS["amb"] dá exatamente essa variação
+    assert por_entrada["amb"]["temp_alto"] - por_entrada["amb"]["temp_baixo"] == pytest.approx(2 * FAIXAS["amb"])
+    # entradas discretas: baixo/alto são a opção mais fria e a mais quente
+    temps = {c["modelo"]: simulate(cpu, c, params)["temp_steady"] for c in COOLERS}
+    assert por_entrada["cooler"]["temp_baixo"] == pytest.approx(min(temps.values()))
+    assert por_entrada["cooler"]["temp_alto"] == pytest.approx(max(temps.values()))
+    temps = {nome: simulate(cpu, cooler, dict(params, perfil=nome))["temp_steady"] for nome in WORKLOAD_PROFILES}
+    assert por_entrada["profile"]["temp_alto"] == pytest.approx(temps[por_entrada["profile"]["alto"]])
+    assert por_entrada["profile"]["temp_alto"] == pytest.approx(max(temps.values()))
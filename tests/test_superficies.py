@@ -0,0 +1,95 @@
+# test_superficies.py
+# Interpolação da grade × steady_state_batch (nos nós e fora deles), bordas presas e o
+# cache LRU por bytes com a versão do modelo na chave.
+
+import numpy as np
+import pytest
+
+import superficies
+from catalogo import CPUS, COOLERS
+from motor import WORKLOAD_PROFILES, cpu_arrays, cooler_arrays, steady_state_batch
+from superficies import EIXOS, SurfaceCache, build_surface, interpolate
+
+PERFIL = "Bench sustentado (Cinebench)"
+
+def exata(cpu, cooler, perfil, freq_scale, carga_pct, amb, vent_factor):
+    return steady_state_batch(cpu_arrays([cpu]), cooler_arrays([cooler]), carga_pct, WORKLOAD_PROFILES[perfil],
+                              freq_scale, amb, vent_factor, True)["temp_steady"]
+
+@pytest.fixture(scope="module")
+def sup():
+    return build_surface(CPUS[0], COOLERS[0], PERFIL)
+
+def test_exact_at_grid_nodes(sup):
+    e = sup["eixos"]
+    nos = np.meshgrid(*(e[k] for k in EIXOS), indexing="ij")
+    assert np.array_equal(interpolate(sup, *nos), sup["temp"])
+    # a grade guarda float32: igual ao modelo até a precisão do float32
+    assert np.allclose(sup["temp"], exata(CPUS[0], COOLERS[0], PERFIL, *nos), rtol=1e-6, atol=0)
+    assert not sup["temp"].flags.writeable
+
+@pytest.mark.parametrize("perfil", list(WORKLOAD_PROFILES))
+def test_error_bound_off_grid(perfil):
+    rng = np.random.default_rng(3)
+    erros, quinas = [], []
+    for i, cpu in enumerate(CPUS):
+        cooler = COOLERS[(3 * i) % len(COOLERS)]
+        s = build_surface(cpu, cooler, perfil)
+        x = [rng.uniform(s["eixos"][k][0], s["eixos"][k][-1], 500) for k in EIXOS]
+        cpu_cols = cpu_arrays([cpu])
+        res = steady_state_batch(cpu_cols, cooler_arrays([cooler]), x[1], WORKLOAD_PROFILES[perfil],
+                                 x[0], x[2], x[3], True)
+        erros.append(np.abs(interpolate(s, *x) - res["temp_steady"]))
+        # potência perto do PL2: a célula pode conter a quina do limite, que a interpolação arredonda
+        quinas.append(np.abs(res["potencia_modelo"] / cpu_cols["pl2"] - 1.0) < 0.02)
+    erros, quinas = np.concatenate(erros), np.concatenate(quinas)
+    # décimos de grau no caso típico
+    assert np.percentile(erros, 99) < 0.35
+    assert erros[~quinas].max() < 0.75
+    assert erros.max() < 2.0
+
+def test_clamped_outside_axes(sup):
+    e = sup["eixos"]
+    meio = {k: float(e[k][len(e[k]) // 2]) for k in EIXOS}
+    for k in EIXOS:
+        for fora, borda in ((e[k][0] - 7.0, e[k][0]), (e[k][-1] + 7.0, e[k][-1])):
+            a = interpolate(sup, *(fora if j == k else meio[j] for j in EIXOS))
+            b = interpolate(sup, *(borda if j == k else meio[j] for j in EIXOS))
+            assert a == b
+
+def test_lru_eviction_by_bytes():
+    tamanho = build_surface(CPUS[0], COOLERS[0])["temp"].nbytes
+    cache = SurfaceCache(limite_mb=2.5 * tamanho / 1e6)      # cabem duas grades
+    pares = [(CPUS[i], COOLERS[i]) for i in range(3)]
+    a = cache.get(*pares[0], versao="v1")
+    cache.get(*pares[1], versao="v1")
+    assert cache.get(*pares[0], versao="v1") is a              # acerto: pares[0] vira o mais recente
+    cache.get(*pares[2], versao="v1")                          # despeja pares[1]
+    assert cache.stats() == {"grades": 2, "bytes": 2 * tamanho, "limite_bytes": cache.limite_bytes,
+                             "acertos": 1, "faltas": 3, "despejos": 1}
+    assert cache.get(*pares[0], versao="v1") is a
+    cache.get(*pares[1], versao="v1")
+    assert cache.stats()["faltas"] == 4 and cache.stats()["despejos"] == 2
+    cache.clear()
+    assert cache.stats() == {"grades": 0, "bytes": 0, "limite_bytes": cache.limite_bytes,
+                             "acertos": 0, "faltas": 0, "despejos": 0}
+
+def test_rebuilt_when_model_version_changes(monkeypatch):
+    versoes = iter(["v1", "v1", "v2"])
+    monkeypatch.setattr(superficies, "model_version", lambda: next(versoes))
+    cache = SurfaceCache()
+    a = cache.get(CPUS[0], COOLERS[0])
+    assert cache.get(CPUS[0], COOLERS[0]) is a
+    b = cache.get(CPUS[0], COOLERS[0])
+    assert b is not a and np.array_equal(a["temp"], b["temp"])
+    # grades da versão antiga saem do cache
+    assert cache.stats()["grades"] == 1 and cache.stats()["faltas"] == 2
+
+def test_version_from_caller_skips_model_version(monkeypatch):
+    def proibido():
+        raise AssertionError("model_version() não deveria ser chamado")
+    monkeypatch.setattr(superficies, "model_version", proibido)
+    cache = SurfaceCache()
+    a = cache.get(CPUS[0], COOLERS[0], versao="v1")
+    assert cache.get(CPUS[0], COOLERS[0], versao="v1") is a
+    assert cache.get(CPUS[0], COOLERS[0], versao="v2") is not a
@@ -0,0 +1,60 @@
+# test_transiente.py
+# Solução fechada do modo transiente × integração de Euler da mesma rede RC.
+
+import numpy as np
+import pytest
+
+from catalogo import CPUS, COOLERS
+from motor import WORKLOAD_PROFILES, cpu_arrays, cooler_arrays, cpu_power_model_batch, cooling_batch, r_total_batch
+from transiente import C_DIE, C_IHS, C_DISSIPADOR_AIR, C_DISSIPADOR_AIO, FRAC_R_JC, simulate_transient
+
+CARGA = [(40.0, 120, "AVX/Prime (pesado)"), (25.0, 20, 0.5), (35.0, 100, "Bench sustentado (Cinebench)")]
+
+def euler(cpus, coolers, workload, amb, vent_factor, permitir_pl2, passo, amostra):
+    """Integra die → IHS → dissipador → ambiente e a média móvel PL1/PL2 com Euler explícito."""
+    c, k = cpu_arrays(cpus), cooler_arrays(coolers)
+    r1, r2 = FRAC_R_JC * c["r_cs"], (1.0 - FRAC_R_JC) * c["r_cs"]
+    c3 = np.where(k["aio"], C_DISSIPADOR_AIO, C_DISSIPADOR_AIR)
+    x = np.repeat(np.full(len(cpus), amb)[:, None], 3, axis=1)
+    media = np.zeros(len(cpus))
+    temps, i = [], 0
+    for duracao, carga, perfil in workload:
+        prof = WORKLOAD_PROFILES[perfil] if isinstance(perfil, str) else perfil
+        demanda = cpu_power_model_batch(c["tdp"], carga, prof)
+        for _ in range(int(round(duracao / passo))):
+            if i % amostra == 0:
+                temps.append(x[:, 0] + c["hotspot"])
+            if permitir_pl2:
+                P = np.where(media < c["pl1"], np.minimum(demanda, c["pl2"]), np.minimum(demanda, c["pl1"]))
+            else:
+                P = np.minimum(demanda, c["pl1"])
+            _, _, rpm = cooling_batch(P, k, vent_factor)
+            r3 = r_total_batch(0.0, k["r_hs"], rpm)
+            q1, q2, q3 = (x[:, 0] - x[:, 1]) / r1, (x[:, 1] - x[:, 2]) / r2, (x[:, 2] - amb) / r3
+            x = x + passo * np.stack([(P - q1) / C_DIE, (q1 - q2) / C_IHS, (q2 - q3) / c3], axis=1)
+            media = media + passo * (P - media) / c["tau"]
+            i += 1
+    return np.array(temps).T, x, media
+
+@pytest.mark.parametrize("permitir_pl2", [True, False])
+def test_transient_matches_euler(permitir_pl2):
+    sel = np.linspace(0, len(CPUS) - 1, 6).astype(int)
+    cpus = [CPUS[int(i)] for i in sel]
+    coolers = [COOLERS[int(i)] for i in np.linspace(0, len(COOLERS) - 1, 6).astype(int)]
+    passo, amostra = 2e-3, 250
+    temp, x, media = euler(cpus, coolers, CARGA, 27.0, 0.9, permitir_pl2, passo, amostra)
+    res = simulate_transient(cpus, coolers, CARGA, amb=27.0, vent_factor=0.9, permitir_pl2=permitir_pl2,
+                             dt=passo * amostra, dtype=np.float64)
+    assert res["temp"].shape == temp.shape
+    np.testing.assert_allclose(res["temp"], temp, atol=0.1)
+    np.testing.assert_allclose(res["estado_final"], x, atol=0.05)
+    np.testing.assert_allclose(res["media_final"], media, rtol=1e-3)
+
+def test_transient_reaches_steady_state():
+    # carga longa e constante: o fim da curva é o regime permanente de steady_state_batch
+    from motor import steady_state_batch
+    cpus, coolers = [CPUS[0]], [COOLERS[len(COOLERS) // 2]]
+    res = simulate_transient(cpus, coolers, [(3000.0, 90, 1.0)], amb=22.0, permitir_pl2=False, dt=1.0,
+                             dtype=np.float64)
+    ss = steady_state_batch(cpu_arrays(cpus), cooler_arrays(coolers), 90, 1.0, 1.0, 22.0, 1.0, False)
+    assert res["temp"][0, -1] == pytest.approx(ss["temp_steady"][0], abs=0.01)
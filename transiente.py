@@ -0,0 +1,177 @@
+# transiente.py
+# Modo transiente — PT-BR
+# Rede RC concentrada die → IHS → dissipador → ambiente, com orçamento de
+# potência por média móvel (PL1/PL2/TAU, no estilo Intel).
+#
+# A potência aplicada dentro de cada segmento de carga é constante por partes
+# (burst em PL2 até a média móvel atingir PL1, depois PL1), então tanto o
+# orçamento quanto a resposta térmica têm solução fechada. Não há integração
+# passo a passo: a grade de tempo só define onde as curvas são amostradas.
+
+import numpy as np
+
+from desempenho import counted
+from motor import (
+    WORKLOAD_PROFILES, THROTTLE_TEMP,
+    cpu_arrays, cooler_arrays, cpu_power_model_batch, cooling_batch, r_total_batch,
+)
+
+# ---------------------------
+# PARÂMETROS DA REDE RC (heurísticos)
+# ---------------------------
+C_DIE = 2.0                 # capacitância térmica do die (J/K)
+C_IHS = 15.0                # capacitância do IHS (J/K)
+C_DISSIPADOR_AIR = 400.0    # torre de alumínio/cobre (J/K)
+C_DISSIPADOR_AIO = 1200.0   # bloco + líquido + radiador (J/K)
+FRAC_R_JC = 0.6             # fração de R_cs entre die → IHS (o resto é a pasta IHS → cooler)
+BLOCO_AMOSTRAS = 4096       # amostras de tempo avaliadas por bloco (limita a memória temporária)
+
+# ---------------------------
+# FUNÇÕES
+# ---------------------------
+def _modos(r1, r2, r3, cap):
+    """
+    Decomposição modal da cadeia de 3 nós (arrays com shape (n,)).
+    - G é a matriz de condutâncias (simétrica); com y = C^{-1/2}·u o sistema
+      C·dx/dt = -G·(x - x_ss) vira du/dt = -M·u com M simétrica, então eigh
+      dá autovalores reais (taxas de decaimento) para todos os cenários de uma vez.
+    - retorna (taxas (n,3), V (n,3,3), Vinv (n,3,3)) com x - x_ss = V·exp(-taxas·t)·Vinv·(x0 - x_ss).
+    """
+    n = r1.shape[0]
+    g1, g2, g3 = 1.0 / r1, 1.0 / r2, 1.0 / r3
+    G = np.zeros((n, 3, 3))
+    G[:, 0, 0] = g1
+    G[:, 0, 1] = G[:, 1, 0] = -g1
+    G[:, 1, 1] = g1 + g2
+    G[:, 1, 2] = G[:, 2, 1] = -g2
+    G[:, 2, 2] = g2 + g3
+    s = 1.0 / np.sqrt(cap)
+    M = s[:, :, None] * G * s[:, None, :]
+    taxas, U = np.linalg.eigh(M)
+    V = s[:, :, None] * U
+    Vinv = np.swapaxes(U, 1, 2) / s[:, None, :]
+    return taxas, V, Vinv
+
+def _trecho(P, rede, cooler_cols, vent_factor, amb):
+    """Regime de potência constante P (n,): estado estacionário e modos com o RPM correspondente."""
+    _, _, rpm = cooling_batch(P, cooler_cols, vent_factor)
+    r3 = r_total_batch(0.0, cooler_cols["r_hs"], rpm)
+    taxas, V, Vinv = _modos(rede["r1"], rede["r2"], r3, rede["cap"])
+    x_ss = np.stack([amb + P * (rede["r1"] + rede["r2"] + r3), amb + P * (rede["r2"] + r3), amb + P * r3], axis=1)
+    return {"P": P, "taxas": taxas, "V": V, "Vinv": Vinv, "x_ss": x_ss}
+
+def _propagar(tr, x0, t):
+    """Estado (n,3) após t segundos (n,) no trecho tr, partindo de x0."""
+    z = np.einsum("nij,nj->ni", tr["Vinv"], x0 - tr["x_ss"]) * np.exp(-tr["taxas"] * t[:, None])
+    return tr["x_ss"] + np.einsum("nij,nj->ni", tr["V"], z)
+
+def _fator_local(tr, dt):
+    """exp(-taxa·j·dt) para j = 0..BLOCO_AMOSTRAS-1, shape (n,3,B); reaproveitado em todos os blocos do trecho."""
+    return np.exp(-tr["taxas"][:, :, None] * (np.arange(BLOCO_AMOSTRAS) * dt))
+
+def _temp_die(tr, x0, tau0, local, m):
+    """
+    Temperatura do die (n,m) nos instantes tau0 + j·dt (tau0 com shape (n,)) do trecho tr.
+    exp(-taxa·(tau0 + j·dt)) = exp(-taxa·tau0)·local[j], então o bloco custa só
+    multiplicações; modos já extintos (o do die some em frações de segundo) são pulados.
+    """
+    z = np.einsum("nij,nj->ni", tr["Vinv"], x0 - tr["x_ss"]) * tr["V"][:, 0, :]
+    with np.errstate(over="ignore", invalid="ignore"):
+        coef = z * np.exp(-tr["taxas"] * tau0[:, None])
+        temp = np.repeat(tr["x_ss"][:, 0:1], m, axis=1)
+        for j in range(3):
+            c = coef[:, j:j + 1]
+            if not np.all(np.abs(c) < 1e-9):
+                temp += c * local[:, j, :m]
+    return temp
+
+def workload_total(workload):
+    return float(sum(seg[0] for seg in workload))
+
+@counted
+def simulate_transient(cpus, coolers, workload, amb=25.0, vent_factor=1.0, freq_scale=1.0,
+                       permitir_pl2=True, dt=0.01, media_inicial=0.0, dtype=np.float32):
+    """
+    Simulação no tempo para pares CPU/cooler (listas de mesmo tamanho, ou uma delas com 1 item).
+    - workload: lista de segmentos (duracao_s, carga_pct, perfil); perfil é um nome de
+      WORKLOAD_PROFILES ou o próprio fator.
+    - orçamento de potência: média móvel exponencial com constante TAU; enquanto a média
+      fica abaixo de PL1 a potência pode ir até PL2, depois é limitada a PL1.
+    - dt: resolução das curvas de saída (s). O resultado é exato em qualquer dt.
+    - retorna {"t", "temp", "potencia", "temp_max", "tempo_throttle_s", "estado_final", "media_final"};
+      "temp"/"potencia" têm shape (n_pares, n_amostras).
+    """
+    n = max(len(cpus), len(coolers))
+    cpu_cols = {k: np.broadcast_to(v, (n,)) for k, v in cpu_arrays(cpus).items()}
+    cooler_cols = {k: np.broadcast_to(v, (n,)) for k, v in cooler_arrays(coolers).items()}
+    amb = np.broadcast_to(np.asarray(amb, dtype=float), (n,))
+
+    rede = {
+        "r1": FRAC_R_JC * cpu_cols["r_cs"],
+        "r2": (1.0 - FRAC_R_JC) * cpu_cols["r_cs"],
+        "cap": np.stack([np.full(n, C_DIE), np.full(n, C_IHS),
+                         np.where(cooler_cols["aio"], C_DISSIPADOR_AIO, C_DISSIPADOR_AIR)], axis=1),
+    }
+    pl1, pl2, tau_pl = cpu_cols["pl1"], cpu_cols["pl2"], cpu_cols["tau"]
+
+    t = np.arange(0.0, workload_total(workload), dt)
+    temp = np.empty((n, t.size), dtype=dtype)
+    potencia = np.empty((n, t.size), dtype=dtype)
+
+    x = np.repeat(amb[:, None], 3, axis=1)      # começa em equilíbrio com o ambiente
+    media = np.full(n, float(media_inicial))
+    inicio = 0.0
+    for duracao, carga_pct, perfil in workload:
+        prof = WORKLOAD_PROFILES.get(perfil, 1.0) if isinstance(perfil, str) else float(perfil)
+        demanda = cpu_power_model_batch(cpu_cols["tdp"], carga_pct, prof, freq_scale)
+
+        # orçamento PL1/PL2: burst em P1 por t_estrela segundos, depois P2
+        if permitir_pl2:
+            P1 = np.minimum(demanda, pl2)
+            excede = P1 > pl1
+            with np.errstate(divide="ignore", invalid="ignore"):
+                razao = np.maximum(P1 - media, P1 - pl1) / (P1 - pl1)
+                t_estrela = np.where(excede, tau_pl * np.log(razao), np.inf)
+            P2 = np.where(excede, pl1, P1)
+        else:
+            P1 = P2 = np.minimum(demanda, pl1)
+            t_estrela = np.full(n, np.inf)
+
+        tr1 = _trecho(P1, rede, cooler_cols, vent_factor, amb)
+        troca = t_estrela < duracao
+        tr2 = _trecho(P2, rede, cooler_cols, vent_factor, amb) if troca.any() else tr1
+        x_troca = _propagar(tr1, x, np.minimum(t_estrela, duracao)) if troca.any() else x
+
+        i0, i1 = np.searchsorted(t, [inicio, inicio + duracao])
+        local1 = _fator_local(tr1, dt)
+        local2 = _fator_local(tr2, dt) if troca.any() else local1
+        for b0 in range(i0, i1, BLOCO_AMOSTRAS):
+            b1 = min(b0 + BLOCO_AMOSTRAS, i1)
+            m = b1 - b0
+            tau0 = np.full(n, t[b0] - inicio)
+            no_burst = (t[b0:b1] - inicio)[None, :] < t_estrela[:, None]
+            if not troca.any() or no_burst.all():
+                bloco = _temp_die(tr1, x, tau0, local1, m)
+            elif not no_burst.any():
+                bloco = _temp_die(tr2, x_troca, tau0 - t_estrela, local2, m)
+            else:
+                bloco = np.where(no_burst, _temp_die(tr1, x, tau0, local1, m),
+                                 _temp_die(tr2, x_troca, tau0 - t_estrela, local2, m))
+            temp[:, b0:b1] = bloco + cpu_cols["hotspot"][:, None]
+            potencia[:, b0:b1] = np.where(no_burst, P1[:, None], P2[:, None])
+
+        # estado e média móvel no fim do segmento
+        x = np.where(troca[:, None], _propagar(tr2, x_troca, np.maximum(duracao - t_estrela, 0.0)),
+                     _propagar(tr1, x, np.full(n, float(duracao))))
+        media = np.where(troca, pl1, P1 + (media - P1) * np.exp(-duracao / tau_pl))
+        inicio += duracao
+
+    return {
+        "t": t,
+        "temp": temp,
+        "potencia": potencia,
+        "temp_max": temp.max(axis=1) if t.size else np.full(n, np.nan),
+        "tempo_throttle_s": (temp >= THROTTLE_TEMP).sum(axis=1) * dt,
+        "estado_final": x,
+        "media_final": media,
+    }